@@ -104,6 +104,13 @@ class MessageManager(models.Manager):
             "modified_by",
         )
 
+    def get_expired_entries(self) -> QuerySet:
+        """Return the messages deleted by both the sender and the recipient."""
+        return self.filter(
+            is_deleted_from_sender=True,
+            is_deleted_from_recipient=True,
+        )
+
     def get_by_interlocutor(
         self,
         *,
@@ -121,6 +121,18 @@ def test_message_manager_mark_read(
     ).count() == 0
 
 
+def test_message_manager_get_expired_entries(messages: QuerySet):
+    """Should return the messages deleted by both sides."""
+    first, second = messages[0], messages[1]
+    Message.objects.filter(pk=first.pk).update(
+        is_deleted_from_sender=True,
+        is_deleted_from_recipient=True,
+    )
+    Message.objects.filter(pk=second.pk).update(
+        is_deleted_from_recipient=True)
+    assert list(Message.objects.get_expired_entries()) == [first]
+
+
 def test_message_manager_get_by_interlocutor(
     admin: User,
     messages: QuerySet,
@@ -1,16 +1,52 @@
 """The d8b admin module."""
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 import adminactions.actions as actions
 from django.conf import settings
-from django.contrib import admin
+from django.contrib import admin, messages
 from django.contrib.admin import site
+from django.contrib.admin.options import IS_POPUP_VAR
+from django.db.models.query import QuerySet
 from django.http.request import HttpRequest
 from django_otp.admin import OTPAdminSite
 
+from d8b.settings import get_settings
+from d8b.streaming import StreamingJSONResponse
+
 if not settings.TESTS:
     admin.site.__class__ = OTPAdminSite
 
+
+def export_as_json_stream(
+    modeladmin: admin.ModelAdmin,
+    request: HttpRequest,
+    queryset: QuerySet,
+) -> Optional[StreamingJSONResponse]:
+    """Export the selected entries as the streaming JSON file.
+
+    The admin export fields are exported only. The export permission is the
+    same as the adminactions one.
+    """
+    opts = modeladmin.model._meta  # pylint: disable=protected-access
+    if not request.user.has_perm(  # type: ignore
+            f"{opts.app_label}.adminactions_export_{opts.model_name}"):
+        modeladmin.message_user(
+            request,
+            "Sorry you do not have rights to execute this action",
+            messages.ERROR,
+        )
+        return None
+    response = StreamingJSONResponse(
+        queryset.order_by("pk").values(
+            *modeladmin.json_export_fields  # type: ignore
+        ).iterator(chunk_size=get_settings("D8B_STREAMING_CHUNK_SIZE")))
+    response["Content-Disposition"] = \
+        f"attachment; filename={opts.app_label}_{opts.model_name}.json"
+    return response
+
+
+export_as_json_stream.short_description = "Export as JSON"  # type: ignore
+
 actions.add_to_site(site)
 admin.site.site_header = admin.site.site_title = "D8B admin"
 admin.site.site_url = "/api/"
@@ -92,3 +128,17 @@ class ListDisplayUpdateMixin(admin.ModelAdmin):
         list_display = list(super().get_list_display(request))
         list_display.extend(self.list_display_extend)
         return [f for f in list_display if f not in self.list_display_remove]
+
+
+class JSONExportMixin(admin.ModelAdmin):
+    """The mixin to export the entries as the streaming JSON file."""
+
+    json_export_fields: List[str] = []
+
+    def get_actions(self, request: HttpRequest) -> Dict[str, Any]:
+        """Admin actions."""
+        actions = super().get_actions(request)
+        if self.actions is not None and IS_POPUP_VAR not in request.GET:
+            action = self.get_action(export_as_json_stream)
+            actions[action[1]] = action  # type: ignore
+        return actions
@@ -1,19 +1,160 @@
 """The distributed lock module."""
 
-from functools import wraps
-from typing import List, Optional
+import logging
+from functools import partial, wraps
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
 
+from django.db import transaction
 from redis.exceptions import RedisError
+from redis.lock import Lock
 
+from d8b.metrics import get_metrics
 from d8b.redis import redis
 
+RERUN_TIMEOUT: int = 60 * 5
+
+
+def get_key_value(value: Any) -> Any:
+    """Return the stable key value of the argument.
+
+    The model instances are represented by the labels and the primary keys.
+    """
+    meta = getattr(value, "_meta", None)
+    if meta is not None:
+        return f"{meta.label_lower}:{value.pk}"
+    return value
+
+
+def _release(lock: Lock) -> None:
+    """Release the lock if it is still owned."""
+    try:
+        lock.release()
+    except RedisError:
+        pass
+
+
+def _pop_rerun(rerun_key: str) -> bool:
+    """Delete the rerun flag and return whether it has been set."""
+    try:
+        return bool(redis.delete(rerun_key))
+    except RedisError:
+        return False
+
+
+def _has_rerun(rerun_key: str) -> bool:
+    """Return whether the rerun flag is set."""
+    try:
+        return bool(redis.exists(rerun_key))
+    except RedisError:
+        return False
+
+
+def _run_unlocked(
+    name: str,
+    func,
+    args: tuple,
+    kwargs: Dict[str, Any],
+    error: RedisError,
+):
+    """Run the function without the lock if Redis is unavailable."""
+    logging.getLogger("d8b").error(
+        "Distributed lock error: %s; %s is run without the lock",
+        error,
+        name,
+    )
+    get_metrics().increment(f"lock.{name}.unavailable")
+    return func(*args, **kwargs)
+
+
+def _run_coalesced(
+    name: str,
+    key: str,
+    lock: Lock,
+    func,
+    args: tuple,
+    kwargs: Dict[str, Any],
+    rerun_kwargs: Optional[Dict[str, Any]],
+    rerun_func: Optional[Callable] = None,
+):
+    """Run the function or request the rerun from the lock holder.
+
+    The holder reruns the function once more if the rerun has been requested
+    while it was running. The rerun flag is checked after the release too,
+    so a request made in between is not lost. The contender within the
+    transaction makes the call again after the commit, so the rerun reads
+    the committed data.
+    """
+    rerun_key = f"{key}_rerun"
+    metrics = get_metrics()
+    func_result = None
+    is_rerun = False
+    while True:
+        started = perf_counter()
+        try:
+            is_acquired = lock.acquire(blocking=False)
+        except RedisError as error:
+            if is_rerun:
+                return func_result
+            return _run_unlocked(name, func, args, kwargs, error)
+        if not is_acquired:
+            if not is_rerun and transaction.get_connection().in_atomic_block:
+                metrics.increment(f"lock.{name}.deferred")
+                transaction.on_commit(partial(
+                    _run_coalesced,
+                    name,
+                    key,
+                    lock,
+                    func,
+                    args,
+                    kwargs,
+                    rerun_kwargs,
+                    rerun_func,
+                ))
+                return func_result
+            redis.set(rerun_key, 1, ex=RERUN_TIMEOUT)
+            if not lock.acquire(blocking=False):
+                metrics.increment(f"lock.{name}.contended")
+                return func_result
+        metrics.timing(f"lock.{name}.wait", perf_counter() - started)
+        try:
+            _pop_rerun(rerun_key)
+            while True:
+                if is_rerun:
+                    metrics.increment(f"lock.{name}.reruns")
+                    kwargs = {**kwargs, **(rerun_kwargs or {})}
+                    func = rerun_func or func
+                func_result = func(*args, **kwargs)
+                is_rerun = True
+                if not _pop_rerun(rerun_key):
+                    break
+        finally:
+            _release(lock)
+        if not _has_rerun(rerun_key):
+            return func_result
+
 
 def distributed_lock(
     prefix: Optional[str] = None,
     keys: Optional[List[str]] = None,
     timeout: Optional[int] = None,
+    coalesce: bool = False,
+    rerun_kwargs: Optional[Dict[str, Any]] = None,
+    rerun_func: Optional[Callable] = None,
 ):
-    """Ensure only one instance gets invoked at a time."""
+    """Ensure only one instance gets invoked at a time.
+
+    In the coalesce mode the contending call doesn't wait for the lock. It
+    requests the rerun from the holder and returns None immediately. The
+    rerun is made with the holder arguments updated by the rerun kwargs.
+    The rerun function replaces the function for the rerun, so the
+    contenders of the different functions sharing the key are covered.
+    Within the transaction the contender does it after the commit, so the
+    changes of the transaction are not lost by the holder rerun.
+
+    If Redis is unavailable, the function is run without the lock, so the
+    concurrent runs are possible, but the calls are not lost.
+    """
 
     def innter(func):
         """Run the inner functions."""
@@ -21,24 +162,34 @@ def distributed_lock(
         @wraps(func)
         def with_lock(*args, **kwargs):
             """Run the function."""
-            key = prefix if prefix else func.__name__
+            name = prefix if prefix else func.__name__
+            key = name
             if not keys:
                 key += f"_args_{args}_kwargs_{kwargs}"
             else:
-                keys_values = {k: v for (k, v) in kwargs.items() if k in keys}
+                keys_values = {
+                    k: get_key_value(v)
+                    for (k, v) in kwargs.items() if k in keys
+                }
                 if not keys_values:
                     raise ValueError("Keys are empty")
                 key += f"_keys_{keys_values}"
-            func_result = None
             lock = redis.lock(key, timeout=timeout)
+            if coalesce:
+                return _run_coalesced(name, key, lock, func, args, kwargs,
+                                      rerun_kwargs, rerun_func)
+            func_result = None
+            started = perf_counter()
             try:
                 lock.acquire(blocking=True)
+            except RedisError as error:
+                return _run_unlocked(name, func, args, kwargs, error)
+            try:
+                get_metrics().timing(f"lock.{name}.wait",
+                                     perf_counter() - started)
                 func_result = func(*args, **kwargs)
             finally:
-                try:
-                    lock.release()
-                except RedisError:
-                    pass
+                _release(lock)
             return func_result
 
         return with_lock
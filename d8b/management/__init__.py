@@ -0,0 +1 @@
+"""The d8b management init module."""
@@ -0,0 +1 @@
+"""The d8b commands init module."""
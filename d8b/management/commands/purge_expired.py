@@ -0,0 +1,57 @@
+"""The purge expired command."""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from d8b.purge import PurgeReport, purge_expired_entries
+from d8b.settings import get_settings
+
+
+class Command(BaseCommand):
+    """The purge expired command."""
+
+    help = "Delete the expired entries in batches."
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--models",
+            nargs="+",
+            help="the model labels (the registered models by default)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=get_settings("D8B_PURGE_BATCH_SIZE"),
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=get_settings("D8B_PURGE_SLEEP"),
+            help="the pause between the batches in seconds",
+        )
+
+    def _write_progress(self, report: PurgeReport) -> None:
+        """Write the purge progress."""
+        self.stdout.write(f"{report.model}: {report.deleted} deleted "
+                          f"in {report.batches} batches")
+
+    def handle(self, *args, **options):
+        """Run the command."""
+        if options["batch_size"] < 1:
+            raise CommandError("The batch size must be positive.")
+        if options["sleep"] < 0:
+            raise CommandError("The sleep must not be negative.")
+        try:
+            reports = purge_expired_entries(
+                options["models"],
+                self._write_progress,
+                batch_size=options["batch_size"],
+                sleep_seconds=options["sleep"],
+            )
+        except (LookupError, ValueError) as error:
+            raise CommandError(str(error)) from error
+        for report in reports:
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"{report.model}: {report.deleted} entries are deleted "
+                    f"in {report.seconds:.3f} s"))
@@ -0,0 +1,47 @@
+"""The metrics module."""
+
+from abc import ABC, abstractmethod
+from typing import Dict
+
+from django.utils.module_loading import import_string
+
+from d8b.settings import get_settings
+
+
+class AbstractMetrics(ABC):
+    """The abstract metrics hook."""
+
+    @abstractmethod
+    def timing(self, name: str, value: float) -> None:
+        """Send the timing in seconds."""
+
+    @abstractmethod
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment the counter."""
+
+    def send(
+        self,
+        prefix: str,
+        timings: Dict[str, float],
+        counters: Dict[str, int],
+    ) -> None:
+        """Send the timings and the counters with the prefix."""
+        for name, timing in timings.items():
+            self.timing(f"{prefix}.{name}", timing)
+        for name, counter in counters.items():
+            self.increment(f"{prefix}.{name}", counter)
+
+
+class NullMetrics(AbstractMetrics):
+    """The metrics hook doing nothing."""
+
+    def timing(self, name: str, value: float) -> None:
+        """Send the timing in seconds."""
+
+    def increment(self, name: str, value: int = 1) -> None:
+        """Increment the counter."""
+
+
+def get_metrics() -> AbstractMetrics:
+    """Return the metrics hook."""
+    return import_string(get_settings("D8B_METRICS_CLASS"))()
@@ -0,0 +1,110 @@
+"""The purge module.
+
+The expired entries are deleted in the primary key batches with a pause
+between them, so the locks are held for a short time and the replicas keep
+up. The models are registered by the D8B_PURGE_MODELS setting and their
+managers must implement the get_expired_entries method.
+"""
+import logging
+from dataclasses import dataclass
+from time import perf_counter, sleep
+from typing import Any, Callable, List, Optional, Type
+
+from django.apps import apps
+from django.db.models import Model
+from django.db.models.query import QuerySet
+
+from d8b.settings import get_settings
+
+Progress = Callable[["PurgeReport"], None]
+
+
+@dataclass
+class PurgeReport():
+    """The purge report."""
+
+    model: str
+    deleted: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+class Purger():
+    """The expired entries purger."""
+
+    model: Type[Model]
+    label: str
+    batch_size: int
+    sleep_seconds: float
+
+    def __init__(
+        self,
+        label: str,
+        batch_size: Optional[int] = None,
+        sleep_seconds: Optional[float] = None,
+    ):
+        """Construct the object."""
+        self.label = label
+        self.model = apps.get_model(label)
+        self.batch_size = batch_size or get_settings("D8B_PURGE_BATCH_SIZE")
+        self.sleep_seconds = get_settings("D8B_PURGE_SLEEP") \
+            if sleep_seconds is None else sleep_seconds
+
+    def _get_entries(self) -> QuerySet:
+        """Return the expired entries."""
+        return self.model.objects.get_expired_entries()  # type: ignore
+
+    def _get_batch(self, last_pk: Optional[Any] = None) -> List[Any]:
+        """Return the primary keys of the batch after the last one.
+
+        The batches are paginated by the keys, so the deleted entries are
+        not scanned again.
+        """
+        entries = self._get_entries()
+        if last_pk is not None:
+            entries = entries.filter(pk__gt=last_pk)
+        return list(entries.order_by("pk").values_list(
+            "pk", flat=True)[:self.batch_size])
+
+    def purge(self, progress: Optional[Progress] = None) -> PurgeReport:
+        """Delete the expired entries and return the report.
+
+        The progress function is called after every batch.
+        """
+        report = PurgeReport(model=self.label)
+        started = perf_counter()
+        last_pk = None
+        while True:
+            ids = self._get_batch(last_pk)
+            if not ids:
+                break
+            if report.batches:
+                sleep(self.sleep_seconds)
+            deleted, _ = self.model.objects.filter(  # type: ignore
+                pk__in=ids).delete()
+            report.deleted += deleted
+            last_pk = ids[-1]
+            report.batches += 1
+            report.seconds = perf_counter() - started
+            if progress:
+                progress(report)
+            if len(ids) < self.batch_size:
+                break
+        report.seconds = perf_counter() - started
+        logging.getLogger("d8b").info("The expired entries are purged: %s",
+                                      report)
+        return report
+
+
+def purge_expired_entries(
+    labels: Optional[List[str]] = None,
+    progress: Optional[Progress] = None,
+    **kwargs,
+) -> List[PurgeReport]:
+    """Purge the expired entries of the registered models.
+
+    The keyword arguments are passed to the purgers.
+    """
+    if labels is None:
+        labels = list(get_settings("D8B_PURGE_MODELS"))
+    return [Purger(label, **kwargs).purge(progress) for label in labels]
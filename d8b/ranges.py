@@ -0,0 +1,77 @@
+"""The datetime ranges module.
+
+The periods are queried as the tstzrange(start_datetime, end_datetime, '[]')
+expression, so the PostgreSQL GiST indexes built on the same expression are
+used by the range operators. The conditions select a superset of the rows
+matching the dates comparisons and are used together with them.
+"""
+from datetime import datetime
+from typing import Optional
+
+from django.contrib.postgres.fields import DateTimeRangeField
+from django.db.models import BooleanField, F, Func, Value
+from psycopg2.extras import DateTimeTZRange
+
+BOUNDS: str = "[]"
+
+
+class TsTzRange(Func):
+    """The tstzrange function."""
+
+    function = "tstzrange"
+    output_field = DateTimeRangeField()
+
+
+class RangeOverlaps(Func):
+    """The ranges overlap operator."""
+
+    arg_joiner = " && "
+    template = "(%(expressions)s)"
+    output_field = BooleanField()
+
+
+class RangeContains(Func):
+    """The range contains operator."""
+
+    arg_joiner = " @> "
+    template = "(%(expressions)s)"
+    output_field = BooleanField()
+
+
+def get_period_range(prefix: str = "") -> TsTzRange:
+    """Return the range expression of the period fields."""
+    return TsTzRange(
+        F(f"{prefix}start_datetime"),
+        F(f"{prefix}end_datetime"),
+        Value(BOUNDS),
+    )
+
+
+def get_range(start: Optional[datetime], end: Optional[datetime]) -> Value:
+    """Return the range value of the dates.
+
+    The empty date means the unbounded range side. The inverted dates are
+    swapped.
+    """
+    if start and end and start > end:
+        start, end = end, start
+    return Value(
+        DateTimeTZRange(start, end, BOUNDS),
+        output_field=DateTimeRangeField(),
+    )
+
+
+def overlaps(
+    start: Optional[datetime],
+    end: Optional[datetime],
+    prefix: str = "",
+) -> RangeOverlaps:
+    """Return the condition of the period overlapping the dates."""
+    return RangeOverlaps(get_period_range(prefix), get_range(start, end))
+
+
+def contains(start: datetime, end: datetime, prefix: str = "") -> Func:
+    """Return the condition of the period containing the dates."""
+    if start > end:
+        return overlaps(start, end, prefix)
+    return RangeContains(get_period_range(prefix), get_range(start, end))
@@ -36,13 +36,23 @@ CELERYBEAT_SCHEDULE = {
         "task": "orders.tasks.notify_order_reminders",
         "schedule": 60 * 5
     },
-    "remove_expired_availability_slots_task": {
-        "task": "schedule.tasks.remove_expired_availability_slots",
+    "purge_expired_entries": {
+        "task": "d8b.tasks.purge_expired_entries_task",
         "schedule": crontab(minute="0", hour="1", day_of_week="*")
     },
+    "maintain_availability_slots_partitions": {
+        "task": "schedule.availability.tasks."
+                "maintain_availability_slots_partitions_task",
+        "schedule": crontab(minute="30", hour="0", day_of_week="*")
+    },
     "generate_future_availability_slots": {
-        "task": "schedule.tasks.generate_future_availability_slots_task",
+        "task": "schedule.availability.tasks."
+                "generate_future_availability_slots_task",
         "schedule": crontab(minute="0", hour="2", day_of_week="*")
+    },
+    "refresh_availability_stats": {
+        "task": "schedule.availability.tasks.refresh_availability_stats_task",
+        "schedule": 60 * 15
     }
 }
 CELERY_IMPORTS = (
@@ -5,3 +5,12 @@ D8B_REVIEW_MIN_LENGTH = 5
 D8B_SERVICE_DESCRIPTION_MIN_LENGTH = 20
 D8B_MONEY_MAX_DIGITS = 19
 D8B_MONEY_DECIMAL_PLACES = 4
+D8B_METRICS_CLASS = "d8b.metrics.NullMetrics"
+D8B_STREAMING_CHUNK_SIZE = 500
+D8B_PURGE_BATCH_SIZE = 1000
+D8B_PURGE_SLEEP = 0.1
+D8B_PURGE_MODELS = (
+    "schedule.AvailabilitySlot",
+    "orders.OrderReminder",
+    "communication.Message",
+)
@@ -3,6 +3,8 @@ from datetime import time
 
 from django.utils.translation import gettext_lazy as _
 
+from .main import ENV, TESTS
+
 DAYS_MONDAY = 0
 DAYS_TUESDAY = 1
 DAYS_WEDNESDAY = 2
@@ -27,6 +29,32 @@ SCHEDULE_MINIMAL_TIME_SPAN = 15
 
 AVAILABILITY_DAYS_TO_APPEND = 3
 AVAILABILITY_MIN_SLOT_DIFF_TO_COMBINE = 70
+AVAILABILITY_WINDOW_MARGIN_DAYS = 1
+AVAILABILITY_DIFF_SAVER_COPY_THRESHOLD = 5000
+AVAILABILITY_GENERATION_CHUNK_SIZE = 50
+AVAILABILITY_DEFERRED_GENERATION = ENV.bool(
+    "AVAILABILITY_DEFERRED_GENERATION",
+    default=not TESTS,
+)
+AVAILABILITY_DEFERRED_COUNTDOWN = 5
+AVAILABILITY_PARTITIONING = ENV.bool(
+    "AVAILABILITY_PARTITIONING",
+    default=TESTS,
+)
+AVAILABILITY_PARTITIONS_AHEAD = 14
+AVAILABILITY_STATS_DAYS = 7
+AVAILABILITY_GENERATOR_CLASS = \
+    "schedule.availability.generator.DefaultGenerator"
+
+CALENDAR_GENERATOR_CLASS = ENV.str(
+    "CALENDAR_GENERATOR_CLASS",
+    default="schedule.calendar.generator.CalendarGenerator",
+)
+CALENDAR_CACHE_TIMEOUT = 60 * 60
+CALENDAR_VIRTUAL_CACHE_TIMEOUT = 60
+CALENDAR_BATCH_MAX_SIZE = 50
+CALENDAR_START_TIMES_DAYS = 14
+CALENDAR_START_TIMES_CACHE_TIMEOUT = 60 * 60
 
 D8B_BOOKING_INTERVAL = 15
 D8B_REMINDER_INTERVAL = 5
@@ -0,0 +1,63 @@
+"""The streaming module.
+
+The JSON arrays are written by the chunks of the encoded entries, so the
+long lists are sent without keeping them in memory. The entries must be
+read by the server-side cursors, e.g. QuerySet.iterator.
+"""
+from datetime import tzinfo
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from django.utils.timezone import get_current_timezone, override
+
+from d8b.settings import get_settings
+
+
+def stream_json(
+    entries: Iterable[Any],
+    encode: Optional[Callable[[Any], Any]] = None,
+    chunk_size: Optional[int] = None,
+    current_timezone: Optional[tzinfo] = None,
+) -> Iterator[str]:
+    """Return the JSON array of the entries by the chunks.
+
+    The entries are converted by the encode function before the dumping.
+    The values unsupported by the Django encoder raise TypeError.
+    The timezone is activated while the entries are encoded, since the
+    response is streamed after the request middlewares are finished.
+    """
+    if chunk_size is None:
+        chunk_size = get_settings("D8B_STREAMING_CHUNK_SIZE")
+    encoder = DjangoJSONEncoder()
+    chunk = []
+    separator = "["
+    with override(current_timezone or get_current_timezone()):
+        for entry in entries:
+            chunk.append(separator)
+            chunk.append(encoder.encode(encode(entry) if encode else entry))
+            separator = ","
+            if len(chunk) >= chunk_size * 2:
+                yield "".join(chunk)
+                chunk = []
+    chunk.append("[]" if separator == "[" else "]")
+    yield "".join(chunk)
+
+
+class StreamingJSONResponse(StreamingHttpResponse):
+    """The streaming JSON array response."""
+
+    def __init__(
+        self,
+        entries: Iterable[Any],
+        encode: Optional[Callable[[Any], Any]] = None,
+        **kwargs,
+    ):
+        """Construct the object."""
+        kwargs.setdefault("content_type", "application/json")
+        super().__init__(
+            stream_json(
+                entries,
+                encode,
+                current_timezone=get_current_timezone(),
+            ), **kwargs)
@@ -1,8 +1,11 @@
 """The d8b tasks module."""
+from typing import Dict
+
 from django.utils.module_loading import import_string
 from djmoney import settings
 
 from .celery import app
+from .purge import purge_expired_entries
 
 
 @app.task
@@ -10,3 +13,9 @@ def update_rates(backend=settings.EXCHANGE_BACKEND, **kwargs):
     """Update the currency rates."""
     backend = import_string(backend)()
     backend.update_rates(**kwargs)
+
+
+@app.task(soft_time_limit=60 * 30)
+def purge_expired_entries_task() -> Dict[str, int]:
+    """Purge the expired entries of the registered models."""
+    return {r.model: r.deleted for r in purge_expired_entries()}
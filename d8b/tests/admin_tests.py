@@ -1,10 +1,17 @@
 """The admin tests module."""
+import json
+
+import pytest
 from django.contrib import admin
+from django.db.models.query import QuerySet
 from django.http.request import HttpRequest
+from pytest_mock import MockFixture
 
 from d8b.admin import (FieldsetFieldsUpdateMixin, ListDisplayUpdateMixin,
                        ListFilterUpdateMixin, ListLinksUpdateMixin,
-                       SearchFieldsUpdateMixin)
+                       SearchFieldsUpdateMixin, export_as_json_stream)
+from schedule.admin import AvailabilitySlotAdmin
+from schedule.models import AvailabilitySlot
 
 
 class ModelMock():
@@ -103,3 +110,35 @@ def test_list_display_update_mixin():
     obj = Test(ModelMock(), object())
     request = HttpRequest()
     assert obj.get_list_display(request) == ["l_two", "l_three", "l_five"]
+
+
+@pytest.mark.django_db
+def test_export_as_json_stream(
+    availability_slots: QuerySet,
+    mocker: MockFixture,
+):
+    """Should export the entries as the streaming JSON file."""
+    modeladmin = AvailabilitySlotAdmin(AvailabilitySlot, admin.site)
+    request = HttpRequest()
+    request.user = mocker.MagicMock()
+    request.user.has_perm.return_value = True
+    actions = modeladmin.get_actions(request)
+    assert "export_as_json_stream" in actions
+    assert "delete_selected" in actions
+    response = export_as_json_stream(modeladmin, request, availability_slots)
+    data = json.loads(b"".join(response.streaming_content))
+
+    assert "schedule_availabilityslot.json" in \
+        response["Content-Disposition"]
+    assert [e["id"] for e in data] == sorted(
+        availability_slots.values_list("pk", flat=True))
+    assert set(data[0]) == set(modeladmin.json_export_fields)
+
+    request.user.has_perm.reset_mock()
+    request.user.has_perm.return_value = False
+    message_user = mocker.patch.object(modeladmin, "message_user")
+    assert export_as_json_stream(modeladmin, request,
+                                 availability_slots) is None
+    request.user.has_perm.assert_called_once_with(
+        "schedule.adminactions_export_availabilityslot")
+    message_user.assert_called_once()
@@ -0,0 +1,34 @@
+"""The d8b commands test module."""
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models.query import QuerySet
+
+from orders.models import OrderReminder
+
+pytestmark = pytest.mark.django_db
+
+
+def test_command_purge_expired(order_reminders: QuerySet):
+    """Should purge the expired entries and report the progress."""
+    reminded = order_reminders.filter(is_reminded=True).count()
+    out = StringIO()
+    call_command(
+        "purge_expired",
+        models=["orders.OrderReminder"],
+        batch_size=1,
+        sleep=0,
+        stdout=out,
+    )
+    output = out.getvalue()
+    assert f"orders.OrderReminder: {reminded} deleted in {reminded} " \
+        "batches" in output
+    assert f"{reminded} entries are deleted" in output
+    assert not OrderReminder.objects.filter(is_reminded=True).exists()
+
+    with pytest.raises(CommandError):
+        call_command("purge_expired", models=["invalid"])
+    with pytest.raises(CommandError):
+        call_command("purge_expired", batch_size=0)
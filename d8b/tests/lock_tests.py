@@ -1,10 +1,14 @@
 """The lock tests module."""
 import threading
 from time import sleep
+from typing import Optional
 
 import pytest
+from django.db import transaction
+from django.db.models.query import QuerySet
+from pytest_mock import MockFixture
 
-from d8b.lock import distributed_lock
+from d8b.lock import distributed_lock, get_key_value
 from d8b.redis import redis
 
 LOCK_NAME: str = "test_args_()_kwargs_{}"
@@ -90,3 +94,85 @@ def test_distributed_lock_expired_lock():
         sleep(1)
 
     test()
+
+
+@pytest.mark.django_db
+def test_get_key_value(professionals: QuerySet):
+    """Should return the stable key values."""
+    professional = professionals.first()
+    assert get_key_value(professional) == \
+        f"professionals.professional:{professional.pk}"
+    assert get_key_value(5) == 5
+
+
+def test_distributed_lock_coalesce(mocker: MockFixture):
+    """Should request the rerun instead of waiting for the lock."""
+    redis.delete("test_keys_{'entry': 1}", "test_keys_{'entry': 1}_rerun")
+    timing = mocker.patch("d8b.metrics.NullMetrics.timing")
+    increment = mocker.patch("d8b.metrics.NullMetrics.increment")
+    started = threading.Event()
+    calls = []
+    results = {}
+
+    @distributed_lock(
+        prefix=PREFIX,
+        keys=["entry"],
+        timeout=5,
+        coalesce=True,
+        rerun_kwargs={"window": None},
+    )
+    def test(entry: int, window: Optional[int]):
+        """The test function."""
+        calls.append(window)
+        if len(calls) == 1:
+            started.set()
+            sleep(1)
+        return window
+
+    def holder():
+        """Run the holder."""
+        results["holder"] = test(entry=1, window=1)
+
+    def contender():
+        """Run the contender."""
+        started.wait()
+        results["contender"] = test(entry=1, window=2)
+
+    _run_functions(holder, contender)
+
+    assert calls == [1, None]
+    assert results == {"holder": None, "contender": None}
+    increment.assert_any_call("lock.test.contended")
+    increment.assert_any_call("lock.test.reruns")
+    timing.assert_called_once()
+    assert test(entry=1, window=3) == 3
+    assert calls == [1, None, 3]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_distributed_lock_coalesce_transaction(mocker: MockFixture):
+    """Should request the rerun after the contender transaction commit."""
+    key = "test_keys_{'entry': 1}"
+    redis.delete(key, f"{key}_rerun")
+    increment = mocker.patch("d8b.metrics.NullMetrics.increment")
+    calls = []
+
+    @distributed_lock(prefix=PREFIX, keys=["entry"], timeout=5, coalesce=True)
+    def test(entry: int):
+        """The test function."""
+        calls.append(entry)
+
+    lock = redis.lock(key, timeout=5)
+    lock.acquire(blocking=False)
+    with transaction.atomic():
+        assert test(entry=1) is None
+        assert not redis.exists(f"{key}_rerun")
+    assert redis.exists(f"{key}_rerun")
+    increment.assert_any_call("lock.test.deferred")
+
+    redis.delete(f"{key}_rerun")
+    with transaction.atomic():
+        test(entry=1)
+        lock.release()
+    assert calls == [1]
+    assert not redis.exists(f"{key}_rerun")
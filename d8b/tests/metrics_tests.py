@@ -0,0 +1,26 @@
+"""The metrics test module."""
+from pytest_mock import MockFixture
+
+from d8b.metrics import NullMetrics, get_metrics
+
+
+class MetricsMock(NullMetrics):
+    """The metrics mock."""
+
+
+def test_metrics_send(mocker: MockFixture):
+    """Should send the timings and the counters with the prefix."""
+    metrics = NullMetrics()
+    timing = mocker.patch.object(metrics, "timing")
+    increment = mocker.patch.object(metrics, "increment")
+    metrics.send("availability", {"saving": 0.5}, {"slots_inserted": 3})
+
+    timing.assert_called_once_with("availability.saving", 0.5)
+    increment.assert_called_once_with("availability.slots_inserted", 3)
+
+
+def test_get_metrics(settings):
+    """Should return the metrics hook of the settings."""
+    assert isinstance(get_metrics(), NullMetrics)
+    settings.D8B_METRICS_CLASS = "d8b.tests.metrics_tests.MetricsMock"
+    assert isinstance(get_metrics(), MetricsMock)
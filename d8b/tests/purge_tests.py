@@ -0,0 +1,63 @@
+"""The purge test module."""
+from dataclasses import replace
+from typing import List
+
+import pytest
+from django.db.models.query import QuerySet
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockFixture
+
+from communication.models import Message
+from d8b.purge import PurgeReport, Purger, purge_expired_entries
+from orders.models import OrderReminder
+
+pytestmark = pytest.mark.django_db
+
+
+def test_purger_purge(messages: QuerySet, mocker: MockFixture):
+    """Should delete the expired entries in batches."""
+    sleep = mocker.patch("d8b.purge.sleep")
+    ids = list(messages.values_list("pk", flat=True)[:5])
+    Message.objects.filter(pk__in=ids).update(
+        is_deleted_from_sender=True,
+        is_deleted_from_recipient=True,
+    )
+    Message.objects.filter(pk=messages.exclude(pk__in=ids).first().pk).\
+        update(is_deleted_from_sender=True)
+    progress: List[PurgeReport] = []
+    purger = Purger("communication.Message", batch_size=2, sleep_seconds=0.5)
+    get_batch = mocker.spy(purger, "_get_batch")
+    report = purger.purge(lambda r: progress.append(replace(r)))
+
+    assert report.model == "communication.Message"
+    assert report.deleted == 5
+    assert report.batches == 3
+    assert [r.deleted for r in progress] == [2, 4, 5]
+    ordered_ids = sorted(ids)
+    assert [c[0][0] for c in get_batch.call_args_list] == \
+        [None, ordered_ids[1], ordered_ids[3]]
+    assert sleep.call_count == 2
+    sleep.assert_called_with(0.5)
+    assert not Message.objects.filter(pk__in=ids).exists()
+    assert Message.objects.filter(is_deleted_from_sender=True).count() == 1
+
+    report = purger.purge()
+    assert report.deleted == 0
+    assert report.batches == 0
+
+
+def test_purge_expired_entries(
+    order_reminders: QuerySet,
+    settings: SettingsWrapper,
+):
+    """Should purge the expired entries of the registered models."""
+    settings.D8B_PURGE_MODELS = ("orders.OrderReminder", )
+    settings.D8B_PURGE_SLEEP = 0
+    reminded = order_reminders.filter(is_reminded=True).count()
+    total = order_reminders.count()
+    reports = purge_expired_entries()
+
+    assert len(reports) == 1
+    assert reports[0].deleted == reminded
+    assert OrderReminder.objects.count() == total - reminded
+    assert not OrderReminder.objects.filter(is_reminded=True).exists()
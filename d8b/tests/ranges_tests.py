@@ -0,0 +1,54 @@
+"""The ranges tests module."""
+import arrow
+import pytest
+from django.db.models.query import QuerySet
+
+from d8b.ranges import (RangeContains, RangeOverlaps, contains, get_range,
+                        overlaps)
+from schedule.models import AvailabilitySlot
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_range():
+    """Should return the range value."""
+    start = arrow.utcnow().datetime
+    end = arrow.utcnow().shift(hours=1).datetime
+
+    assert get_range(start, end).value.lower == start
+    assert get_range(end, start).value.lower == start
+    assert get_range(None, end).value.lower is None
+    assert get_range(start, end).value.upper_inc
+
+
+def test_contains():
+    """Should fall back to the overlap for the inverted dates."""
+    start = arrow.utcnow().datetime
+    end = arrow.utcnow().shift(hours=1).datetime
+
+    assert isinstance(contains(start, end), RangeContains)
+    assert isinstance(contains(end, start), RangeOverlaps)
+
+
+def test_ranges_filters(professionals: QuerySet):
+    """Should filter the periods by the ranges."""
+    start = arrow.utcnow().shift(days=1)
+    slot = AvailabilitySlot.objects.bulk_create([
+        AvailabilitySlot(
+            professional=professionals.first(),
+            start_datetime=start.datetime,
+            end_datetime=start.shift(hours=2).datetime,
+        )
+    ])[0]
+    query = AvailabilitySlot.objects.filter(pk=slot.pk)
+
+    assert query.filter(
+        overlaps(start.shift(hours=2).datetime, None)).exists()
+    assert not query.filter(
+        overlaps(start.shift(hours=3).datetime, None)).exists()
+    assert query.filter(
+        contains(start.datetime,
+                 start.shift(hours=1).datetime)).exists()
+    assert not query.filter(
+        contains(start.shift(hours=1).datetime,
+                 start.shift(hours=3).datetime)).exists()
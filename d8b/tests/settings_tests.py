@@ -1,4 +1,6 @@
 """The logging tests module."""
+from django.utils.module_loading import import_string
+
 from d8b.settings import get_settings
 
 
@@ -7,3 +9,9 @@ def test_get_settings():
     assert get_settings("LANGUAGE_CODE") == "en"
     assert get_settings("UNITS_IMPERIAL") == 1
     assert get_settings("INVALID") is None
+
+
+def test_beat_schedule_tasks():
+    """Should refer to the existing tasks."""
+    for entry in get_settings("CELERYBEAT_SCHEDULE").values():
+        assert import_string(entry["task"])
@@ -0,0 +1,34 @@
+"""The streaming test module."""
+import json
+from datetime import datetime
+
+import pytest
+import pytz
+from django.contrib.gis.geos import Point
+from django.utils import timezone
+
+from d8b.streaming import StreamingJSONResponse, stream_json
+
+
+def test_stream_json():
+    """Should return the JSON array by the chunks."""
+    result = list(stream_json(range(5), lambda x: {"id": x}, chunk_size=2))
+
+    assert len(result) == 3
+    assert json.loads("".join(result)) == [{"id": i} for i in range(5)]
+    assert list(stream_json([], chunk_size=2)) == ["[]"]
+
+    with pytest.raises(TypeError):
+        list(stream_json([{"location": Point(1, 2)}]))
+
+
+def test_streaming_json_response():
+    """Should encode the entries in the timezone of the response creation."""
+    date = datetime(2020, 1, 1, tzinfo=pytz.UTC)
+    with timezone.override("Europe/Moscow"):
+        response = StreamingJSONResponse(
+            [date], lambda x: timezone.localtime(x).isoformat())
+    content = b"".join(response.streaming_content)
+
+    assert response["Content-Type"] == "application/json"
+    assert json.loads(content) == ["2020-01-01T03:00:00+03:00"]
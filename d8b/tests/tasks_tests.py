@@ -2,7 +2,8 @@
 from djmoney import settings
 from pytest_mock import MockFixture
 
-from d8b.tasks import update_rates
+from d8b.purge import PurgeReport
+from d8b.tasks import purge_expired_entries_task, update_rates
 
 
 def test_update_rates(mocker: MockFixture):
@@ -10,3 +11,13 @@ def test_update_rates(mocker: MockFixture):
     mock = mocker.patch(settings.EXCHANGE_BACKEND)
     update_rates()
     assert mock.call_count == 1
+
+
+def test_purge_expired_entries_task(mocker: MockFixture):
+    """Should purge the expired entries."""
+    mock = mocker.patch(
+        "d8b.tasks.purge_expired_entries",
+        return_value=[PurgeReport(model="orders.OrderReminder", deleted=3)],
+    )
+    assert purge_expired_entries_task() == {"orders.OrderReminder": 3}
+    assert mock.call_count == 1
@@ -6,9 +6,10 @@ from django.db import models
 from django.db.models.query import QuerySet
 
 from communication.managers import AbstractRemindersManager
+from d8b.ranges import overlaps
 
 if TYPE_CHECKING:
-    from .models import Order
+    from .models import Order, OrderReminder
     from professionals.models import Professional
     from services.models import Service
 
@@ -20,6 +21,10 @@ class OrderRemindersManager(AbstractRemindersManager):
         """Return a list of reminders."""
         return super().get_list().select_related("order", )
 
+    def get_expired_entries(self) -> "QuerySet[OrderReminder]":
+        """Return the reminders already sent."""
+        return self.filter(is_reminded=True)
+
 
 class OrdersManager(models.Manager):
     """The orders slot manager."""
@@ -44,6 +49,7 @@ class OrdersManager(models.Manager):
     ) -> QuerySet:
         """Return the overlapping entries."""
         query = self.get_list().filter(
+            overlaps(order.start_datetime, order.end_datetime),
             start_datetime__lt=order.end_datetime,
             end_datetime__gt=order.start_datetime,
             service__professional__user=order.service.professional.user,
@@ -65,6 +71,7 @@ class OrdersManager(models.Manager):
         else:
             services = professional.services.all()
         query = self.filter(
+            overlaps(start.datetime, end.datetime),
             service__in=services,
             start_datetime__lte=end.datetime,
             end_datetime__gte=start.datetime,
@@ -0,0 +1,35 @@
+"""Add the GiST index of the order period range on PostgreSQL."""
+
+from django.db import migrations
+
+INDEX = "orders_order_period_gist"
+
+
+def create_index(apps, schema_editor):
+    """Create the index."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    schema_editor.execute(
+        f"CREATE INDEX {INDEX} ON orders_order USING gist "
+        "(service_id, tstzrange(start_datetime, end_datetime, '[]'))")
+
+
+def drop_index(apps, schema_editor):
+    """Drop the index."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX {INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('orders', '0008_auto_20201204_0627'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -3,7 +3,7 @@
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from schedule.availability import generate_for_order
+from schedule.availability.deferred import defer_for_order
 
 from .models import Order
 
@@ -25,4 +25,4 @@ def order_receiver(
 ):
     """Generate the schedule."""
     # pylint: disable=unused-argument
-    generate_for_order(instance)
+    defer_for_order(instance)
@@ -39,6 +39,14 @@ def test_order_reminder_manager_get_for_notification(
     assert not manager.get_for_notification().count()
 
 
+def test_order_reminder_manager_get_expired_entries(
+        order_reminders: QuerySet):
+    """Should return the reminders already sent."""
+    result = OrderReminder.objects.get_expired_entries()
+    assert result.count() == order_reminders.filter(is_reminded=True).count()
+    assert not result.filter(is_reminded=False).exists()
+
+
 def test_order_manager_get_overlapping_entries(orders: QuerySet):
     """Should return the overlapping entries."""
     manager = Order.objects
@@ -11,6 +11,8 @@ from orders.validators import (
     validate_order_client_location, validate_order_dates,
     validate_order_reminder_recipient, validate_order_service_location,
     validate_order_status)
+from schedule.calendar.starts import StartTimesIndex
+from schedule.models import AvailabilitySlot
 from services.models import Service
 from users.models import User
 
@@ -266,6 +268,31 @@ def test_validate_order_availability(
     order.save()
 
 
+def test_validate_order_availability_stale_start_times(
+    user: User,
+    availability_slots: QuerySet,
+):
+    """Should check the slots in the database despite the start times."""
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    service.is_enabled = True
+    start = arrow.utcnow().floor("day").shift(days=1, hours=11)
+    order = Order()
+    order.client = user
+    order.service = service
+    order.start_datetime = start.datetime
+    order.end_datetime = start.shift(minutes=service.duration * 2).datetime
+    order.status = Order.STATUS_NOT_CONFIRMED
+    index = StartTimesIndex(service)
+    assert index.is_bookable(order.start_datetime, order.end_datetime)
+    validate_order_availability(order)
+
+    AvailabilitySlot.objects.filter(service=service).delete()
+    assert index.is_bookable(order.start_datetime, order.end_datetime)
+    with pytest.raises(ValidationError):
+        validate_order_availability(order)
+
+
 def test_validate_order_status():
     """Should validate orders status."""
     order = Order()
@@ -153,7 +153,11 @@ def _validate_slots(
     end: datetime,
     service: "Service",
 ):
-    """Validate the availability slots."""
+    """Validate the availability slots.
+
+    The slots are always checked in the database, since the cached start
+    times index misses the slots changed outside of the savers.
+    """
     slots = AvailabilitySlot.objects.get_encompassing_interval(
         arrow.get(start),
         arrow.get(end),
@@ -28,6 +28,14 @@ class ProfessionalListFilterSet(filters.FilterSet):
         field_name="experience",
         lookup_expr="range",
     )
+    available_before = filters.IsoDateTimeFilter(
+        field_name="next_available_at",
+        lookup_expr="lte",
+    )
+    min_available_minutes = filters.NumberFilter(
+        field_name="available_minutes",
+        lookup_expr="gte",
+    )
 
     class Meta:
         """The professional list filterset class serializer META class."""
@@ -0,0 +1,23 @@
+"""Add the availability stats fields to the professionals."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('professionals', '0022_auto_20201118_1421'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='professional',
+            name='available_minutes',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, help_text='the available minutes in the upcoming days', verbose_name='available minutes'),
+        ),
+        migrations.AddField(
+            model_name='professional',
+            name='next_available_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='the start of the nearest availability', null=True, verbose_name='next available at'),
+        ),
+    ]
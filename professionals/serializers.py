@@ -211,6 +211,8 @@ class ProfessionalListSerializer(serializers.ModelSerializer):
             "company",
             "level",
             "rating",
+            "next_available_at",
+            "available_minutes",
             "subcategory",
             "experience",
             "tags",
@@ -222,7 +224,8 @@ class ProfessionalListSerializer(serializers.ModelSerializer):
             "created",
             "modified",
         )
-        read_only_fields = ("rating", "created", "modified")
+        read_only_fields = ("rating", "next_available_at",
+                            "available_minutes", "created", "modified")
 
 
 class ProfessionalSerializer(
@@ -4,9 +4,11 @@ from typing import Any, List
 from django.contrib import admin
 from reversion.admin import VersionAdmin
 
-from d8b.admin import (FieldsetFieldsUpdateMixin, ListDisplayUpdateMixin,
-                       ListFilterUpdateMixin, ListLinksUpdateMixin)
+from d8b.admin import (FieldsetFieldsUpdateMixin, JSONExportMixin,
+                       ListDisplayUpdateMixin, ListFilterUpdateMixin,
+                       ListLinksUpdateMixin)
 from professionals.models import Professional
+from schedule.availability.deferred import GenerationScope
 
 from .admin_fiters import ProfessionalFilter, ServiceFilter
 from .models import (AvailabilitySlot, ProfessionalClosedPeriod,
@@ -14,7 +16,26 @@ from .models import (AvailabilitySlot, ProfessionalClosedPeriod,
                      ServiceSchedule)
 
 
-class ClosedPeriodMixin(VersionAdmin):
+class GenerationScopeAdminMixin(admin.ModelAdmin):
+    """Regenerate the availability slots once per admin request."""
+
+    @GenerationScope()
+    def changeform_view(self, *args, **kwargs):
+        """Process the add or change form."""
+        return super().changeform_view(*args, **kwargs)
+
+    @GenerationScope()
+    def changelist_view(self, *args, **kwargs):
+        """Process the list editing and the actions."""
+        return super().changelist_view(*args, **kwargs)
+
+    @GenerationScope()
+    def delete_view(self, *args, **kwargs):
+        """Process the deletion."""
+        return super().delete_view(*args, **kwargs)
+
+
+class ClosedPeriodMixin(GenerationScopeAdminMixin, VersionAdmin):
     """The closed period mixin admin class."""
 
     list_display = [
@@ -41,7 +62,7 @@ class ClosedPeriodMixin(VersionAdmin):
         """Required for the AutocompleteFilter."""
 
 
-class ScheduleMixin(VersionAdmin):
+class ScheduleMixin(GenerationScopeAdminMixin, VersionAdmin):
     """The schedule mixin admin class."""
 
     list_display = [
@@ -186,7 +207,7 @@ class ServiceClosedPeriodAdmin(
 
 
 @admin.register(AvailabilitySlot)
-class AvailabilitySlotAdmin(VersionAdmin):
+class AvailabilitySlotAdmin(JSONExportMixin, VersionAdmin):
     """The availability slot admin."""
 
     def weekday(self, obj: AvailabilitySlot) -> str:
@@ -227,6 +248,10 @@ class AvailabilitySlotAdmin(VersionAdmin):
         "service__professional__user",
     )
     autocomplete_fields = ("service", "professional")
+    json_export_fields = [
+        "id", "professional_id", "service_id", "start_datetime",
+        "end_datetime"
+    ]
 
     class Media:
         """Required for the AutocompleteFilter."""
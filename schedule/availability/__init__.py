@@ -1,10 +1,11 @@
 """The availability initialization module."""
 
 from .utils import (generate_for_order, generate_for_professional,
-                    generate_for_service)
+                    generate_for_service, get_period_window)
 
 __all__ = [
     "generate_for_professional",
     "generate_for_service",
     "generate_for_order",
+    "get_period_window",
 ]
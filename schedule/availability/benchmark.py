@@ -0,0 +1,227 @@
+"""The availability benchmark module.
+
+The synthetic professionals with the weekly schedules, orders and closed
+periods are seeded and the availability generation reports are summarized
+by the stages.
+"""
+import random
+import statistics
+from collections import defaultdict
+from dataclasses import asdict, dataclass
+from datetime import time
+from typing import Any, DefaultDict, Dict, List
+from uuid import uuid4
+
+import arrow
+from django.db import transaction
+
+from orders.models import Order
+from professionals.models import Category, Professional, Subcategory
+from schedule.models import ProfessionalClosedPeriod, ProfessionalSchedule
+from services.models import Service
+from users.models import User
+
+from .db import DiffSaver
+from .generator import AvailabilityGenerator, get_availability_generator
+from .request import Request
+
+Report = Dict[str, Any]
+
+WORKING_DAY_START: int = 8 * 60
+WORKING_DAY_MINUTES: int = 12 * 60
+SCHEDULES_GAP_MINUTES: int = 30
+
+
+@dataclass
+class Workload():
+    """The synthetic workload."""
+
+    professionals: int = 10
+    schedules_per_day: int = 2
+    days_per_week: int = 5
+    orders: int = 50
+    closed_periods: int = 5
+    timezone: str = "Europe/London"
+    seed: int = 0
+
+
+class WorkloadSeeder():
+    """The synthetic workload seeder.
+
+    The objects are bulk created, so the signals do not generate the slots.
+    """
+
+    workload: Workload
+
+    def __init__(self, workload: Workload):
+        """Construct the object."""
+        self.workload = workload
+        self.random = random.Random(workload.seed)
+
+    def _get_schedules(self, professional: Professional) -> List[Any]:
+        """Return the weekly schedules of the professional."""
+        step = WORKING_DAY_MINUTES // self.workload.schedules_per_day
+        duration = max(step - SCHEDULES_GAP_MINUTES, SCHEDULES_GAP_MINUTES)
+        result = []
+        for day in range(self.workload.days_per_week):
+            for i in range(self.workload.schedules_per_day):
+                start = WORKING_DAY_START + i * step
+                end = start + duration
+                result.append(
+                    ProfessionalSchedule(
+                        professional=professional,
+                        day_of_week=day,
+                        start_time=time(start // 60, start % 60),
+                        end_time=time(end // 60, end % 60),
+                        timezone=self.workload.timezone,
+                    ))
+        return result
+
+    def _get_start(self) -> arrow.Arrow:
+        """Return the random hour of the upcoming year."""
+        return arrow.utcnow().floor("day").shift(
+            days=self.random.randrange(365),
+            hours=self.random.randrange(24),
+        )
+
+    def _get_closed_periods(self, professional: Professional) -> List[Any]:
+        """Return the closed periods of the professional."""
+        result = []
+        for _ in range(self.workload.closed_periods):
+            start = self._get_start()
+            result.append(
+                ProfessionalClosedPeriod(
+                    professional=professional,
+                    start_datetime=start.datetime,
+                    end_datetime=start.shift(
+                        days=self.random.randint(1, 3)).datetime,
+                ))
+        return result
+
+    def _get_orders(self, service: Service, client: User) -> List[Any]:
+        """Return the orders of the service."""
+        result = []
+        for _ in range(self.workload.orders):
+            start = self._get_start()
+            result.append(
+                Order(
+                    service=service,
+                    client=client,
+                    status=Order.STATUS_CONFIRMED,
+                    start_datetime=start.datetime,
+                    end_datetime=start.shift(hours=1).datetime,
+                ))
+        return result
+
+    def seed(self) -> List[Professional]:
+        """Seed the workload and return the professionals."""
+        user = User.objects.create_user(
+            f"benchmark-{uuid4().hex}@example.com",
+            uuid4().hex,
+            is_confirmed=True,
+        )
+        category = Category.objects.create(name="benchmark")
+        subcategory = Subcategory.objects.create(
+            category=category,
+            name="benchmark",
+        )
+        schedules: List[Any] = []
+        closed_periods: List[Any] = []
+        orders: List[Any] = []
+        professionals: List[Professional] = []
+        for i in range(self.workload.professionals):
+            professional = Professional.objects.create(
+                user=user,
+                name=f"benchmark {i}",
+                description=f"benchmark description {i}",
+                level=Professional.LEVEL_JUNIOR,
+                experience=0,
+                subcategory=subcategory,
+            )
+            service = Service.objects.create(
+                professional=professional,
+                name=f"benchmark {i}",
+                description=f"benchmark description {i}",
+                duration=60,
+                service_type=Service.TYPE_ONLINE,
+                is_enabled=True,
+            )
+            schedules.extend(self._get_schedules(professional))
+            closed_periods.extend(self._get_closed_periods(professional))
+            orders.extend(self._get_orders(service, user))
+            professionals.append(professional)
+        ProfessionalSchedule.objects.bulk_create(schedules)
+        ProfessionalClosedPeriod.objects.bulk_create(closed_periods)
+        Order.objects.bulk_create(orders)
+        return professionals
+
+
+class BenchmarkSaver(DiffSaver):
+    """The saver leaving the availability versions untouched.
+
+    The benchmark is rolled back, so the cached availability stays valid.
+    """
+
+    @staticmethod
+    def _bump_version(professional_id: int) -> None:
+        """Skip the version change."""
+        # pylint: disable=unused-argument
+
+
+class AvailabilityBenchmark():
+    """The availability generation benchmark."""
+
+    workload: Workload
+    timings: DefaultDict[str, List[float]]
+    counters: DefaultDict[str, int]
+
+    def __init__(self, workload: Workload):
+        """Construct the object."""
+        self.workload = workload
+
+    def _run(self, generator: AvailabilityGenerator) -> None:
+        """Run the generator and record the stages timings."""
+        report = generator.generate()
+        for stage, timing in report.timings.items():
+            self.timings[stage].append(timing)
+        for name, value in report.counters.items():
+            self.counters[name] += value
+
+    @staticmethod
+    def _get_summary(timings: List[float]) -> Dict[str, float]:
+        """Return the timings summary in milliseconds."""
+        return {
+            "count": len(timings),
+            "total": sum(timings) * 1000,
+            "min": min(timings) * 1000,
+            "median": statistics.median(timings) * 1000,
+            "max": max(timings) * 1000,
+        }
+
+    def run(self) -> Report:
+        """Seed the workload, run the benchmark and return the report.
+
+        The synthetic objects are rolled back after the benchmark and the
+        availability versions are not changed.
+        """
+        self.timings = defaultdict(list)
+        self.counters = defaultdict(int)
+        with transaction.atomic():
+            professionals = WorkloadSeeder(self.workload).seed()
+            generator_class = ""
+            for professional in professionals:
+                request = Request()
+                request.professional = professional
+                generator = get_availability_generator(request)
+                generator.saver = BenchmarkSaver()
+                generator_class = generator.generator.__class__.__name__
+                self._run(generator)
+            transaction.set_rollback(True)
+        return {
+            "workload": asdict(self.workload),
+            "generator": generator_class,
+            "stages": {
+                k: self._get_summary(v) for k, v in self.timings.items()
+            },
+            "counters": dict(self.counters),
+        }
@@ -0,0 +1,166 @@
+"""The availability context module."""
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, DefaultDict, List, Optional
+
+import arrow
+from django.conf import settings
+
+from orders.models import Order
+from schedule.models import (ClosedPeriod, ProfessionalClosedPeriod,
+                             ProfessionalSchedule, Schedule,
+                             ServiceClosedPeriod, ServiceSchedule)
+
+if TYPE_CHECKING:
+    from professionals.models import Professional
+    from services.models import Service
+
+    from .request import Request
+
+SchedulesByDays = DefaultDict[int, List[Schedule]]
+
+
+class GenerationContext():
+    """The prefetched generation data for many professionals.
+
+    The schedules, the closed periods and the orders of the professionals
+    and their services are loaded with a query per model and grouped in
+    memory.
+    """
+
+    start_datetime: arrow.Arrow
+    end_datetime: arrow.Arrow
+    professional_ids: List[int]
+    professional_schedules: DefaultDict[int, SchedulesByDays]
+    service_schedules: DefaultDict[int, SchedulesByDays]
+    professional_periods: DefaultDict[int, List[ClosedPeriod]]
+    service_periods: DefaultDict[int, List[ClosedPeriod]]
+    orders: DefaultDict[int, List[Order]]
+    service_orders: DefaultDict[int, List[Order]]
+
+    def __init__(
+        self,
+        professional_ids: List[int],
+        start: arrow.Arrow,
+        end: arrow.Arrow,
+    ):
+        """Construct the object."""
+        self.professional_ids = list(professional_ids)
+        self.start_datetime = start
+        self.end_datetime = end
+
+    def _load_schedules(self) -> None:
+        """Load the schedules."""
+        self.professional_schedules = defaultdict(lambda: defaultdict(list))
+        self.service_schedules = defaultdict(lambda: defaultdict(list))
+        for entry in ProfessionalSchedule.objects.filter(
+                professional_id__in=self.professional_ids,
+                is_enabled=True,
+        ).order_by("day_of_week", "start_time"):
+            self.professional_schedules[entry.professional_id][
+                entry.day_of_week].append(entry)
+        for entry in ServiceSchedule.objects.filter(
+                service__professional_id__in=self.professional_ids,
+                is_enabled=True,
+        ).order_by("day_of_week", "start_time"):
+            self.service_schedules[entry.service_id][entry.day_of_week].\
+                append(entry)
+
+    def _load_periods(self) -> None:
+        """Load the closed periods."""
+        self.professional_periods = defaultdict(list)
+        self.service_periods = defaultdict(list)
+        dates = {
+            "start_datetime__lt": self.end_datetime.datetime,
+            "end_datetime__gt": self.start_datetime.datetime,
+            "is_enabled": True,
+        }
+        for entry in ProfessionalClosedPeriod.objects.filter(
+                professional_id__in=self.professional_ids, **dates):
+            self.professional_periods[entry.professional_id].append(entry)
+        for entry in ServiceClosedPeriod.objects.filter(
+                service__professional_id__in=self.professional_ids, **dates):
+            self.service_periods[entry.service_id].append(entry)
+
+    def _load_orders(self) -> None:
+        """Load the orders."""
+        self.orders = defaultdict(list)
+        self.service_orders = defaultdict(list)
+        orders = Order.objects.filter(
+            service__professional_id__in=self.professional_ids,
+            start_datetime__lte=self.end_datetime.datetime,
+            end_datetime__gte=self.start_datetime.datetime,
+        ).exclude(status__in=(
+            Order.STATUS_CANCELED,
+            Order.STATUS_COMPLETED,
+        )).select_related("service")
+        for order in orders:
+            self.orders[order.service.professional_id].append(order)
+            self.service_orders[order.service_id].append(order)
+
+    def load(self) -> "GenerationContext":
+        """Load the context data."""
+        self._load_schedules()
+        self._load_periods()
+        self._load_orders()
+        return self
+
+    def is_covering(self, request: "Request") -> bool:
+        """Check if the context contains the request data."""
+        return bool(
+            request.professional.pk in self.professional_ids and
+            request.start_datetime and request.end_datetime and
+            self.start_datetime <= request.start_datetime and
+            self.end_datetime >= request.end_datetime)
+
+    def get_schedules(
+        self,
+        professional: "Professional",
+        service: Optional["Service"] = None,
+    ) -> SchedulesByDays:
+        """Return the schedules grouped by days."""
+        if service:
+            return self.service_schedules[service.pk]
+        return self.professional_schedules[professional.pk]
+
+    def get_closed_periods(
+        self,
+        professional: "Professional",
+        service: Optional["Service"] = None,
+    ) -> List[ClosedPeriod]:
+        """Return the closed periods."""
+        if service:
+            return self.service_periods[service.pk]
+        return self.professional_periods[professional.pk]
+
+    def get_orders(
+        self,
+        professional: "Professional",
+        service: Optional["Service"] = None,
+    ) -> List[Order]:
+        """Return the orders."""
+        if service and service.is_enabled:
+            return self.service_orders[service.pk]
+        return self.orders[professional.pk]
+
+
+def get_generation_context(
+    professional_ids: List[int],
+    append_days: bool = False,
+    start: Optional[arrow.Arrow] = None,
+    end: Optional[arrow.Arrow] = None,
+) -> GenerationContext:
+    """Return the loaded context for the generation requests."""
+    today = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    if append_days:
+        today = today.shift(years=1)
+    start = start.floor("day") if start else today
+    if not end:
+        end = today.shift(days=settings.AVAILABILITY_DAYS_TO_APPEND) \
+            if append_days else today.shift(years=1)
+    return GenerationContext(professional_ids, start, end).load()
@@ -1,41 +1,221 @@
 """The availability db module."""
 
+import csv
+import io
+import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from functools import partial
+from typing import DefaultDict, List, Optional, Tuple
 
-from django.db import transaction
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models.query import QuerySet
+from redis.exceptions import RedisError
 
 from schedule.models import AvailabilitySlot
 
+from .exceptions import AvailabilityValueError
 from .mixins import RequestSlotsSetterMixin
+from .slots import Slot
+from .versions import bump_version
+
+SlotKey = Tuple[int, Optional[int], datetime, datetime]
+
+
+@dataclass
+class SaverReport():
+    """The saver report."""
+
+    inserted: int = 0
+    deleted: int = 0
+    unchanged: int = 0
 
 
 class AbstractSaver(ABC, RequestSlotsSetterMixin):
     """The abstract saver."""
 
+    report: SaverReport
+
     @abstractmethod
     def _save(self) -> None:
         """Save the availability slots."""
 
+    @staticmethod
+    def _bump_version(professional_id: int) -> None:
+        """Change the availability version of the professional.
+
+        The Redis errors are logged only, since the stale cache is better
+        than the lost generation.
+        """
+        try:
+            bump_version(professional_id)
+        except RedisError as error:
+            logging.getLogger("d8b").error(
+                "Availability version error: %s; professional %s",
+                error,
+                professional_id,
+            )
+
     def save(self) -> None:
-        """Save the availability slots."""
+        """Save the availability slots.
+
+        The availability version of the professional is changed after the
+        slots are saved and once more after the transaction is committed,
+        so the data cached by the concurrent readers in between is dropped.
+        """
         self._check_request()
-        return self._save()
+        self.report = SaverReport()
+        self._save()
+        bump = partial(self._bump_version, self._request.professional.pk)
+        bump()
+        transaction.on_commit(bump)
 
 
 class DeleteSaver(AbstractSaver):
     """The saver."""
 
-    def _delete_old_entries(self) -> None:
-        """Delete the old entries before saving the new ones."""
-        AvailabilitySlot.objects.get_between_dates(
+    def _get_old_entries(self) -> QuerySet:
+        """Return the old entries to replace."""
+        return AvailabilitySlot.objects.get_between_dates(
             professional=self._request.professional,
             service=self._request.service,
             start=self._request.start_datetime,
             end=self._request.end_datetime.shift(days=1),  # type: ignore
-        ).delete()
+        )
+
+    def _get_new_entries(self) -> List[Slot]:
+        """Return the new entries to save."""
+        return self._slots
+
+    def _delete_old_entries(self) -> None:
+        """Delete the old entries before saving the new ones."""
+        self.report.deleted, _ = self._get_old_entries().delete()
 
     def _save(self):
         """Save the availability slots."""
         with transaction.atomic():
             self._delete_old_entries()
-            AvailabilitySlot.objects.bulk_create(self._slots)
+            slots = self._get_new_entries()
+            AvailabilitySlot.objects.bulk_create(
+                [s.to_model() for s in slots])
+            self.report.inserted = len(slots)
+
+
+class WindowSaver(DeleteSaver):
+    """The saver to replace the slots within the request window only."""
+
+    def _check_request(self):
+        """Check if the request is set."""
+        super()._check_request()
+        if not self._request.window_start_datetime or \
+                not self._request.window_end_datetime:
+            raise AvailabilityValueError("The request window is not set.")
+
+    def _get_old_entries(self) -> QuerySet:
+        """Return the old entries within the window."""
+        return AvailabilitySlot.objects.get_between_dates(
+            professional=self._request.professional,
+            service=self._request.service,
+            start=self._request.window_start_datetime,  # type: ignore
+            end=self._request.window_end_datetime,  # type: ignore
+        )
+
+    def _get_new_entries(self) -> List[Slot]:
+        """Return the slots overlapping the window."""
+        start = self._request.window_start_datetime.datetime  # type: ignore
+        end = self._request.window_end_datetime.datetime  # type: ignore
+        return [
+            s for s in self._slots
+            if s.start_datetime <= end and s.end_datetime >= start
+        ]
+
+
+class DiffSaver(DeleteSaver):
+    """The saver to write the changed slots only.
+
+    The existing slots are matched with the new ones by the professional,
+    the service and the dates. The matched slots are left untouched, so
+    their primary keys are kept.
+    """
+
+    @staticmethod
+    def _get_key(slot: Slot) -> SlotKey:
+        """Return the slot key."""
+        return (
+            slot.professional_id,
+            slot.service_id,
+            slot.start_datetime,
+            slot.end_datetime,
+        )
+
+    def _get_old_keys(self) -> DefaultDict[SlotKey, List[int]]:
+        """Return the old entries ids grouped by the keys."""
+        result: DefaultDict[SlotKey, List[int]] = defaultdict(list)
+        entries = self._get_old_entries().values_list(
+            "pk",
+            "professional_id",
+            "service_id",
+            "start_datetime",
+            "end_datetime",
+        )
+        for pk, *key in entries:
+            result[tuple(key)].append(pk)  # type: ignore
+        return result
+
+    @staticmethod
+    def _copy(slots: List[Slot]) -> None:
+        """Insert the slots with the COPY command."""
+        data = io.StringIO()
+        writer = csv.writer(data)
+        for slot in slots:
+            writer.writerow((
+                slot.professional_id,
+                slot.service_id or "",
+                slot.start_datetime.isoformat(),
+                slot.end_datetime.isoformat(),
+            ))
+        data.seek(0)
+        table = AvailabilitySlot._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {table} (professional_id, service_id, start_datetime, "
+                "end_datetime) FROM STDIN WITH (FORMAT csv)",
+                data,
+            )
+
+    def _insert(self, slots: List[Slot]) -> None:
+        """Insert the slots."""
+        threshold = settings.AVAILABILITY_DIFF_SAVER_COPY_THRESHOLD
+        if threshold and len(slots) >= threshold and \
+                connection.vendor == "postgresql":
+            self._copy(slots)
+        else:
+            AvailabilitySlot.objects.bulk_create(
+                [s.to_model() for s in slots])
+
+    def _save(self):
+        """Save the availability slots."""
+        with transaction.atomic():
+            old_keys = self._get_old_keys()
+            new_slots: List[Slot] = []
+            for slot in self._get_new_entries():
+                pks = old_keys.get(self._get_key(slot))
+                if pks:
+                    pks.pop()
+                    self.report.unchanged += 1
+                else:
+                    new_slots.append(slot)
+            old_pks = [pk for pks in old_keys.values() for pk in pks]
+            if old_pks:
+                self.report.deleted, _ = AvailabilitySlot.objects.filter(
+                    pk__in=old_pks).delete()
+            if new_slots:
+                self._insert(new_slots)
+            self.report.inserted = len(new_slots)
+
+
+class WindowDiffSaver(DiffSaver, WindowSaver):
+    """The saver to write the changed slots within the window only."""
@@ -0,0 +1,276 @@
+"""The availability deferred generation module.
+
+The regeneration requests are recorded in Redis as dirty markers after the
+transaction commit. The markers of the same entity are coalesced into one
+marker with the union of the windows and processed by a Celery task.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from contextlib import ContextDecorator
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+import arrow
+from django.conf import settings
+from django.db import transaction
+from redis.exceptions import RedisError
+
+from d8b.celery import app
+from d8b.redis import redis
+from professionals.models import Professional
+from services.models import Service
+
+from .utils import (generate_for_professional,
+                    generate_for_professional_with_services,
+                    generate_for_service, get_period_window)
+
+if TYPE_CHECKING:
+    from orders.models import Order
+
+DIRTY_KEY: str = "availability_dirty"
+SCHEDULED_KEY: str = "availability_dirty_scheduled"
+TASK_NAME: str = \
+    "schedule.availability.tasks.generate_deferred_availability_slots_task"
+
+PROFESSIONAL: str = "professional"
+SERVICE: str = "service"
+
+# merge the window of the marker with the stored one,
+# the empty bound means the whole generation period
+MARK_SCRIPT = redis.register_script("""
+local old = redis.call("HGET", KEYS[1], ARGV[1])
+local start, finish = ARGV[2], ARGV[3]
+if old then
+    local sep = string.find(old, "|", 1, true)
+    local old_start = string.sub(old, 1, sep - 1)
+    local old_finish = string.sub(old, sep + 1)
+    if start == "" or old_start == "" then
+        start = ""
+    elseif tonumber(old_start) < tonumber(start) then
+        start = old_start
+    end
+    if finish == "" or old_finish == "" then
+        finish = ""
+    elseif tonumber(old_finish) > tonumber(finish) then
+        finish = old_finish
+    end
+end
+redis.call("HSET", KEYS[1], ARGV[1], start .. "|" .. finish)
+""")
+
+Window = Tuple[Optional[arrow.Arrow], Optional[arrow.Arrow]]
+Markers = Dict[Tuple[str, int], Optional[Window]]
+
+_local = threading.local()
+
+
+class GenerationScope(ContextDecorator):
+    """The scope to collect the generation requests.
+
+    The requests made inside the scope are coalesced and run once per
+    professional or service when the scope exits. The changes made before
+    an error are regenerated too.
+    """
+
+    @staticmethod
+    def _get_stack() -> List[Markers]:
+        """Return the stack of the active scopes markers."""
+        if not hasattr(_local, "scopes"):
+            _local.scopes = []
+        return _local.scopes
+
+    @classmethod
+    def get_current(cls) -> Optional[Markers]:
+        """Return the markers of the current scope."""
+        stack = cls._get_stack()
+        return stack[-1] if stack else None
+
+    def __enter__(self):
+        """Enter the scope."""
+        self._get_stack().append({})
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Exit the scope and run the collected requests."""
+        markers = self._get_stack().pop()
+        for (kind, pk), window in markers.items():
+            _defer(kind, pk, window)
+        return False
+
+
+def _merge_windows(
+    first: Optional[Window],
+    second: Optional[Window],
+) -> Optional[Window]:
+    """Return the union of the windows."""
+    if not first or not second or not all(first) or not all(second):
+        return None
+    return (
+        min(first[0], second[0]),  # type: ignore
+        max(first[1], second[1]),  # type: ignore
+    )
+
+
+def _get_window_value(window: Optional[Window]) -> Tuple[str, str]:
+    """Return the window bounds as the marker value."""
+    if not window or not window[0] or not window[1]:
+        return "", ""
+    return str(window[0].timestamp), str(window[1].timestamp)
+
+
+def _parse_window_value(value: str) -> Window:
+    """Return the window from the marker value."""
+    start, end = value.split("|")
+    if not start or not end:
+        return None, None
+    return arrow.get(int(start)), arrow.get(int(end))
+
+
+def _generate(kind: str, pk: int, window: Optional[Window] = None):
+    """Generate the slots for the entity synchronously."""
+    start, end = window or (None, None)
+    kwargs = {"is_window": bool(start and end), "start": start, "end": end}
+    if kind == PROFESSIONAL:
+        professional = Professional.objects.filter(pk=pk).first()
+        if professional:
+            generate_for_professional(professional=professional, **kwargs)
+    else:
+        service = Service.objects.filter(pk=pk).first()
+        if service:
+            generate_for_service(service=service, **kwargs)
+
+
+def _schedule_task():
+    """Schedule the task unless it has already been scheduled."""
+    countdown = settings.AVAILABILITY_DEFERRED_COUNTDOWN
+    if redis.set(SCHEDULED_KEY, 1, nx=True, ex=countdown + 60 * 5):
+        app.signature(TASK_NAME).apply_async(countdown=countdown)
+
+
+def _mark(kind: str, pk: int, window: Optional[Window] = None):
+    """Record the marker and schedule the task."""
+    try:
+        MARK_SCRIPT(
+            keys=[DIRTY_KEY],
+            args=[f"{kind}:{pk}", *_get_window_value(window)],
+        )
+        _schedule_task()
+    except RedisError as error:
+        logging.getLogger("d8b").error(
+            "Deferred availability generation error: %s; %s %s",
+            error,
+            kind,
+            pk,
+        )
+        _generate(kind, pk, window)
+
+
+def _defer(kind: str, pk: int, window: Optional[Window] = None):
+    """Defer the generation until the transaction is committed."""
+    scope = GenerationScope.get_current()
+    if scope is not None:
+        key = (kind, pk)
+        scope[key] = _merge_windows(scope[key], window) \
+            if key in scope else window
+        return
+    if not settings.AVAILABILITY_DEFERRED_GENERATION:
+        _generate(kind, pk, window)
+        return
+    transaction.on_commit(lambda: _mark(kind, pk, window))
+
+
+def defer_for_professional(
+    professional: Professional,
+    window: Optional[Window] = None,
+):
+    """Defer the generation for the professional."""
+    _defer(PROFESSIONAL, professional.pk, window)
+
+
+def defer_for_service(service: Service, window: Optional[Window] = None):
+    """Defer the generation for the service."""
+    _defer(SERVICE, service.pk, window)
+
+
+def defer_for_order(order: "Order"):
+    """Defer the generation for the order."""
+    window = get_period_window(order)
+    defer_for_professional(order.service.professional, window)
+    if not order.service.is_base_schedule:
+        defer_for_service(order.service, window)
+
+
+def pop_markers() -> Dict[Tuple[str, int], Window]:
+    """Return and remove the recorded markers."""
+    redis.delete(SCHEDULED_KEY)
+    pipe = redis.pipeline()
+    pipe.hgetall(DIRTY_KEY)
+    pipe.delete(DIRTY_KEY)
+    values, _ = pipe.execute()
+    result: Dict[Tuple[str, int], Window] = {}
+    for field, value in values.items():
+        kind, pk = field.decode().split(":")
+        result[(kind, int(pk))] = _parse_window_value(value.decode())
+    return result
+
+
+def _get_combined_services(
+        markers: Dict[Tuple[str, int], Window]) -> Dict[int, List[Service]]:
+    """Return the marked services of the marked professionals."""
+    result: Dict[int, List[Service]] = defaultdict(list)
+    ids: Dict[str, List[int]] = defaultdict(list)
+    for kind, pk in markers:
+        ids[kind].append(pk)
+    services = Service.objects.filter(
+        pk__in=ids[SERVICE],
+        professional_id__in=ids[PROFESSIONAL],
+    ).select_related("professional")
+    for service in services:
+        result[service.professional_id].append(service)
+    return result
+
+
+def _generate_combined(
+    services: List[Service],
+    markers: Dict[Tuple[str, int], Window],
+):
+    """Generate the slots for the professional with the services."""
+    professional = services[0].professional
+    window: Optional[Window] = markers[(PROFESSIONAL, professional.pk)]
+    for service in services:
+        window = _merge_windows(window, markers[(SERVICE, service.pk)])
+    start, end = window or (None, None)
+    generate_for_professional_with_services(
+        professional=professional,
+        services=services,
+        is_window=bool(start and end),
+        start=start,
+        end=end,
+    )
+
+
+def generate_deferred() -> int:
+    """Generate the slots for the recorded markers.
+
+    The professional marked together with its services is generated in the
+    combined mode with the union of the windows.
+    """
+    markers = pop_markers()
+    combined = _get_combined_services(markers)
+    combined_services = {s.pk for i in combined.values() for s in i}
+    for (kind, pk), window in markers.items():
+        if kind == SERVICE and pk in combined_services:
+            continue
+        try:
+            if kind == PROFESSIONAL and pk in combined:
+                _generate_combined(combined[pk], markers)
+            else:
+                _generate(kind, pk, window)
+        except Exception:  # pylint: disable=broad-except
+            logging.getLogger("d8b").exception(
+                "Deferred availability generation error: %s %s",
+                kind,
+                pk,
+            )
+    return len(markers)
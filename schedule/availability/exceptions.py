@@ -7,3 +7,7 @@ class AvailabilityError(Exception):
 
 class AvailabilityValueError(AvailabilityError):
     """The availability value error."""
+
+
+class AvailabilityEmptyWindowError(AvailabilityError):
+    """The availability empty window error."""
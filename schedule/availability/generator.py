@@ -1,23 +1,37 @@
 """The availability generator module."""
 import logging
 from abc import ABC, abstractmethod
-from typing import DefaultDict, List, Optional, TypeVar
+from dataclasses import asdict
+from datetime import datetime, time
+from time import perf_counter
+from typing import (Callable, DefaultDict, Dict, List, Optional, Tuple,
+                    TypeVar)
 
 import arrow
+import numpy as np
 from django.conf import settings
+from django.utils.module_loading import import_string
 
-from schedule.models import (AvailabilitySlot, ProfessionalSchedule, Schedule,
-                             ServiceSchedule)
+from d8b.metrics import AbstractMetrics, NullMetrics, get_metrics
+from d8b.settings import get_settings
+
+from schedule.models import ProfessionalSchedule, Schedule, ServiceSchedule
+from schedule.timezones import TimezoneOffsets, get_timezone_offsets
 from services.models import Service
 
-from .db import AbstractSaver, DeleteSaver
-from .exceptions import AvailabilityError, AvailabilityValueError
+from .db import AbstractSaver, DiffSaver, WindowDiffSaver
+from .exceptions import (AvailabilityEmptyWindowError, AvailabilityError,
+                         AvailabilityValueError)
+from .metrics import GenerationReport
 from .request import (AbstractRequestProcessor, Request,
-                      RequestAppendProcessor, RequestYearProcessor)
+                      RequestAppendProcessor, RequestDatesProcessor,
+                      RequestWindowProcessor, RequestYearProcessor)
 from .restrictions import (AbstractRestriction, ClosedPeriodsRestriction,
                            OrderRestriction)
+from .slots import Slot
 
 T = TypeVar("T", bound="AbstractGenerator")
+R = TypeVar("R")
 
 
 class AbstractGenerator(ABC):
@@ -26,6 +40,9 @@ class AbstractGenerator(ABC):
     _request: Request
     _service: Optional[Service] = None
 
+    # the number of the schedules loaded by the last call
+    loaded: int = 0
+
     def set_request(self: T, request: Request) -> T:
         """Set a  request."""
         self._request = request
@@ -46,33 +63,57 @@ class AbstractGenerator(ABC):
             raise AvailabilityValueError("The request is not set.")
 
     @abstractmethod
-    def _get(self) -> List[AvailabilitySlot]:
+    def _get(self) -> List[Slot]:
         """Generate and return availability slots."""
 
-    def get(self) -> List[AvailabilitySlot]:
+    def get(self) -> List[Slot]:
         """Generate and return availability slots."""
         self._check_request()
+        self.loaded = 0
         return self._get()
 
 
 class DefaultGenerator(AbstractGenerator):
     """The default generator."""
 
-    def _get_schedules(self) -> DefaultDict[int, List[Schedule]]:
-        """Get the schedules."""
+    def _load_schedules(self) -> DefaultDict[int, List[Schedule]]:
+        """Load the schedules."""
+        context = self._request.get_context()
+        if context:
+            return context.get_schedules(
+                self._request.professional,
+                self._service,
+            )
         if self._service:
             return ServiceSchedule.objects.get_by_days(self._service)
 
         return ProfessionalSchedule.objects.get_by_days(
             self._request.professional)
 
+    def _get_schedules(self) -> DefaultDict[int, List[Schedule]]:
+        """Get the schedules and count them."""
+        schedules = self._load_schedules()
+        self.loaded = sum(len(i) for i in schedules.values())
+        return schedules
+
+    @staticmethod
+    def _get_utc_datetime(
+        offsets: TimezoneOffsets,
+        day: int,
+        local_time: time,
+    ) -> datetime:
+        """Return the UTC datetime of the local time of the day."""
+        timestamp = offsets.get_utc_timestamp(day + local_time.hour * 3600 +
+                                              local_time.minute * 60)
+        return arrow.Arrow.utcfromtimestamp(timestamp).datetime
+
     @staticmethod
     def _combine_adjacent_slots(
-            slots: List[AvailabilitySlot]) -> List[AvailabilitySlot]:
+            slots: List[Slot]) -> List[Slot]:
         """Combine adjacent slots."""
         if not slots:
             return []
-        result: List[AvailabilitySlot] = [slots[0]]
+        result: List[Slot] = [slots[0]]
         i = 1
         while i < len(slots):
             prev = slots[i - 1]
@@ -86,10 +127,10 @@ class DefaultGenerator(AbstractGenerator):
             i += 1
         return result
 
-    def _get(self) -> List[AvailabilitySlot]:
+    def _get(self) -> List[Slot]:
         """Generate and return availability slots."""
         schedules = self._get_schedules()
-        slots: List[AvailabilitySlot] = []
+        slots: List[Slot] = []
         interval = arrow.Arrow.range(
             "day",
             self._request.start_datetime,
@@ -97,34 +138,160 @@ class DefaultGenerator(AbstractGenerator):
         )
         self._set_service()
 
+        professional_id = self._request.professional.pk
+        service_id = self._service.pk if self._service else None
+
         for current in interval:
+            day = current.timestamp
             for schedule in schedules[current.weekday()]:
-                slot = AvailabilitySlot()
-                slot.professional = self._request.professional
-                if self._service:
-                    slot.service = self._service
-                slot.start_datetime = current.replace(
-                    tzinfo=schedule.timezone,
-                    hour=schedule.start_time.hour,
-                    minute=schedule.start_time.minute,
-                ).to("UTC").datetime
-                slot.end_datetime = current.replace(
-                    tzinfo=schedule.timezone,
-                    hour=schedule.end_time.hour,
-                    minute=schedule.end_time.minute,
-                ).to("UTC").datetime
-                slots.append(slot)
+                offsets = get_timezone_offsets(schedule.timezone)
+                slots.append(
+                    Slot(
+                        professional_id,
+                        service_id,
+                        self._get_utc_datetime(offsets, day,
+                                               schedule.start_time),
+                        self._get_utc_datetime(offsets, day,
+                                               schedule.end_time),
+                    ))
         return self._combine_adjacent_slots(slots)
 
 
+class VectorizedGenerator(DefaultGenerator):
+    """The generator building the slots with numpy arrays.
+
+    The slot bounds are computed as int64 epoch seconds for the whole day
+    grid at once. The UTC offsets are looked up per day and only the days
+    around the DST transitions are converted one by one. The slots are
+    created after the adjacent ones are combined.
+    """
+
+    DAY: int = 60 * 60 * 24
+
+    @staticmethod
+    def _get_offset(timezone: str, timestamp: int) -> int:
+        """Return the UTC offset of the local timestamp in seconds."""
+        return get_timezone_offsets(timezone).get_offset(timestamp)
+
+    def _get_days_offsets(
+        self,
+        timezone: str,
+        first_day: int,
+        total: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the days offsets and the DST transition days mask.
+
+        The offsets are taken at the local midnight of the days from the
+        day before the first day to the day after the last one.
+        """
+        offsets = np.fromiter(
+            (self._get_offset(timezone, (first_day + i) * self.DAY)
+             for i in range(-1, total + 1)),
+            dtype=np.int64,
+            count=total + 2,
+        )
+        changes = offsets[1:] != offsets[:-1]
+        is_transition = changes[:-1] | changes[1:]
+        return offsets[1:-1], is_transition
+
+    def _to_utc(
+        self,
+        timezone: str,
+        days: np.ndarray,
+        seconds: int,
+        offsets: Tuple[np.ndarray, np.ndarray],
+    ) -> np.ndarray:
+        """Convert the local times of the days to the UTC timestamps."""
+        days_offsets, is_transition = offsets
+        local = days * self.DAY + seconds
+        result = local - days_offsets
+        for i in np.flatnonzero(is_transition):
+            result[i] = local[i] - self._get_offset(timezone, int(local[i]))
+        return result
+
+    def _get_bounds(
+        self,
+        schedules: DefaultDict[int, List[Schedule]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the slots bounds sorted by days and schedules."""
+        start = self._request.start_datetime
+        first_day = int(start.timestamp // self.DAY)  # type: ignore
+        total = (self._request.end_datetime - start).days + 1  # type: ignore
+        if total <= 0:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        days = np.arange(first_day, first_day + total, dtype=np.int64)
+        weekdays = (days + 3) % 7
+        timezones: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        keys, starts, ends = [], [], []
+
+        for weekday, entries in schedules.items():
+            mask = weekdays == weekday
+            for index, schedule in enumerate(entries):
+                timezone = str(schedule.timezone)
+                if timezone not in timezones:
+                    timezones[timezone] = self._get_days_offsets(
+                        timezone, first_day, total)
+                offsets = (
+                    timezones[timezone][0][mask],
+                    timezones[timezone][1][mask],
+                )
+                for bounds, local_time in ((starts, schedule.start_time),
+                                           (ends, schedule.end_time)):
+                    bounds.append(
+                        self._to_utc(
+                            timezone,
+                            days[mask],
+                            local_time.hour * 3600 + local_time.minute * 60,
+                            offsets,
+                        ))
+                keys.append((days[mask] - first_day) * 1000 + index)
+
+        if not keys:
+            return np.empty(0, np.int64), np.empty(0, np.int64)
+        order = np.argsort(np.concatenate(keys), kind="stable")
+        return np.concatenate(starts)[order], np.concatenate(ends)[order]
+
+    @staticmethod
+    def _combine_adjacent_bounds(
+        starts: np.ndarray,
+        ends: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Combine the adjacent slots bounds."""
+        if not starts.size:
+            return starts, ends
+        diff = starts[1:] - ends[:-1]
+        is_first = np.concatenate(
+            ([True], diff > settings.AVAILABILITY_MIN_SLOT_DIFF_TO_COMBINE))
+        is_last = np.concatenate((is_first[1:], [True]))
+        return starts[is_first], ends[is_last]
+
+    def _get(self) -> List[Slot]:
+        """Generate and return availability slots."""
+        self._set_service()
+        starts, ends = self._combine_adjacent_bounds(
+            *self._get_bounds(self._get_schedules()))
+        professional_id = self._request.professional.pk
+        service_id = self._service.pk if self._service else None
+        return [
+            Slot(
+                professional_id,
+                service_id,
+                arrow.Arrow.utcfromtimestamp(start).datetime,
+                arrow.Arrow.utcfromtimestamp(end).datetime,
+            ) for start, end in zip(starts.tolist(), ends.tolist())
+        ]
+
+
 class AvailabilityGenerator():
     """The availability generator."""
 
     request: Request
     generator: AbstractGenerator = DefaultGenerator()
-    saver: AbstractSaver = DeleteSaver()
+    saver: AbstractSaver = DiffSaver()
     request_processor: AbstractRequestProcessor
     logger: logging.Logger
+    metrics: AbstractMetrics = NullMetrics()
+    report: GenerationReport
     restrictions: List[AbstractRestriction] = [
         ClosedPeriodsRestriction(),
         OrderRestriction()
@@ -133,26 +300,77 @@ class AvailabilityGenerator():
     def __init__(self, request: Request):
         """Construct the object."""
         self.request = request
+        self.report = GenerationReport()
+
+    def _measure(self, stage: str, func: Callable[[], R]) -> R:
+        """Call the function and add its timing to the stage."""
+        started = perf_counter()
+        try:
+            return func()
+        finally:
+            self.report.add_timing(stage, perf_counter() - started)
 
     def _apply_restrictions(
         self,
-        slots: List[AvailabilitySlot],
-    ) -> List[AvailabilitySlot]:
+        slots: List[Slot],
+    ) -> List[Slot]:
         """Apply the restrictions."""
         for restriction in self.restrictions:
-            slots = restriction.set_request(self.request).\
-                set_slots(slots).apply()
+            slots = self._measure(
+                f"restriction.{restriction.name}",
+                restriction.set_request(self.request).set_slots(slots).apply,
+            )
+            self.report.add_counter(restriction.name, restriction.loaded)
+        return slots
+
+    def get_slots(self) -> List[Slot]:
+        """Process the request and return the restricted slots."""
+        self.request = self._measure(
+            "request",
+            lambda: self.request_processor.get(self.request),
+        )
+        slots = self._measure(
+            "generation",
+            self.generator.set_request(self.request).get,
+        )
+        self.report.add_counter("schedules", self.generator.loaded)
+        self.report.add_counter("slots_generated", len(slots))
+        slots = self._apply_restrictions(slots)
+        self.report.add_counter("slots_restricted", len(slots))
         return slots
 
-    def generate(self) -> None:
-        """Generate the availability slots."""
+    def _save(self, slots: List[Slot]) -> None:
+        """Save the slots and count the changes."""
+        self._measure(
+            "saving",
+            self.saver.set_request(self.request).set_slots(slots).save,
+        )
+        for name, value in asdict(self.saver.report).items():
+            self.report.add_counter(f"slots_{name}", value)
+
+    def generate(self) -> GenerationReport:
+        """Generate the availability slots and return the report."""
+        self.report = GenerationReport()
+        started = perf_counter()
         try:
-            self.request = self.request_processor.get(self.request)
-            slots = self.generator.set_request(self.request).get()
-            slots = self._apply_restrictions(slots)
-            self.saver.set_request(self.request).set_slots(slots).save()
+            self._save(self.get_slots())
+            self.report.add_timing("total", perf_counter() - started)
+            self.logger.info(
+                "AvailabilityGenerator report: request %s; saved %s; %s",
+                self.request,
+                self.saver.report,
+                self.report,
+                extra={"availability": asdict(self.report)},
+            )
+            self.metrics.send(
+                "availability",
+                self.report.timings,
+                self.report.counters,
+            )
+        except AvailabilityEmptyWindowError as error:
             self.logger.info(
-                "AvailabilityGenerator report: request %s",
+                "AvailabilityGenerator skipped: %s; request %s",
+                error,
                 self.request,
             )
         except AvailabilityError as error:
@@ -161,13 +379,28 @@ class AvailabilityGenerator():
                 error,
                 self.request,
             )
+        return self.report
 
 
 def get_availability_generator(request: Request) -> AvailabilityGenerator:
     """Return the availability generator."""
     generator = AvailabilityGenerator(request)
     generator.logger = logging.getLogger("d8b")
+    generator.metrics = get_metrics()
+    generator.generator = import_string(
+        get_settings("AVAILABILITY_GENERATOR_CLASS"))()
     generator.request_processor = RequestYearProcessor()
     if request.append_days:
         generator.request_processor = RequestAppendProcessor()
+    elif request.is_window:
+        generator.request_processor = RequestWindowProcessor()
+        generator.saver = WindowDiffSaver()
+    return generator
+
+
+def get_virtual_availability_generator(
+        request: Request) -> AvailabilityGenerator:
+    """Return the availability generator to compute the slots on the fly."""
+    generator = get_availability_generator(request)
+    generator.request_processor = RequestDatesProcessor()
     return generator
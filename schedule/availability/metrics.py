@@ -0,0 +1,37 @@
+"""The availability metrics module."""
+
+from dataclasses import dataclass, field
+from typing import Dict
+
+
+@dataclass
+class GenerationReport():
+    """The generation report.
+
+    The timings of the stages are in seconds.
+    """
+
+    timings: Dict[str, float] = field(default_factory=dict)
+    counters: Dict[str, int] = field(default_factory=dict)
+
+    def add_timing(self, name: str, value: float) -> None:
+        """Add the value to the stage timing."""
+        self.timings[name] = self.timings.get(name, 0.0) + value
+
+    def add_counter(self, name: str, value: int) -> None:
+        """Add the value to the counter."""
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def merge(self, other: "GenerationReport") -> None:
+        """Add the timings and the counters of the other report."""
+        for name, timing in other.timings.items():
+            self.add_timing(name, timing)
+        for name, counter in other.counters.items():
+            self.add_counter(name, counter)
+
+    def __str__(self) -> str:
+        """Return the string representation."""
+        timings = ", ".join(
+            f"{k}: {v * 1000:.1f} ms" for k, v in self.timings.items())
+        counters = ", ".join(f"{k}: {v}" for k, v in self.counters.items())
+        return f"timings: {timings}; counters: {counters}"
@@ -2,10 +2,9 @@
 
 from typing import List, TypeVar
 
-from schedule.models import AvailabilitySlot
-
 from .exceptions import AvailabilityValueError
 from .request import Request
+from .slots import Slot
 
 T = TypeVar("T", bound="RequestSlotsSetterMixin")
 
@@ -14,14 +13,14 @@ class RequestSlotsSetterMixin():
     """The a request and slots setter mixin."""
 
     _request: Request
-    _slots: List[AvailabilitySlot]
+    _slots: List[Slot]
 
     def set_request(self: T, request: Request) -> T:
         """Set a request."""
         self._request = request
         return self
 
-    def set_slots(self: T, slots: List[AvailabilitySlot]) -> T:
+    def set_slots(self: T, slots: List[Slot]) -> T:
         """Set slots."""
         self._slots = slots
         return self
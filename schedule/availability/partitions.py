@@ -0,0 +1,128 @@
+"""The availability partitions module.
+
+On PostgreSQL the availability slots table is partitioned by the month of
+the start datetime. The slots outside of the monthly partitions are stored
+in the default partition.
+"""
+
+import re
+from typing import Dict, List
+
+import arrow
+from django.conf import settings
+from django.db import connection, transaction
+
+from schedule.models import AvailabilitySlot
+
+TABLE: str = AvailabilitySlot._meta.db_table
+DEFAULT_PARTITION: str = f"{TABLE}_default"
+PARTITION_RE = re.compile(rf"^{TABLE}_p(\d{{4}})(\d{{2}})$")
+
+
+def get_partition_name(month: arrow.Arrow) -> str:
+    """Return the name of the month partition."""
+    return f"{TABLE}_p{month.format('YYYYMM')}"
+
+
+def is_partitioned() -> bool:
+    """Check if the slots table is partitioned."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def get_partitions() -> Dict[str, arrow.Arrow]:
+    """Return the months of the monthly partitions by the names."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid "
+            "JOIN pg_class p ON p.oid = i.inhparent WHERE p.relname = %s",
+            [TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+    result: Dict[str, arrow.Arrow] = {}
+    for name in names:
+        match = PARTITION_RE.match(name)
+        if match:
+            result[name] = arrow.Arrow(
+                int(match.group(1)),
+                int(match.group(2)),
+                1,
+            )
+    return result
+
+
+def create_partition(month: arrow.Arrow) -> str:
+    """Create the month partition.
+
+    The rows of the month are moved from the default partition before the
+    new one is attached.
+    """
+    name = get_partition_name(month)
+    start = month.floor("month").datetime
+    end = month.floor("month").shift(months=1).datetime
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            "WHERE start_datetime >= %s AND start_datetime < %s "
+            f"RETURNING *) INSERT INTO {name} SELECT * FROM moved",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {name} "
+            "FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+    return name
+
+
+def create_upcoming_partitions() -> List[str]:
+    """Create the missing partitions of the upcoming months."""
+    existing = get_partitions()
+    month = arrow.utcnow().floor("month")
+    created: List[str] = []
+    for i in range(settings.AVAILABILITY_PARTITIONS_AHEAD + 1):
+        current = month.shift(months=i)
+        if get_partition_name(current) not in existing:
+            created.append(create_partition(current))
+    return created
+
+
+def drop_expired_partitions() -> List[str]:
+    """Detach and drop the partitions containing the expired slots only."""
+    today = arrow.utcnow().floor("day")
+    dropped: List[str] = []
+    for name, month in sorted(get_partitions().items(), key=lambda i: i[1]):
+        if month.shift(months=1) > today:
+            continue
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+            cursor.execute(
+                f"SELECT 1 FROM {name} WHERE end_datetime >= %s LIMIT 1",
+                [today.datetime],
+            )
+            if cursor.fetchone():
+                transaction.set_rollback(True)
+                continue
+            cursor.execute(f"DROP TABLE {name}")
+        dropped.append(name)
+    return dropped
+
+
+def maintain_partitions() -> Dict[str, List[str]]:
+    """Create the upcoming partitions and drop the expired ones."""
+    if not is_partitioned():
+        return {"created": [], "dropped": []}
+    return {
+        "created": create_upcoming_partitions(),
+        "dropped": drop_expired_partitions(),
+    }
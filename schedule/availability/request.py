@@ -1,15 +1,20 @@
 """The availability request module."""
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import arrow
 from django.conf import settings
+from django.db.models import Max, Min
 
 from professionals.models import Professional
+from schedule.models import AvailabilitySlot
 from services.models import Service
 
-from .exceptions import AvailabilityValueError
+from .exceptions import AvailabilityEmptyWindowError, AvailabilityValueError
+
+if TYPE_CHECKING:
+    from .context import GenerationContext
 
 
 class Request():
@@ -18,8 +23,18 @@ class Request():
     professional: Professional
     service: Optional[Service] = None
     append_days: bool = False
+    is_window: bool = False
     start_datetime: Optional[arrow.Arrow] = None
     end_datetime: Optional[arrow.Arrow] = None
+    window_start_datetime: Optional[arrow.Arrow] = None
+    window_end_datetime: Optional[arrow.Arrow] = None
+    context: Optional["GenerationContext"] = None
+
+    def get_context(self) -> Optional["GenerationContext"]:
+        """Return the context if it contains the request data."""
+        if self.context and self.context.is_covering(self):
+            return self.context
+        return None
 
     def __str__(self) -> str:
         """Return the string representation."""
@@ -90,8 +105,8 @@ class AbstractRequestProcessor(ABC):
     def get(self, request: Request) -> Request:
         """Transform and prepare a request."""
         self._request = request
-        self._set_dates_and_reset_to_midnight()
         self._set_professional()
+        self._set_dates_and_reset_to_midnight()
         self.validator.validate(self._request)
         return self._request
 
@@ -136,3 +151,88 @@ class RequestYearProcessor(AbstractRequestProcessor):
                 second=0,
                 microsecond=0,
             ).shift(years=1)
+
+
+class RequestWindowProcessor(AbstractRequestProcessor):
+    """The request processor to regenerate slots within a window."""
+
+    @staticmethod
+    def _get_year_bounds() -> Tuple[arrow.Arrow, arrow.Arrow]:
+        """Return the bounds of the generation year."""
+        today = arrow.utcnow().replace(
+            hour=0,
+            minute=0,
+            second=0,
+            microsecond=0,
+        )
+        return today, today.shift(years=1)
+
+    def _extend_window_to_slots(
+        self,
+        start: arrow.Arrow,
+        end: arrow.Arrow,
+    ) -> Tuple[arrow.Arrow, arrow.Arrow]:
+        """Extend the window to cover the existing overlapping slots."""
+        bounds = AvailabilitySlot.objects.get_between_dates(
+            start=start,
+            end=end,
+            professional=self._request.professional,
+            service=self._request.service,
+        ).aggregate(
+            start=Min("start_datetime"),
+            end=Max("end_datetime"),
+        )
+        if bounds["start"]:
+            start = min(start, arrow.get(bounds["start"]))
+        if bounds["end"]:
+            end = max(end, arrow.get(bounds["end"]))
+        return start, end
+
+    def _set_window(self) -> None:
+        """Set the request window."""
+        year_start, year_end = self._get_year_bounds()
+        start = max(self._request.start_datetime or year_start, year_start)
+        end = min(self._request.end_datetime or year_end, year_end)
+        if start > end:
+            raise AvailabilityEmptyWindowError(
+                "The request window is outside of the generation period")
+        start, end = self._extend_window_to_slots(start, end)
+        self._request.window_start_datetime = start
+        self._request.window_end_datetime = end
+
+    def _set_dates(self) -> None:
+        """Set the request dates."""
+        self._set_window()
+        year_start, year_end = self._get_year_bounds()
+        margin = settings.AVAILABILITY_WINDOW_MARGIN_DAYS
+        self._request.start_datetime = max(
+            self._request.window_start_datetime.shift(  # type: ignore
+                days=-margin),
+            year_start,
+        )
+        self._request.end_datetime = min(
+            self._request.window_end_datetime.shift(  # type: ignore
+                days=margin),
+            year_end,
+        )
+
+
+class RequestDatesProcessor(RequestWindowProcessor):
+    """The request processor to compute slots for the given dates.
+
+    The dates are clamped to the generation year and padded with the margin
+    days to get the slots of the schedules crossing the day bounds.
+    """
+
+    def _set_dates(self) -> None:
+        """Set the request dates."""
+        year_start, year_end = self._get_year_bounds()
+        start = max(self._request.start_datetime or year_start, year_start)
+        end = min(self._request.end_datetime or year_end, year_end)
+        if start > end:
+            raise AvailabilityEmptyWindowError(
+                "The request dates are outside of the generation period")
+        margin = settings.AVAILABILITY_WINDOW_MARGIN_DAYS
+        self._request.start_datetime = max(start.shift(days=-margin),
+                                           year_start)
+        self._request.end_datetime = min(end.shift(days=margin), year_end)
@@ -1,14 +1,17 @@
 """The restrictions db module."""
 
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from copy import copy
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from orders.models import Order
-from schedule.models import (AbstractPeriod, AvailabilitySlot, ClosedPeriod,
+from schedule.models import (AbstractPeriod, ClosedPeriod,
                              ProfessionalClosedPeriod, ServiceClosedPeriod)
 
 from .mixins import RequestSlotsSetterMixin
+from .slots import Slot
 
 
 class AbstractSlotsModifier(ABC):
@@ -17,22 +20,32 @@ class AbstractSlotsModifier(ABC):
     @abstractmethod
     def get_processed_slots(
         self,
-        slots: List[AvailabilitySlot],
+        slots: List[Slot],
         period: AbstractPeriod,
-    ) -> List[AvailabilitySlot]:
+    ) -> List[Slot]:
         """Return the processed slots."""
 
+    def get_slots_without_periods(
+        self,
+        slots: List[Slot],
+        periods: Sequence[AbstractPeriod],
+    ) -> List[Slot]:
+        """Subtract the periods from the slots."""
+        for period in periods:
+            slots = self.get_processed_slots(slots, period)
+        return slots
+
 
 class SlotsModifier(AbstractSlotsModifier):
     """The default slots modifier."""
 
     def get_processed_slots(
         self,
-        slots: List[AvailabilitySlot],
+        slots: List[Slot],
         period: AbstractPeriod,
-    ) -> List[AvailabilitySlot]:
+    ) -> List[Slot]:
         """Check the slot against the period."""
-        processed_slots: List[AvailabilitySlot] = []
+        processed_slots: List[Slot] = []
         for slot in slots:
             # the period overlaps the entire slot
             if period.start_datetime <= slot.start_datetime and \
@@ -56,13 +69,11 @@ class SlotsModifier(AbstractSlotsModifier):
 
                 # split the slot into two slots
                 else:
-                    tail = deepcopy(slot)
-                    tail.pk = None
+                    tail = copy(slot)
                     tail.end_datetime = period.start_datetime
                     processed_slots.append(tail)
 
-                    head = deepcopy(slot)
-                    head.pk = None
+                    head = copy(slot)
                     head.start_datetime = period.end_datetime
                     processed_slots.append(head)
 
@@ -72,18 +83,113 @@ class SlotsModifier(AbstractSlotsModifier):
         return processed_slots
 
 
+class SweepLineSlotsModifier(AbstractSlotsModifier):
+    """The slots modifier subtracting all the periods in a single pass.
+
+    The periods are sorted and merged once, then every slot is cut by the
+    merged periods it overlaps, found by a binary search. The result is
+    the same as applying the SlotsModifier to every period in turn.
+    """
+
+    @staticmethod
+    def _merge_periods(
+        periods: Sequence[AbstractPeriod],
+    ) -> List[Tuple[datetime, datetime]]:
+        """Sort and merge the overlapping periods."""
+        merged: List[Tuple[datetime, datetime]] = []
+        bounds = sorted((p.start_datetime, p.end_datetime) for p in periods)
+        for start, end in bounds:
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+                continue
+            merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def _get_piece(
+        slot: Slot,
+        start: datetime,
+        end: datetime,
+        is_first: bool,
+    ) -> Slot:
+        """Return the piece of the slot."""
+        piece = slot if is_first else copy(slot)
+        piece.start_datetime = start
+        piece.end_datetime = end
+        return piece
+
+    def _subtract(
+        self,
+        slot: Slot,
+        merged: List[Tuple[datetime, datetime]],
+        ends: List[datetime],
+    ) -> List[Slot]:
+        """Subtract the merged periods from the slot."""
+        slot_start, slot_end = slot.start_datetime, slot.end_datetime
+        if slot_start == slot_end:
+            index = bisect_left(ends, slot_start)
+            is_covered = index < len(merged) and \
+                merged[index][0] <= slot_start
+            return [] if is_covered else [slot]
+        index = bisect_right(ends, slot_start)
+        if index == len(merged) or merged[index][0] >= slot_end:
+            return [slot]
+        pieces: List[Slot] = []
+        cursor = slot_start
+        while index < len(merged) and merged[index][0] < slot_end:
+            start, end = merged[index]
+            if start > cursor:
+                pieces.append(
+                    self._get_piece(slot, cursor, start, not pieces))
+            cursor = max(cursor, end)
+            index += 1
+        if cursor < slot_end:
+            pieces.append(self._get_piece(slot, cursor, slot_end, not pieces))
+        return pieces
+
+    def get_processed_slots(
+        self,
+        slots: List[Slot],
+        period: AbstractPeriod,
+    ) -> List[Slot]:
+        """Check the slot against the period."""
+        return self.get_slots_without_periods(slots, [period])
+
+    def get_slots_without_periods(
+        self,
+        slots: List[Slot],
+        periods: Sequence[AbstractPeriod],
+    ) -> List[Slot]:
+        """Subtract the periods from the slots."""
+        if not periods:
+            return list(slots)
+        merged = self._merge_periods(periods)
+        ends = [end for _, end in merged]
+        processed_slots: List[Slot] = []
+        for slot in slots:
+            processed_slots.extend(self._subtract(slot, merged, ends))
+        return processed_slots
+
+
 class AbstractRestriction(ABC, RequestSlotsSetterMixin):
     """The abstract restriction."""
 
-    _slots_modifier: AbstractSlotsModifier = SlotsModifier()
+    _slots_modifier: AbstractSlotsModifier = SweepLineSlotsModifier()
+
+    name: str = "restriction"
+
+    # the number of the periods loaded by the last call
+    loaded: int = 0
 
     @abstractmethod
-    def _apply(self) -> List[AvailabilitySlot]:
+    def _apply(self) -> List[Slot]:
         """Apply the restriction to the availability slots."""
 
-    def apply(self) -> List[AvailabilitySlot]:
+    def apply(self) -> List[Slot]:
         """Apply the restriction to the availability slots."""
         self._check_request()
+        self.loaded = 0
         if not self._slots:
             return []
         return self._apply()
@@ -92,21 +198,35 @@ class AbstractRestriction(ABC, RequestSlotsSetterMixin):
 class ClosedPeriodsRestriction(AbstractRestriction):
     """The closed period restriction."""
 
+    name: str = "closed_periods"
+
     professionals_periods: Optional[List[ClosedPeriod]] = None
     service_periods: Optional[List[ClosedPeriod]] = None
 
     def _get_closed_periods_for_slot(
         self,
-        slot: AvailabilitySlot,
+        slot: Slot,
     ) -> List[ClosedPeriod]:
-        """Get the closed periods for the provided slot."""
-        if slot.service and not slot.service.is_base_schedule:
+        """Get the closed periods for the provided slot.
+
+        The service slots belong to the request service.
+        """
+        service = self._request.service \
+            if slot.service_id and self._request.service and \
+            not self._request.service.is_base_schedule else None
+        context = self._request.get_context()
+        if context:
+            return context.get_closed_periods(
+                self._request.professional,
+                service,
+            )
+        if service:
             if self.service_periods is None:
                 self.service_periods = list(
                     ServiceClosedPeriod.objects.get_between_dates(
                         self._request.start_datetime,
                         self._request.end_datetime,
-                        slot.service,
+                        service,
                     ))
             periods = self.service_periods
         else:
@@ -115,32 +235,55 @@ class ClosedPeriodsRestriction(AbstractRestriction):
                     ProfessionalClosedPeriod.objects.get_between_dates(
                         self._request.start_datetime,
                         self._request.end_datetime,
-                        slot.professional,
+                        self._request.professional,
                     ))
             periods = self.professionals_periods
         return periods
 
-    def _apply(self) -> List[AvailabilitySlot]:
+    def _apply(self) -> List[Slot]:
         """Apply the restriction to the availability slots."""
-        processed_slots: List[AvailabilitySlot] = []
+        processed_slots: List[Slot] = []
         self.professionals_periods = None
         self.service_periods = None
 
+        batch: List[Slot] = []
+        batch_periods: Optional[List[ClosedPeriod]] = None
+
+        loaded: Dict[int, int] = {}
+
         for slot in self._slots:
-            slots = [slot]
-            for period in self._get_closed_periods_for_slot(slot):
-                slots = self._slots_modifier.get_processed_slots(slots, period)
-            processed_slots.extend(slots)
+            periods = self._get_closed_periods_for_slot(slot)
+            loaded[id(periods)] = len(periods)
+            if batch and periods is not batch_periods:
+                processed_slots.extend(
+                    self._slots_modifier.get_slots_without_periods(
+                        batch, batch_periods))  # type: ignore
+                batch = []
+            batch.append(slot)
+            batch_periods = periods
+        if batch:
+            processed_slots.extend(
+                self._slots_modifier.get_slots_without_periods(
+                    batch, batch_periods))  # type: ignore
+        self.loaded = sum(loaded.values())
         return processed_slots
 
 
 class OrderRestriction(AbstractRestriction):
     """The order restriction."""
 
+    name: str = "orders"
+
     orders: Optional[List[Order]] = None
 
     def _get_orders(self) -> List[Order]:
         """Get the orders."""
+        context = self._request.get_context()
+        if self.orders is None and context:
+            self.orders = context.get_orders(
+                self._request.professional,
+                self._request.service,
+            )
         if self.orders is None:
             self.orders = list(
                 Order.objects.get_between_dates(
@@ -154,14 +297,12 @@ class OrderRestriction(AbstractRestriction):
                 )))
         return self.orders
 
-    def _apply(self) -> List[AvailabilitySlot]:
+    def _apply(self) -> List[Slot]:
         """Apply the restriction to the availability slots."""
-        processed_slots: List[AvailabilitySlot] = []
         self.orders = None
-
-        for slot in self._slots:
-            slots = [slot]
-            for period in self._get_orders():
-                slots = self._slots_modifier.get_processed_slots(slots, period)
-            processed_slots.extend(slots)
-        return processed_slots
+        orders = self._get_orders()
+        self.loaded = len(orders)
+        return self._slots_modifier.get_slots_without_periods(
+            self._slots,
+            orders,
+        )
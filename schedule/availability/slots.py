@@ -0,0 +1,80 @@
+"""The availability slots module."""
+
+from datetime import datetime
+from typing import Optional
+
+from schedule.models import AvailabilitySlot
+
+
+class Slot():
+    """The lightweight availability slot used during the generation.
+
+    The slots are converted to the model instances by the savers only.
+    """
+
+    __slots__ = (
+        "professional_id",
+        "service_id",
+        "start_datetime",
+        "end_datetime",
+    )
+
+    professional_id: int
+    service_id: Optional[int]
+    start_datetime: datetime
+    end_datetime: datetime
+
+    def __init__(
+        self,
+        professional_id: int,
+        service_id: Optional[int],
+        start_datetime: datetime,
+        end_datetime: datetime,
+    ):
+        """Construct the object."""
+        self.professional_id = professional_id
+        self.service_id = service_id
+        self.start_datetime = start_datetime
+        self.end_datetime = end_datetime
+
+    @classmethod
+    def from_model(cls, slot: AvailabilitySlot) -> "Slot":
+        """Create the slot from the model instance."""
+        return cls(
+            slot.professional_id,
+            slot.service_id,
+            slot.start_datetime,
+            slot.end_datetime,
+        )
+
+    def to_model(self) -> AvailabilitySlot:
+        """Return the model instance."""
+        return AvailabilitySlot(
+            professional_id=self.professional_id,
+            service_id=self.service_id,
+            start_datetime=self.start_datetime,
+            end_datetime=self.end_datetime,
+        )
+
+    def __copy__(self) -> "Slot":
+        """Return the copy of the slot."""
+        return Slot(
+            self.professional_id,
+            self.service_id,
+            self.start_datetime,
+            self.end_datetime,
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the slots by the values."""
+        if not isinstance(other, Slot):
+            return NotImplemented
+        return (self.professional_id == other.professional_id and
+                self.service_id == other.service_id and
+                self.start_datetime == other.start_datetime and
+                self.end_datetime == other.end_datetime)
+
+    def __repr__(self) -> str:
+        """Return the string representation."""
+        return (f"Slot({self.professional_id}, {self.service_id}, "
+                f"{self.start_datetime}, {self.end_datetime})")
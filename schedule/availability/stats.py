@@ -0,0 +1,101 @@
+"""The availability stats module.
+
+The nearest availability and the available minutes in the upcoming days are
+denormalized to the professionals and the services, so the lists can be
+filtered and ordered by them without joining the slots.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import arrow
+from django.conf import settings
+
+from professionals.models import Professional
+from schedule.models import AvailabilitySlot
+from services.models import Service
+
+Stats = Tuple[Optional[datetime], int]
+StatsKey = Tuple[int, Optional[int]]
+
+EMPTY_STATS: Stats = (None, 0)
+
+
+def get_availability_stats(
+        professional_ids: List[int]) -> Dict[StatsKey, Stats]:
+    """Return the stats by the professionals and the services ids.
+
+    The current time is floored to the minute, so the available minutes are
+    stable within it.
+    """
+    start = arrow.utcnow().floor("minute")
+    end = start.shift(days=settings.AVAILABILITY_STATS_DAYS)
+    result: Dict[StatsKey, Stats] = {}
+    for row in AvailabilitySlot.objects.get_availability_stats(
+            professional_ids, start, end):
+        available: Optional[timedelta] = row["available"]
+        minutes = int(available.total_seconds() // 60) if available else 0
+        result[(row["professional_id"], row["service_id"])] = (
+            row["next_available_at"],
+            minutes,
+        )
+    return result
+
+
+def _set_stats(entry, stats: Stats) -> bool:
+    """Set the stats to the entry and return whether it has changed."""
+    if (entry.next_available_at, entry.available_minutes) == stats:
+        return False
+    entry.next_available_at, entry.available_minutes = stats
+    return True
+
+
+def update_availability_stats(professional_ids: Iterable[int]) -> int:
+    """Update the stats of the professionals and their services.
+
+    The base schedule services get the stats of the professionals. Only the
+    changed entries are updated. Return the number of the updated entries.
+    """
+    ids = list(professional_ids)
+    if not ids:
+        return 0
+    stats = get_availability_stats(ids)
+    fields = ("next_available_at", "available_minutes")
+
+    professionals = [
+        p for p in Professional.objects.filter(pk__in=ids).only("pk", *fields)
+        if _set_stats(p, stats.get((p.pk, None), EMPTY_STATS))
+    ]
+    services = [
+        s for s in Service.objects.filter(professional_id__in=ids).only(
+            "pk", "professional_id", "is_base_schedule", *fields)
+        if _set_stats(
+            s,
+            stats.get(
+                (s.professional_id, None if s.is_base_schedule else s.pk),
+                EMPTY_STATS,
+            ),
+        )
+    ]
+    Professional.objects.bulk_update(professionals, fields)
+    Service.objects.bulk_update(services, fields)
+    return len(professionals) + len(services)
+
+
+def refresh_availability_stats() -> int:
+    """Refresh the stats of the professionals as the time passes.
+
+    The professionals with the nearest availability of their own or of the
+    services are refreshed only, since the stats of the others are changed
+    by the savers.
+    """
+    size = settings.AVAILABILITY_GENERATION_CHUNK_SIZE
+    ids = set(
+        Professional.objects.filter(
+            next_available_at__isnull=False).values_list("pk", flat=True))
+    ids.update(
+        Service.objects.filter(next_available_at__isnull=False).values_list(
+            "professional_id", flat=True))
+    ordered_ids = sorted(ids)
+    return sum(
+        update_availability_stats(ordered_ids[i:i + size])
+        for i in range(0, len(ordered_ids), size))
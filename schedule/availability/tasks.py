@@ -1,10 +1,19 @@
 """The communication tasks module."""
+import logging
+from typing import Dict, List
+
+from celery import chord
+from django.conf import settings
+
 from d8b.celery import app
 from professionals.models import Professional
 from services.models import Service
 
-from .utils import (delete_expired_availability_slots,
-                    generate_for_professional, generate_for_service)
+from .deferred import generate_deferred
+from .partitions import maintain_partitions
+from .stats import refresh_availability_stats
+from .utils import (delete_expired_availability_slots, generate_for_chunk,
+                    get_chunks)
 
 
 @app.task
@@ -13,14 +22,73 @@ def remove_expired_availability_slots_task():
     delete_expired_availability_slots()
 
 
+@app.task
+def maintain_availability_slots_partitions_task() -> Dict[str, List[str]]:
+    """Create the upcoming slots partitions and drop the expired ones."""
+    return maintain_partitions()
+
+
+@app.task
+def refresh_availability_stats_task() -> int:
+    """Refresh the availability stats of the professionals."""
+    return refresh_availability_stats()
+
+
+@app.task
+def generate_deferred_availability_slots_task() -> int:
+    """Generate the availability slots for the recorded markers."""
+    return generate_deferred()
+
+
 @app.task(soft_time_limit=60 * 30)
+def generate_availability_slots_chunk_task(
+    professional_ids: List[int],
+    service_ids: List[int],
+) -> Dict[str, float]:
+    """Generate future availability slots for the chunk.
+
+    The counters and the timings of the generation report are added to the
+    summary, so the result remains serializable.
+    """
+    summary = generate_for_chunk(
+        professional_ids=professional_ids,
+        service_ids=service_ids,
+        append_days=True,
+    )
+    report = summary.pop("report")
+    summary.update(report.counters)
+    summary.update({f"{k}_seconds": v for k, v in report.timings.items()})
+    return summary
+
+
+@app.task
+def generate_availability_slots_summary_task(
+        results: List[Dict[str, float]]) -> Dict[str, float]:
+    """Record the summary of the availability slots generation."""
+    summary = {"chunks": len(results)}
+    for result in results:
+        for key, value in result.items():
+            summary[key] = summary.get(key, 0) + value
+    logging.getLogger("d8b").info(
+        "Future availability slots generation summary: %s",
+        summary,
+    )
+    return summary
+
+
+@app.task
 def generate_future_availability_slots_task():
     """Generate future availability slots."""
+    size = settings.AVAILABILITY_GENERATION_CHUNK_SIZE
     professionals = Professional.objects.get_for_avaliability_generation()
     services = Service.objects.get_for_avaliability_generation()
-
-    for professional in professionals.iterator():
-        generate_for_professional(professional=professional, append_days=True)
-
-    for service in services.iterator():
-        generate_for_service(service=service, append_days=True)
+    tasks = [
+        generate_availability_slots_chunk_task.s(ids, [])
+        for ids in get_chunks(list(professionals.values_list("pk", flat=True)),
+                              size)
+    ]
+    tasks.extend(
+        generate_availability_slots_chunk_task.s([], ids) for ids in
+        get_chunks(list(services.values_list("pk", flat=True)), size))
+    if tasks:
+        chord(tasks)(generate_availability_slots_summary_task.s())
@@ -1,71 +1,346 @@
 """The availability utils module."""
 
-from typing import TYPE_CHECKING, Optional
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 import arrow
+from django.conf import settings
+from django.db import transaction
 
 from d8b.lock import distributed_lock
+from d8b.purge import PurgeReport, Purger
+from professionals.models import Professional
 from schedule.models import AvailabilitySlot
+from services.models import Service
 
+from .context import GenerationContext, get_generation_context
 from .generator import get_availability_generator
+from .metrics import GenerationReport
+from .partitions import drop_expired_partitions, is_partitioned
 from .request import Request
+from .stats import update_availability_stats
 
 if TYPE_CHECKING:
     from orders.models import Order
-    from professionals.models import Professional
-    from services.models import Service
+    from schedule.models import AbstractPeriod
 
 
-def delete_expired_availability_slots():
-    """Delete expired availability slots."""
-    AvailabilitySlot.objects.get_expired_entries().delete()
+# the contending requests are coalesced into the full regeneration
+RERUN_KWARGS = {
+    "append_days": False,
+    "is_window": False,
+    "start": None,
+    "end": None,
+}
+
+
+def get_period_window(
+        period: "AbstractPeriod") -> Tuple[arrow.Arrow, arrow.Arrow]:
+    """Return the window affected by the period and its initial values."""
+    dates = [period.start_datetime, period.end_datetime]
+    if period.initial_period:
+        dates.extend(period.initial_period)
+    return arrow.get(min(dates)), arrow.get(max(dates))
+
+
+def get_chunks(ids: List[int], size: int) -> List[List[int]]:
+    """Split the ids into the chunks of the size."""
+    return [ids[i:i + size] for i in range(0, len(ids), size)]
+
+
+def delete_expired_availability_slots() -> PurgeReport:
+    """Delete expired availability slots.
+
+    The expired partitions are dropped and the rest of the expired slots
+    are deleted in batches.
+    """
+    if is_partitioned():
+        drop_expired_partitions()
+    return Purger(AvailabilitySlot._meta.label).purge()
+
+
+def _generate(
+    *,
+    professional: "Professional",
+    service: Optional["Service"] = None,
+    append_days: bool = False,
+    is_window: bool = False,
+    start: Optional[arrow.Arrow] = None,
+    end: Optional[arrow.Arrow] = None,
+    context: Optional[GenerationContext] = None,
+) -> GenerationReport:
+    """Generate the slots for the professional or the service."""
+    request = Request()
+    request.context = context
+    request.start_datetime = start
+    request.end_datetime = end
+    request.professional = professional
+    request.service = service
+    request.append_days = append_days
+    request.is_window = is_window
+    return get_availability_generator(request).generate()
+
+
+def _generate_with_services(
+    *,
+    professional: "Professional",
+    services: Optional[List["Service"]] = None,
+    append_days: bool = False,
+    is_window: bool = False,
+    start: Optional[arrow.Arrow] = None,
+    end: Optional[arrow.Arrow] = None,
+) -> GenerationReport:
+    """Generate slots for the professional and the services together.
+
+    The schedules, the closed periods and the orders are loaded once for
+    all of them and the slots are saved in one transaction. The services
+    with the own schedules of the professional are generated by default.
+    The services are generated under the professional and the service
+    locks. The window context is loaded for the window padded with the
+    margin days. The availability stats are updated once at the end.
+    """
+    if services is None:
+        services = list(Service.objects.get_for_avaliability_generation().
+                        filter(professional=professional))
+    if is_window and start and end:
+        margin = settings.AVAILABILITY_WINDOW_MARGIN_DAYS
+        start_context: Optional[arrow.Arrow] = start.shift(days=-margin)
+        end_context: Optional[arrow.Arrow] = end.shift(days=margin)
+    else:
+        start_context = None if is_window else start
+        end_context = None if is_window else end
+    context = get_generation_context(
+        [professional.pk],
+        append_days=append_days,
+        start=start_context,
+        end=end_context,
+    )
+    kwargs = {
+        "append_days": append_days,
+        "is_window": is_window,
+        "start": start,
+        "end": end,
+        "context": context,
+    }
+    report = GenerationReport()
+    with transaction.atomic():
+        report.merge(_generate(professional=professional, **kwargs))
+        for service in services:
+            if service.is_base_schedule:
+                continue
+            service.professional = professional
+            service_report = generate_for_service(
+                service=service,
+                update_stats=False,
+                **kwargs,
+            )
+            if service_report:
+                report.merge(service_report)
+    update_availability_stats([professional.pk])
+    return report
+
+
+def _regenerate_professional(
+    *,
+    professional: "Professional",
+    **kwargs,
+) -> GenerationReport:
+    """Regenerate slots for the professional and the services for the year.
+
+    The coalesced reruns of the professional lock run it, so the contending
+    plain and combined generations are both covered.
+    """
+    # pylint: disable=unused-argument
+    return _generate_with_services(professional=professional)
 
 
 @distributed_lock(
     prefix="generate_for_professional",
     keys=["professional"],
     timeout=60 * 5,
+    coalesce=True,
+    rerun_kwargs=RERUN_KWARGS,
+    rerun_func=_regenerate_professional,
 )
 def generate_for_professional(
     *,
     professional: "Professional",
     append_days: bool = False,
+    is_window: bool = False,
     start: Optional[arrow.Arrow] = None,
     end: Optional[arrow.Arrow] = None,
-):
-    """Generate slots form the professional for the year."""
-    request = Request()
-    request.start_datetime = start
-    request.end_datetime = end
-    request.professional = professional
-    request.append_days = append_days
-    get_availability_generator(request).generate()
+    context: Optional[GenerationContext] = None,
+    update_stats: bool = True,
+) -> Optional[GenerationReport]:
+    """Generate slots form the professional for the year.
+
+    None is returned if the generation is already running. The running one
+    is repeated for the whole year with all the services then. The
+    availability stats are updated unless the caller updates them for many
+    entities at once.
+    """
+    report = _generate(
+        professional=professional,
+        append_days=append_days,
+        is_window=is_window,
+        start=start,
+        end=end,
+        context=context,
+    )
+    if update_stats:
+        update_availability_stats([professional.pk])
+    return report
 
 
 @distributed_lock(
     prefix="generate_for_professional",
     keys=["service"],
     timeout=60 * 5,
+    coalesce=True,
+    rerun_kwargs=RERUN_KWARGS,
 )
 def generate_for_service(
     *,
     service: "Service",
     append_days: bool = False,
+    is_window: bool = False,
     start: Optional[arrow.Arrow] = None,
     end: Optional[arrow.Arrow] = None,
-):
-    """Generate slots form the professional for the year."""
-    request = Request()
-    request.start_datetime = start
-    request.end_datetime = end
-    request.professional = service.professional
-    request.service = service
-    request.append_days = append_days
-    get_availability_generator(request).generate()
+    context: Optional[GenerationContext] = None,
+    update_stats: bool = True,
+) -> Optional[GenerationReport]:
+    """Generate slots form the professional for the year.
+
+    None is returned if the generation is already running. The running one
+    is repeated for the whole year then. The availability stats are updated
+    unless the caller updates them for many entities at once.
+    """
+    report = _generate(
+        professional=service.professional,
+        service=service,
+        append_days=append_days,
+        is_window=is_window,
+        start=start,
+        end=end,
+        context=context,
+    )
+    if update_stats:
+        update_availability_stats([service.professional_id])
+    return report
+
+
+@distributed_lock(
+    prefix="generate_for_professional",
+    keys=["professional"],
+    timeout=60 * 5,
+    coalesce=True,
+    rerun_kwargs=RERUN_KWARGS,
+    rerun_func=_regenerate_professional,
+)
+def generate_for_professional_with_services(
+    *,
+    professional: "Professional",
+    services: Optional[List["Service"]] = None,
+    append_days: bool = False,
+    is_window: bool = False,
+    start: Optional[arrow.Arrow] = None,
+    end: Optional[arrow.Arrow] = None,
+) -> Optional[GenerationReport]:
+    """Generate slots for the professional and the services together.
+
+    None is returned if the generation is already running. The running one
+    is repeated for the whole year with all the services then.
+    """
+    return _generate_with_services(
+        professional=professional,
+        services=services,
+        append_days=append_days,
+        is_window=is_window,
+        start=start,
+        end=end,
+    )
 
 
 def generate_for_order(order: "Order"):
-    """Generate slots form the order for the year."""
-    generate_for_professional(professional=order.service.professional)
-    if not order.service.is_base_schedule:
-        generate_for_service(service=order.service)
+    """Generate slots form the order within the order window."""
+    start, end = get_period_window(order)
+    generate_for_professional_with_services(
+        professional=order.service.professional,
+        services=[order.service],
+        is_window=True,
+        start=start,
+        end=end,
+    )
+
+
+def _generate_safely(func, summary: Dict[str, Any], name: str, **kwargs):
+    """Run the generation function and count the result."""
+    try:
+        report = func(**kwargs)
+        summary[name] += 1
+        if report:
+            summary["report"].merge(report)
+    except Exception:  # pylint: disable=broad-except
+        summary["errors"] += 1
+        logging.getLogger("d8b").exception(
+            "Availability generation error: %s %s",
+            name,
+            {k: v for k, v in kwargs.items() if k != "context"},
+        )
+
+
+def generate_for_chunk(
+    *,
+    professional_ids: List[int],
+    service_ids: List[int],
+    append_days: bool = False,
+    start: Optional[arrow.Arrow] = None,
+    end: Optional[arrow.Arrow] = None,
+) -> Dict[str, Any]:
+    """Generate slots for the chunk of the professionals and services.
+
+    The generation data is prefetched for the whole chunk. An error of an
+    entry is logged and doesn't stop the chunk. The generation reports of
+    the entries are merged into the summary report. The availability stats
+    are updated once for the chunk.
+    """
+    summary: Dict[str, Any] = {
+        "professionals": 0,
+        "services": 0,
+        "errors": 0,
+        "report": GenerationReport(),
+    }
+    kwargs = {"append_days": append_days, "start": start, "end": end}
+    professionals = Professional.objects.none()
+    services = Service.objects.none()
+    if professional_ids:
+        professionals = Professional.objects.\
+            get_for_avaliability_generation(professional_ids)
+    if service_ids:
+        services = Service.objects.\
+            get_for_avaliability_generation(service_ids)
+    ids = list(professionals.values_list("pk", flat=True)) + \
+        list(services.values_list("professional_id", flat=True))
+    context = get_generation_context(ids, **kwargs)
+    for professional in professionals.iterator():
+        _generate_safely(
+            generate_for_professional,
+            summary,
+            "professionals",
+            professional=professional,
+            context=context,
+            update_stats=False,
+            **kwargs,
+        )
+    for service in services.iterator():
+        _generate_safely(
+            generate_for_service,
+            summary,
+            "services",
+            service=service,
+            context=context,
+            update_stats=False,
+            **kwargs,
+        )
+    update_availability_stats(sorted(set(ids)))
+    return summary
@@ -0,0 +1,49 @@
+"""The availability versions module.
+
+The version of the professional availability is a Redis counter incremented
+every time the slots of the professional or its services are saved. The
+version is a part of the cache keys of the data computed from the slots, so
+the stale entries are never read and expire by themselves.
+"""
+from time import time_ns
+from typing import List
+
+from d8b.redis import redis
+
+PREFIX: str = "availability_version"
+
+
+def _get_key(professional_id: int) -> str:
+    """Return the key of the professional version."""
+    return f"{PREFIX}:{professional_id}"
+
+
+def get_version(professional_id: int) -> int:
+    """Return the availability version of the professional.
+
+    The missing counter starts from the current time, so the versions are
+    not reused after the counters are lost.
+    """
+    key = _get_key(professional_id)
+    version = redis.get(key)
+    if version is None:
+        redis.set(key, time_ns(), nx=True)
+        version = redis.get(key)
+    return int(version)
+
+
+def get_versions(professional_ids: List[int]) -> List[int]:
+    """Return the availability versions of the professionals."""
+    versions = redis.mget([_get_key(i) for i in professional_ids])
+    return [
+        get_version(professional_id) if version is None else int(version)
+        for professional_id, version in zip(professional_ids, versions)
+    ]
+
+
+def bump_version(professional_id: int) -> None:
+    """Increment the availability version of the professional."""
+    key = _get_key(professional_id)
+    if not redis.exists(key):
+        redis.set(key, time_ns(), nx=True)
+    redis.incr(key)
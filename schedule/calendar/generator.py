@@ -1,28 +1,347 @@
 """The calendar generator module."""
-from typing import Tuple
+import logging
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import (Any, DefaultDict, Dict, Iterator, List, Optional, Tuple,
+                    Union)
 
+import arrow
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+from django.utils.timezone import get_current_timezone_name
+from redis.exceptions import RedisError
+
+from d8b.metrics import get_metrics
+from d8b.settings import get_settings
+from schedule.availability.exceptions import (AvailabilityEmptyWindowError,
+                                              AvailabilityError)
+from schedule.availability.generator import \
+    get_virtual_availability_generator
+from schedule.availability.request import Request
+from schedule.availability.versions import get_versions
 from schedule.managers import AvailabilitySlotManager
 from schedule.models import AvailabilitySlot
 
+from .exceptions import CalendarValueError
 from .request import CalendarRequest
+from .starts import StartTimesIndex, get_start_times
+
+Bounds = List[Tuple[datetime, datetime]]
+Entity = Tuple[int, Optional[int]]
+
+
+def _get_service_pk(request: CalendarRequest) -> Union[int, str]:
+    """Return the service pk of the request or an empty string."""
+    return request.service.pk if request.service else ""
+
+
+def _get_entity(request: CalendarRequest) -> Entity:
+    """Return the professional and the service ids of the request slots.
+
+    The slots of the base schedule services are the professional ones.
+    """
+    service = request.service
+    if service and not service.is_base_schedule:
+        return request.professional.pk, service.pk
+    return request.professional.pk, None
 
 
 class CalendarGenerator():
-    """The calendar generator."""
+    """The calendar generator.
+
+    The slots bounds are cached by the entity, the dates and the
+    availability version of the professional, so the entries are replaced
+    after every save of the slots. The window is converted to UTC by the
+    request converter, so the timezone is a part of the key through it.
+    """
 
     _manager: AvailabilitySlotManager = AvailabilitySlot.objects
 
+    cache_prefix: str = "calendar"
+
+    def _get_cache_keys(
+        self,
+        requests: List[CalendarRequest],
+    ) -> Optional[List[str]]:
+        """Return the cache keys of the requests.
+
+        None is returned if the versions are unavailable, so the requests
+        are generated without the cache.
+        """
+        try:
+            versions = get_versions([r.professional.pk for r in requests])
+        except RedisError as error:
+            logging.getLogger("d8b").error(
+                "Calendar availability versions error: %s", error)
+            return None
+        return [
+            f"{self.cache_prefix}:{r.professional.pk}:{_get_service_pk(r)}:"
+            f"{version}:{r.start_datetime.timestamp}:"
+            f"{r.end_datetime.timestamp}"
+            for r, version in zip(requests, versions)
+        ]
+
+    def _get_cache_key(self, request: CalendarRequest) -> Optional[str]:
+        """Return the cache key of the request."""
+        keys = self._get_cache_keys([request])
+        return keys[0] if keys else None
+
+    @staticmethod
+    def _get_cache_timeout() -> int:
+        """Return the cache timeout in seconds."""
+        return settings.CALENDAR_CACHE_TIMEOUT
+
+    def _generate(self, request: CalendarRequest) -> Bounds:
+        """Return the slots bounds for the request."""
+        return [(s.start_datetime, s.end_datetime)
+                for s in self._manager.get_between_dates(
+                    professional=request.professional,
+                    service=request.service,
+                    start=request.start_datetime,
+                    end=request.end_datetime,
+                )]
+
+    def _generate_many(self, requests: List[CalendarRequest]) -> List[Bounds]:
+        """Return the slots bounds for the requests with the same dates.
+
+        The slots of all the entities are loaded by a single query.
+        """
+        if not requests:
+            return []
+        entities = {_get_entity(r) for r in requests}
+        grouped: DefaultDict[Entity, Bounds] = defaultdict(list)
+        for professional_id, service_id, start, end in \
+                self._manager.get_between_dates_for_entities(
+                    start=requests[0].start_datetime,
+                    end=requests[0].end_datetime,
+                    professional_ids=[p for p, s in entities if s is None],
+                    service_ids=[s for _, s in entities if s is not None],
+                ).order_by("start_datetime").values_list(
+                    "professional_id",
+                    "service_id",
+                    "start_datetime",
+                    "end_datetime",
+                ):
+            grouped[(professional_id, service_id)].append((start, end))
+        return [grouped.get(_get_entity(r), []) for r in requests]
+
+    def _get_bounds(self, request: CalendarRequest) -> Bounds:
+        """Return the cached slots bounds for the request."""
+        timeout = self._get_cache_timeout()
+        key = self._get_cache_key(request) if timeout else None
+        if not key:
+            return self._generate(request)
+        bounds = cache.get(key)
+        metrics = get_metrics()
+        if bounds is not None:
+            metrics.increment(f"{self.cache_prefix}.cache.hit")
+            return bounds
+        metrics.increment(f"{self.cache_prefix}.cache.miss")
+        bounds = self._generate(request)
+        cache.set(key, bounds, timeout)
+        return bounds
+
+    def _get_many_bounds(
+        self,
+        requests: List[CalendarRequest],
+    ) -> List[Bounds]:
+        """Return the cached slots bounds for the requests.
+
+        The cached entries are read by a single multi-get and the missing
+        ones are generated together.
+        """
+        timeout = self._get_cache_timeout()
+        keys = self._get_cache_keys(requests) if timeout else None
+        if not keys:
+            return self._generate_many(requests)
+        cached = cache.get_many(keys)
+        missing = {k: r for r, k in zip(requests, keys) if k not in cached}
+        metrics = get_metrics()
+        if cached:
+            metrics.increment(f"{self.cache_prefix}.cache.hit", len(cached))
+        if missing:
+            metrics.increment(f"{self.cache_prefix}.cache.miss",
+                              len(missing))
+            generated = dict(
+                zip(missing, self._generate_many(list(missing.values()))))
+            cache.set_many(generated, timeout)
+            cached.update(generated)
+        return [cached[k] for k in keys]
+
+    @staticmethod
+    def _get_slots(
+        request: CalendarRequest,
+        bounds: Bounds,
+    ) -> Tuple[AvailabilitySlot, ...]:
+        """Return the slots of the request from the bounds."""
+        return tuple(
+            AvailabilitySlot(
+                professional=request.professional,
+                service=request.service,
+                start_datetime=start,
+                end_datetime=end,
+            ) for start, end in bounds)
+
     def get(self, request: CalendarRequest) -> Tuple[AvailabilitySlot, ...]:
         """Return the generated response."""
-        response = self._manager.get_between_dates(
-            professional=request.professional,
-            service=request.service,
-            start=request.start_datetime,
-            end=request.end_datetime,
+        return self._get_slots(request, self._get_bounds(request))
+
+    def iterate(self, request: CalendarRequest) -> Iterator[AvailabilitySlot]:
+        """Return the iterator of the generated response.
+
+        The slots are read by the server-side cursor and are not cached, so
+        the memory is not allocated for the whole response.
+        """
+        for start, end in self._manager.get_between_dates(
+                professional=request.professional,
+                service=request.service,
+                start=request.start_datetime,
+                end=request.end_datetime,
+        ).order_by("start_datetime").values_list(
+                "start_datetime",
+                "end_datetime",
+        ).iterator(chunk_size=get_settings("D8B_STREAMING_CHUNK_SIZE")):
+            yield from self._get_slots(request, [(start, end)])
+
+    def get_many(
+        self,
+        requests: List[CalendarRequest],
+    ) -> Tuple[AvailabilitySlot, ...]:
+        """Return the generated response for the requests.
+
+        The requests must have the same dates.
+        """
+        return tuple(
+            slot for request, bounds in zip(
+                requests, self._get_many_bounds(requests))
+            for slot in self._get_slots(request, bounds))
+
+    def get_summary(
+            self, request: CalendarRequest) -> Tuple[Dict[str, Any], ...]:
+        """Return the availability aggregates by the local days.
+
+        The days are in the current timezone. The aggregates are computed
+        from the saved slots by the database and cached as the slots.
+        """
+        timezone = get_current_timezone_name()
+        timeout = self._get_cache_timeout()
+        key = self._get_cache_key(request) if timeout else None
+        if key:
+            key = f"{self.cache_prefix}_summary:{timezone}:{key}"
+        summary = cache.get(key) if key else None
+        if summary is None:
+            summary = tuple(self._manager.get_day_summary(
+                start=request.start_datetime,
+                end=request.end_datetime,
+                timezone=timezone,
+                professional=request.professional,
+                service=request.service,
+            ))
+            if key:
+                cache.set(key, summary, timeout)
+        return summary
+
+    def _get_start_times(self, request: CalendarRequest) -> List[datetime]:
+        """Return the start times of the request service."""
+        # pylint: disable=no-self-use
+        return StartTimesIndex(request.service).get(  # type: ignore
+            request.start_datetime, request.end_datetime)
+
+    def get_start_times(
+            self, request: CalendarRequest) -> Tuple[Dict[str, Any], ...]:
+        """Return the bookable start times of the request service."""
+        service = request.service
+        duration = timedelta(minutes=service.duration)  # type: ignore
+        starts = self._get_start_times(request)
+        return tuple({
+            "start_datetime": s,
+            "end_datetime": s + duration,
+            "service": service,
+        } for s in starts)
+
+
+class VirtualCalendarGenerator(CalendarGenerator):
+    """The calendar generator computing the slots on the fly.
+
+    The slots are generated from the schedules, the closed periods and the
+    orders for the requested dates instead of reading the saved slots. The
+    result is cached by the entity and the dates for a short time. The
+    start times are computed from the same slots, and the summary is not
+    supported.
+    """
+
+    cache_prefix: str = "calendar_virtual"
+
+    def _get_cache_keys(
+        self,
+        requests: List[CalendarRequest],
+    ) -> Optional[List[str]]:
+        """Return the cache keys of the requests."""
+        return [
+            f"{self.cache_prefix}:{r.professional.pk}:{_get_service_pk(r)}:"
+            f"{r.start_datetime.timestamp}:{r.end_datetime.timestamp}"
+            for r in requests
+        ]
+
+    @staticmethod
+    def _get_cache_timeout() -> int:
+        """Return the cache timeout in seconds."""
+        return settings.CALENDAR_VIRTUAL_CACHE_TIMEOUT
+
+    def _generate(self, request: CalendarRequest) -> Bounds:
+        """Compute the slots bounds for the request."""
+        availability_request = Request()
+        availability_request.professional = request.professional
+        # the base schedule services have the professional slots
+        availability_request.service = request.service \
+            if _get_entity(request)[1] else None
+        availability_request.start_datetime = request.start_datetime
+        availability_request.end_datetime = request.end_datetime
+        try:
+            slots = get_virtual_availability_generator(
+                availability_request).get_slots()
+        except AvailabilityEmptyWindowError:
+            return []
+        except AvailabilityError as error:
+            raise CalendarValueError(str(error)) from error
+        start = request.start_datetime.datetime
+        end = request.end_datetime.datetime
+        return sorted((s.start_datetime, s.end_datetime)
+                      for s in slots
+                      if s.start_datetime <= end and s.end_datetime >= start)
+
+    def _generate_many(self, requests: List[CalendarRequest]) -> List[Bounds]:
+        """Compute the slots bounds for the requests."""
+        return [self._generate(r) for r in requests]
+
+    def _get_start_times(self, request: CalendarRequest) -> List[datetime]:
+        """Compute the start times of the request service."""
+        service = request.service
+        index = get_start_times(
+            self._get_bounds(request),
+            service.duration,  # type: ignore
+            service.booking_interval,  # type: ignore
         )
-        return tuple(response)
+        first = request.start_datetime.timestamp
+        last = request.end_datetime.timestamp
+        return [
+            arrow.get(t).datetime for t in sorted(index)
+            if first <= t <= last
+        ]
+
+    def get_summary(
+            self, request: CalendarRequest) -> Tuple[Dict[str, Any], ...]:
+        """Raise the error, since the summary is aggregated by the database."""
+        # pylint: disable=unused-argument
+        raise CalendarValueError(
+            "The summary is not supported by the virtual calendar")
+
+    def iterate(self, request: CalendarRequest) -> Iterator[AvailabilitySlot]:
+        """Return the iterator of the generated response."""
+        return iter(self.get(request))
 
 
-def get_calendar_generator():
+def get_calendar_generator() -> CalendarGenerator:
     """Return the calendar generator."""
-    return CalendarGenerator()
+    return import_string(get_settings("CALENDAR_GENERATOR_CLASS"))()
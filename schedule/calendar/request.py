@@ -1,19 +1,30 @@
 """The calendar request module."""
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import arrow
+from arrow.parser import DateTimeParser
+from django.conf import settings
 from django.utils.timezone import get_current_timezone
 from rest_framework.request import Request
 
 from professionals.models import Professional
+from schedule.timezones import get_timezone_offsets
 from services.models import Service
 
+from .exceptions import CalendarValidationError
 from .validators import validate_calendar_request
 
 
 class CalendarRequest():
     """The calendar request class."""
 
+    MODE_SLOTS: str = "slots"
+    MODE_STARTS: str = "starts"
+    MODE_SUMMARY: str = "summary"
+    MODES: Tuple[str, ...] = (MODE_SLOTS, MODE_STARTS, MODE_SUMMARY)
+
+    mode: str = MODE_SLOTS
+    is_streamed: bool = False
     professional: Professional
     service: Optional[Service] = None
     start_datetime: arrow.Arrow
@@ -28,6 +39,9 @@ class HTTPToCalendarRequestConverter():
     PERIOD_PARAM: str = "period"
     START_DATETIME_PARAM: str = "start_datetime"
     END_DATETIME_PARAM: str = "end_datetime"
+    MODE_PARAM: str = "mode"
+    STREAM_PARAM: str = "stream"
+    STREAM_VALUES: Tuple[str, ...] = ("1", "true")
 
     request: Request
     calendar_request: CalendarRequest
@@ -48,27 +62,121 @@ class HTTPToCalendarRequestConverter():
         if professional:
             self.calendar_request.professional = professional
 
+    def _set_mode(self):
+        """Set a mode to the calendar request."""
+        mode = self._get_query_param(self.MODE_PARAM)
+        if mode:
+            self.calendar_request.mode = mode
+
+    def _set_stream(self):
+        """Set the streaming flag to the calendar request."""
+        value = self._get_query_param(self.STREAM_PARAM) or ""
+        self.calendar_request.is_streamed = \
+            value.lower() in self.STREAM_VALUES
+
     def _set_service(self):
-        """Set a service to the calendart request."""
+        """Set a service to the calendart request.
+
+        The base schedule services are skipped unless the start times or
+        the summary are requested, since the duration of the service is
+        required for them.
+        """
         pk = self._get_query_param(self.SERVICE_PARAM)
+        params: Dict[str, Any] = {"pk": pk}
+        if self.calendar_request.mode == CalendarRequest.MODE_SLOTS:
+            params["is_base_schedule"] = False
         self.calendar_request.service = Service.objects.\
-            get_by_params(pk=pk, is_base_schedule=False)
+            get_by_params(**params)
 
     def _set_datetime(self, name: str):
-        """Set a datetime to the calendart request."""
+        """Set a datetime to the calendart request.
+
+        The date is treated as the local time of the current timezone.
+        """
         date_str = str(self._get_query_param(name))
         try:
-            date = arrow.get(date_str, tzinfo=get_current_timezone())
-            setattr(self.calendar_request, name, date.to("utc"))
+            date = DateTimeParser().parse_iso(date_str)
+            offsets = get_timezone_offsets(get_current_timezone())
+            setattr(self.calendar_request, name,
+                    offsets.get_utc_datetime(date))
         except arrow.ParserError:
             pass
 
     def get(self) -> CalendarRequest:
         """Convert and return the HTTP request to a calendar request."""
         self.calendar_request = CalendarRequest()
+        self._set_mode()
+        self._set_stream()
         self._set_professional()
         self._set_service()
         self._set_datetime(self.START_DATETIME_PARAM)
         self._set_datetime(self.END_DATETIME_PARAM)
         self.validator(self.calendar_request)
         return self.calendar_request
+
+
+class HTTPToCalendarBatchRequestConverter(HTTPToCalendarRequestConverter):
+    """The http to calendar batch request converter class.
+
+    The professionals and the services are loaded by two queries and every
+    entity gets its own calendar request with the same dates. The service
+    requests get the service professionals.
+    """
+
+    PROFESSIONALS_PARAM: str = "professionals"
+    SERVICES_PARAM: str = "services"
+
+    def _get_ids(self, name: str) -> List[int]:
+        """Get the unique ids from the comma separated param."""
+        value = self._get_query_param(name) or ""
+        try:
+            ids = [int(i) for i in value.split(",") if i.strip()]
+        except ValueError as error:
+            raise CalendarValidationError(
+                f"The request {name} are invalid") from error
+        return list(dict.fromkeys(ids))
+
+    def _get_entities(self) -> List[Tuple[Professional, Optional[Service]]]:
+        """Get the requested professionals and services."""
+        professional_ids = self._get_ids(self.PROFESSIONALS_PARAM)
+        service_ids = self._get_ids(self.SERVICES_PARAM)
+        size = len(professional_ids) + len(service_ids)
+        if not size:
+            raise CalendarValidationError("The request entities are empty")
+        if size > settings.CALENDAR_BATCH_MAX_SIZE:
+            raise CalendarValidationError(
+                "The request entities number must be less than "
+                f"{settings.CALENDAR_BATCH_MAX_SIZE + 1}")
+
+        professionals = Professional.objects.in_bulk(professional_ids)
+        services = Service.objects.select_related("professional").in_bulk(
+            service_ids)
+        if len(professionals) != len(professional_ids):
+            raise CalendarValidationError(
+                f"The request {self.PROFESSIONALS_PARAM} are invalid")
+        if len(services) != len(service_ids):
+            raise CalendarValidationError(
+                f"The request {self.SERVICES_PARAM} are invalid")
+        entities: List[Tuple[Professional, Optional[Service]]] = [
+            (professionals[i], None) for i in professional_ids
+        ]
+        entities.extend(
+            (services[i].professional, services[i]) for i in service_ids)
+        return entities
+
+    def get_batch(self) -> List[CalendarRequest]:
+        """Convert and return the HTTP request to the calendar requests."""
+        self.calendar_request = CalendarRequest()
+        self._set_datetime(self.START_DATETIME_PARAM)
+        self._set_datetime(self.END_DATETIME_PARAM)
+        requests = []
+        for professional, service in self._get_entities():
+            request = CalendarRequest()
+            request.professional = professional
+            request.service = service
+            for name in (self.START_DATETIME_PARAM, self.END_DATETIME_PARAM):
+                setattr(request, name,
+                        getattr(self.calendar_request, name, None))
+            self.validator(request)
+            requests.append(request)
+        return requests
@@ -0,0 +1,133 @@
+"""The calendar start times module.
+
+The bookable start times of a service are computed from the availability
+slots, the service duration and the booking interval. The index of the
+upcoming days is cached by the availability version of the professional, so
+it is recomputed after the slots are saved.
+"""
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple, Union
+
+import arrow
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import RedisError
+
+from schedule.availability.versions import get_version
+from schedule.models import AvailabilitySlot
+from services.models import Service
+
+StartTimes = Dict[int, int]
+
+
+def get_start_times(
+    bounds: Iterable[Tuple[datetime, datetime]],
+    duration: int,
+    interval: int,
+) -> StartTimes:
+    """Return the start timestamps mapped to the slots end timestamps.
+
+    The start times are aligned to the slot starts by the booking interval.
+    The duration and the interval are in minutes.
+    """
+    result: StartTimes = {}
+    length = duration * 60
+    step = (interval or duration) * 60
+    for start, end in bounds:
+        end_timestamp = int(end.timestamp())
+        for timestamp in range(int(start.timestamp()),
+                               end_timestamp - length + 1, step):
+            if result.get(timestamp, 0) < end_timestamp:
+                result[timestamp] = end_timestamp
+    return result
+
+
+class StartTimesIndex():
+    """The bookable start times index of the service."""
+
+    cache_prefix: str = "calendar_starts"
+
+    service: Service
+
+    def __init__(self, service: Service):
+        """Construct the object."""
+        self.service = service
+
+    @staticmethod
+    def _get_horizon() -> Tuple[arrow.Arrow, arrow.Arrow]:
+        """Return the dates covered by the index."""
+        start = arrow.utcnow().floor("day")
+        return start, start.shift(days=settings.CALENDAR_START_TIMES_DAYS)
+
+    def _get_cache_key(self, start: arrow.Arrow) -> str:
+        """Return the cache key of the index."""
+        service = self.service
+        version = get_version(service.professional_id)
+        return (f"{self.cache_prefix}:{service.pk}:{version}:"
+                f"{start.timestamp}:{service.duration}:"
+                f"{service.booking_interval}:{service.is_base_schedule}")
+
+    def _load(self, start: arrow.Arrow, end: arrow.Arrow) -> StartTimes:
+        """Compute the start times from the saved slots."""
+        bounds = AvailabilitySlot.objects.get_between_dates(
+            professional=self.service.professional,
+            service=self.service,
+            start=start,
+            end=end,
+        ).values_list("start_datetime", "end_datetime")
+        return get_start_times(
+            bounds,
+            self.service.duration,
+            self.service.booking_interval,
+        )
+
+    def get_index(self) -> StartTimes:
+        """Return the index of the upcoming days.
+
+        The index is computed from the slots without the cache if Redis is
+        unavailable.
+        """
+        start, end = self._get_horizon()
+        try:
+            key = self._get_cache_key(start)
+            index = cache.get(key)
+            if index is None:
+                index = self._load(start, end)
+                cache.set(key, index,
+                          settings.CALENDAR_START_TIMES_CACHE_TIMEOUT)
+        except RedisError as error:
+            logging.getLogger("d8b").error(
+                "Calendar start times cache error: %s", error)
+            index = self._load(start, end)
+        return index
+
+    def get(self, start: arrow.Arrow, end: arrow.Arrow) -> List[datetime]:
+        """Return the start times between the dates.
+
+        The dates outside the index are computed from the slots directly.
+        """
+        horizon_start, horizon_end = self._get_horizon()
+        if horizon_start <= start and end <= horizon_end:
+            index = self.get_index()
+        else:
+            index = self._load(start, end)
+        first = start.timestamp
+        last = end.timestamp
+        return [
+            arrow.get(t).datetime for t in sorted(index)
+            if first <= t <= last
+        ]
+
+    def is_bookable(
+        self,
+        start: Union[datetime, arrow.Arrow],
+        end: Union[datetime, arrow.Arrow],
+    ) -> bool:
+        """Check if the interval is bookable according to the index.
+
+        The false result does not mean the interval is unavailable, since
+        the unaligned and the distant intervals are not indexed.
+        """
+        end_timestamp = self.get_index().get(arrow.get(start).timestamp, 0)
+        return end_timestamp >= arrow.get(end).timestamp
@@ -46,6 +46,11 @@ def validate_calendar_request(request: "CalendarRequest"):
                                   "professional")
     _validate_calendar_isinstance(request.service, Service, "service")
 
+    if request.mode not in request.MODES:
+        raise CalendarValidationError("The request mode is invalid")
+    if request.mode == request.MODE_STARTS:
+        _validate_calendar_not_empty(request, "service")
+
     _validate_calendar_datetime(request.start_datetime, "start")
     _validate_calendar_datetime(request.end_datetime, "end")
 
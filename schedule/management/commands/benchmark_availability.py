@@ -0,0 +1,83 @@
+"""The benchmark availability command."""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from schedule.availability.benchmark import AvailabilityBenchmark, Workload
+
+
+class Command(BaseCommand):
+    """The benchmark availability command.
+
+    The synthetic workload is created in a transaction that is rolled back
+    after the benchmark. The report is written as JSON.
+    """
+
+    help = "Time the availability generation stages on a synthetic workload."
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        defaults = Workload()
+        parser.add_argument(
+            "--professionals",
+            type=int,
+            default=defaults.professionals,
+        )
+        parser.add_argument(
+            "--schedules-per-day",
+            type=int,
+            default=defaults.schedules_per_day,
+            help="the number of the schedules per working day (1-12)",
+        )
+        parser.add_argument(
+            "--days-per-week",
+            type=int,
+            default=defaults.days_per_week,
+            help="the number of the working days (1-7)",
+        )
+        parser.add_argument(
+            "--orders",
+            type=int,
+            default=defaults.orders,
+            help="the number of the orders per professional",
+        )
+        parser.add_argument(
+            "--closed-periods",
+            type=int,
+            default=defaults.closed_periods,
+            help="the number of the closed periods per professional",
+        )
+        parser.add_argument("--timezone", default=defaults.timezone)
+        parser.add_argument("--seed", type=int, default=defaults.seed)
+        parser.add_argument(
+            "--output",
+            help="the report file path (stdout by default)",
+        )
+
+    def handle(self, *args, **options):
+        """Run the command."""
+        if options["professionals"] < 1:
+            raise CommandError("The professionals must be positive.")
+        if not 1 <= options["schedules_per_day"] <= 12:
+            raise CommandError("The schedules per day must be from 1 to 12.")
+        if not 1 <= options["days_per_week"] <= 7:
+            raise CommandError("The days per week must be from 1 to 7.")
+        if options["orders"] < 0 or options["closed_periods"] < 0:
+            raise CommandError("The orders and periods must not be negative.")
+
+        workload = Workload(
+            professionals=options["professionals"],
+            schedules_per_day=options["schedules_per_day"],
+            days_per_week=options["days_per_week"],
+            orders=options["orders"],
+            closed_periods=options["closed_periods"],
+            timezone=options["timezone"],
+            seed=options["seed"],
+        )
+        report = json.dumps(AvailabilityBenchmark(workload).run(), indent=2)
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                output.write(report)
+        else:
+            self.stdout.write(report)
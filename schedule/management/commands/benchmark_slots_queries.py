@@ -0,0 +1,146 @@
+"""The benchmark slots queries command."""
+
+import statistics
+import time
+from typing import Callable, Dict, List, Tuple
+
+import arrow
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models.query import QuerySet
+
+from professionals.models import Professional
+from schedule.models import AvailabilitySlot
+from services.models import Service
+
+Queries = Dict[str, Tuple[Callable[[], QuerySet], Callable[[], QuerySet]]]
+
+
+class Command(BaseCommand):
+    """The benchmark slots queries command.
+
+    The synthetic slots are inserted in a transaction that is rolled back
+    after the benchmark.
+    """
+
+    help = "Compare the slots overlap queries with and without the ranges."
+
+    verbosity: int = 1
+
+    def add_arguments(self, parser):
+        """Add arguments to the command."""
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=365,
+            help="the number of the days of the synthetic slots",
+        )
+        parser.add_argument(
+            "--slots-per-day",
+            type=int,
+            default=4,
+            help="the number of the slots per professional and day",
+        )
+        parser.add_argument("--repeat", type=int, default=20)
+
+    @staticmethod
+    def _insert_slots(days: int, slots_per_day: int) -> int:
+        """Insert the synthetic slots of the professionals."""
+        hours = 24 // slots_per_day
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {AvailabilitySlot._meta.db_table} "
+                "(professional_id, service_id, start_datetime, end_datetime) "
+                "SELECT p.id, NULL, d, d + make_interval(hours => %s) "
+                f"FROM {Professional._meta.db_table} p "
+                "CROSS JOIN generate_series(date_trunc('day', now()), "
+                "date_trunc('day', now()) + make_interval(days => %s), "
+                "make_interval(hours => %s)) d",
+                [hours - 1, days, hours],
+            )
+            count = cursor.rowcount
+            cursor.execute(f"ANALYZE {AvailabilitySlot._meta.db_table}")
+        return count
+
+    @staticmethod
+    def _get_queries(service: Service) -> Queries:
+        """Return the old and the new querysets by the names."""
+        professional = service.professional
+        start = arrow.utcnow().shift(days=30).floor("day").shift(hours=10)
+        end = start.shift(hours=1)
+        slot = AvailabilitySlot(
+            professional=professional,
+            start_datetime=start.datetime,
+            end_datetime=end.datetime,
+        )
+        manager = AvailabilitySlot.objects
+        return {
+            "get_between_dates": (
+                lambda: manager.filter(
+                    professional=professional,
+                    start_datetime__lte=end.datetime,
+                    end_datetime__gte=start.datetime,
+                    service__isnull=True,
+                ),
+                lambda: manager.get_between_dates(start, end, professional),
+            ),
+            "get_encompassing_interval": (
+                lambda: manager.filter(
+                    professional=professional,
+                    start_datetime__lte=start.datetime,
+                    end_datetime__gte=end.datetime,
+                    service__isnull=True,
+                ),
+                lambda: manager.get_encompassing_interval(
+                    start, end, service),
+            ),
+            "get_overlapping_entries": (
+                lambda: manager.filter(
+                    start_datetime__lt=end.datetime,
+                    end_datetime__gt=start.datetime,
+                    professional=professional,
+                    service=None,
+                ),
+                lambda: manager.get_overlapping_entries(slot),
+            ),
+        }
+
+    @staticmethod
+    def _measure(get_query: Callable[[], QuerySet], repeat: int) -> float:
+        """Return the median query time in milliseconds."""
+        timings: List[float] = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            list(get_query().values_list("pk", flat=True))
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def _report(self, name: str, get_query: Callable[[], QuerySet],
+                repeat: int):
+        """Print the query plan and the timing."""
+        plan = get_query().values_list("pk", flat=True).explain(analyze=True)
+        self.stdout.write(f"{name}: {self._measure(get_query, repeat):.3f} ms")
+        if self.verbosity > 1:
+            self.stdout.write(plan)
+        else:
+            self.stdout.write(plan.splitlines()[0])
+
+    def handle(self, *args, **options):
+        """Run the command."""
+        if connection.vendor != "postgresql":
+            raise CommandError("The benchmark requires PostgreSQL.")
+        if not 1 <= options["slots_per_day"] <= 24:
+            raise CommandError("The slots per day must be from 1 to 24.")
+        service = Service.objects.filter(is_base_schedule=True).first()
+        if not service:
+            raise CommandError("The base schedule service is required.")
+        self.verbosity = options["verbosity"]
+
+        with transaction.atomic():
+            count = self._insert_slots(options["days"],
+                                       options["slots_per_day"])
+            self.stdout.write(f"Synthetic slots: {count}")
+            for name, (old, new) in self._get_queries(service).items():
+                self._report(f"{name} (dates)", old, options["repeat"])
+                self._report(f"{name} (ranges)", new, options["repeat"])
+            transaction.set_rollback(True)
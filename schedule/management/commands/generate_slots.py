@@ -1,16 +1,22 @@
 """The generate slots command."""
 
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Dict, List, Optional, Tuple
 
 import arrow
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.db import connections
+from django.db.models.query import QuerySet
 from tqdm import tqdm
 
 from professionals.models import Professional
-from schedule.availability import (generate_for_professional,
-                                   generate_for_service)
+from schedule.availability.metrics import GenerationReport
+from schedule.availability.utils import generate_for_chunk, get_chunks
 from services.models import Service
 
+Chunk = Tuple[List[int], List[int]]
+
 
 class Command(BaseCommand):
     """The generate slot command."""
@@ -19,6 +25,8 @@ class Command(BaseCommand):
 
     start: Optional[arrow.Arrow]
     end: Optional[arrow.Arrow]
+    report: GenerationReport
+    errors: int
 
     def add_arguments(self, parser):
         """Add arguments to the command."""
@@ -34,41 +42,99 @@ class Command(BaseCommand):
             type=arrow.get,
             help="YYYY-MM-DD",
         )
-
-    def _generate_for_professional(self, professional: Professional) -> None:
-        """Generate for the professional."""
-        generate_for_professional(
-            professional=professional,
-            start=self.start,
-            end=self.end,
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="the number of the worker processes",
         )
 
-    def _generate_for_service(self, service: Service) -> None:
-        """Generate for the service."""
-        generate_for_service(
-            service=service,
-            start=self.start,
-            end=self.end,
-        )
+    def _add_report(self, report: Optional[GenerationReport]) -> None:
+        """Add the generation report to the summary."""
+        if isinstance(report, GenerationReport):
+            self.report.merge(report)
+
+    def _write_report(self) -> None:
+        """Write the summary of the generation reports."""
+        for name, timing in sorted(self.report.timings.items()):
+            self.stdout.write(f"{name}: {timing:.3f} s")
+        for name, counter in sorted(self.report.counters.items()):
+            self.stdout.write(f"{name}: {counter}")
+
+    @staticmethod
+    def _get_chunks(
+        professionals: QuerySet,
+        services: QuerySet,
+    ) -> List[Chunk]:
+        """Split the professionals and the services ids into the chunks."""
+        size = settings.AVAILABILITY_GENERATION_CHUNK_SIZE
+        professional_ids = list(professionals.values_list("pk", flat=True))
+        service_ids = list(services.values_list("pk", flat=True))
+        chunks: List[Chunk] = [
+            (ids, []) for ids in get_chunks(professional_ids, size)
+        ]
+        chunks.extend(([], ids) for ids in get_chunks(service_ids, size))
+        return chunks
+
+    def _add_summary(self, summary: Dict[str, Any], progress: tqdm) -> None:
+        """Add the chunk summary to the report and the progress."""
+        self.errors += summary["errors"]
+        self._add_report(summary["report"])
+        progress.update(summary["professionals"] + summary["services"] +
+                        summary["errors"])
+
+    def _generate(self, chunks: List[Chunk]):
+        """Generate the slots by the chunks sequentially."""
+        with tqdm(total=sum(len(p) + len(s) for p, s in chunks)) as progress:
+            for professional_ids, service_ids in chunks:
+                self._add_summary(
+                    generate_for_chunk(
+                        professional_ids=professional_ids,
+                        service_ids=service_ids,
+                        start=self.start,
+                        end=self.end,
+                    ),
+                    progress,
+                )
+
+    def _generate_in_parallel(self, chunks: List[Chunk], workers: int):
+        """Generate the slots by the chunks in the worker processes."""
+        # the forked processes must not share the database connections
+        connections.close_all()
+        with ProcessPoolExecutor(max_workers=workers) as executor, \
+                tqdm(total=sum(len(p) + len(s) for p, s in chunks)) \
+                as progress:
+            futures = [
+                executor.submit(
+                    generate_for_chunk,
+                    professional_ids=professional_ids,
+                    service_ids=service_ids,
+                    start=self.start,
+                    end=self.end,
+                ) for professional_ids, service_ids in chunks
+            ]
+            for future in as_completed(futures):
+                self._add_summary(future.result(), progress)
 
     def handle(self, *args, **options):
         """Run the command."""
         self.start = options["start"]
         self.end = options["end"]
+        self.report = GenerationReport()
         professionals = Professional.objects.\
             get_for_avaliability_generation(options["professionals"])
         services = Service.objects.\
             get_for_avaliability_generation(options["services"])
-        total = professionals.count() + services.count()
-
-        with tqdm(total=total) as progress:
-
-            for professional in professionals.iterator():
-                self._generate_for_professional(professional)
-                progress.update(1)
 
-            for service in services.iterator():
-                self._generate_for_service(service)
-                progress.update(1)
+        chunks = self._get_chunks(professionals, services)
+        self.errors = 0
+        if options["workers"] > 1:
+            self._generate_in_parallel(chunks, options["workers"])
+        else:
+            self._generate(chunks)
+        if self.errors:
+            self.stdout.write(
+                self.style.WARNING(f"Slots generation errors: {self.errors}."))
 
+        self._write_report()
         self.stdout.write(self.style.SUCCESS("Slots have been generated."))
@@ -1,11 +1,15 @@
 """The services managers module."""
 from collections import defaultdict
-from typing import TYPE_CHECKING, DefaultDict, List, Optional
+from typing import (TYPE_CHECKING, Any, DefaultDict, Dict, List,
+                    Optional)
 
 import arrow
-from django.db import models
+from django.db import connection, models
+from django.db.models.functions import Greatest, Least
 from django.db.models.query import QuerySet
 
+from d8b.ranges import contains, overlaps
+
 if TYPE_CHECKING:
     from professionals.models import Professional
     from services.models import Service
@@ -33,6 +37,7 @@ class AvailabilitySlotManager(models.Manager):
     ) -> QuerySet:
         """Return the overlapping entries."""
         query = self.get_list().filter(
+            overlaps(slot.start_datetime, slot.end_datetime),
             start_datetime__lt=slot.end_datetime,
             end_datetime__gt=slot.start_datetime,
             professional=slot.professional,
@@ -51,6 +56,7 @@ class AvailabilitySlotManager(models.Manager):
         """Get entries that encompass the specified interval."""
         professional: "Professional" = service.professional
         query = self.get_list().filter(
+            contains(start.datetime, end.datetime),
             professional=professional,
             start_datetime__lte=start.datetime,
             end_datetime__gte=end.datetime,
@@ -70,6 +76,7 @@ class AvailabilitySlotManager(models.Manager):
     ) -> QuerySet:
         """Return between the dates."""
         query = self.filter(
+            overlaps(start.datetime, end.datetime),
             professional=professional,
             start_datetime__lte=end.datetime,
             end_datetime__gte=start.datetime,
@@ -81,6 +88,142 @@ class AvailabilitySlotManager(models.Manager):
 
         return query
 
+    def get_between_dates_for_entities(
+        self,
+        start: arrow.Arrow,
+        end: arrow.Arrow,
+        professional_ids: List[int],
+        service_ids: List[int],
+    ) -> QuerySet:
+        """Return between the dates for the professionals and the services.
+
+        The professionals slots are the ones without the services, so the
+        base schedule services must be passed as their professionals.
+        """
+        return self.filter(
+            models.Q(professional_id__in=professional_ids,
+                     service__isnull=True)
+            | models.Q(service_id__in=service_ids),
+            overlaps(start.datetime, end.datetime),
+            start_datetime__lte=end.datetime,
+            end_datetime__gte=start.datetime,
+        )
+
+    def get_availability_stats(
+        self,
+        professional_ids: List[int],
+        start: arrow.Arrow,
+        end: arrow.Arrow,
+    ) -> QuerySet:
+        """Return the availability stats of the professionals.
+
+        The entries are grouped by the professionals and the services. The
+        nearest availability is the start of the first slot ending after the
+        start date or the start date itself if the slot is in progress. The
+        available durations are summed between the dates.
+        """
+        start_value = models.Value(
+            start.datetime,
+            output_field=models.DateTimeField(),
+        )
+        end_value = models.Value(
+            end.datetime,
+            output_field=models.DateTimeField(),
+        )
+        duration = models.ExpressionWrapper(
+            Least("end_datetime", end_value) -
+            Greatest("start_datetime", start_value),
+            output_field=models.DurationField(),
+        )
+        return self.filter(
+            overlaps(start.datetime, None),
+            end_datetime__gt=start.datetime,
+            professional_id__in=professional_ids,
+        ).values("professional_id", "service_id").annotate(
+            next_available_at=models.Min(
+                Greatest("start_datetime", start_value)),
+            available=models.Sum(
+                duration,
+                filter=models.Q(start_datetime__lt=end.datetime),
+            ),
+        ).order_by()
+
+    def get_day_summary(
+        self,
+        start: arrow.Arrow,
+        end: arrow.Arrow,
+        timezone: str,
+        professional: "Professional",
+        service: Optional["Service"] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the availability aggregates by the local days.
+
+        The slots between the dates are split by the midnights of the
+        timezone. The bookable starts are counted by the service duration
+        and the booking interval and are None without the service.
+        """
+        first_day = start.to(timezone).date()
+        last_day = end.to(timezone).shift(microseconds=-1).date()
+        duration = step = None
+        if service:
+            duration = service.duration * 60
+            step = (service.booking_interval or service.duration) * 60
+        slots_sql, slots_params = self.get_between_dates(
+            start=start,
+            end=end,
+            professional=professional,
+            service=service,
+        ).values("start_datetime", "end_datetime").order_by().query.\
+            sql_with_params()
+        sql = f"""
+            WITH days AS (
+                SELECT d::date AS day,
+                       d AT TIME ZONE %s AS day_start,
+                       (d + INTERVAL '1 day') AT TIME ZONE %s AS day_end
+                FROM generate_series(%s::timestamp, %s::timestamp,
+                                     INTERVAL '1 day') AS d
+            ), pieces AS (
+                SELECT days.day,
+                       EXTRACT(EPOCH FROM s.start_datetime) AS slot_start,
+                       EXTRACT(EPOCH FROM s.end_datetime) AS slot_end,
+                       GREATEST(s.start_datetime, days.day_start, %s)
+                           AS piece_start,
+                       LEAST(s.end_datetime, days.day_end, %s) AS piece_end
+                FROM ({slots_sql}) AS s
+                JOIN days ON s.start_datetime < days.day_end
+                    AND s.end_datetime > days.day_start
+            )
+            SELECT day,
+                   FLOOR(SUM(EXTRACT(EPOCH FROM piece_end - piece_start))
+                         / 60)::integer,
+                   MIN(piece_start),
+                   MAX(piece_end),
+                   CASE WHEN %s::integer IS NULL THEN NULL ELSE SUM(GREATEST(
+                       LEAST(
+                           CEIL((EXTRACT(EPOCH FROM piece_end) - slot_start)
+                                / %s::integer) - 1,
+                           FLOOR((slot_end - %s::integer - slot_start)
+                                 / %s::integer)
+                       ) - GREATEST(
+                           CEIL((EXTRACT(EPOCH FROM piece_start) - slot_start)
+                                / %s::integer), 0
+                       ) + 1, 0))::integer END
+            FROM pieces
+            WHERE piece_end > piece_start
+            GROUP BY day
+            ORDER BY day
+        """
+        params = [
+            timezone, timezone, first_day, last_day, start.datetime,
+            end.datetime, *slots_params, step, step, duration, step, step
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            rows = cursor.fetchall()
+        fields = ("day", "available_minutes", "first_available_at",
+                  "last_available_at", "bookable_starts")
+        return [dict(zip(fields, row)) for row in rows]
+
     def get_expired_entries(self) -> QuerySet:
         """Return the expired entries."""
         today = arrow.utcnow().replace(
@@ -89,7 +232,11 @@ class AvailabilitySlotManager(models.Manager):
             second=0,
             microsecond=0,
         )
-        return self.filter(end_datetime__lt=today.datetime)
+        # the start datetime filter enables the partition pruning
+        return self.filter(
+            start_datetime__lt=today.datetime,
+            end_datetime__lt=today.datetime,
+        )
 
 
 class ProfessionalClosedPeriodManager(models.Manager):
@@ -112,6 +259,7 @@ class ProfessionalClosedPeriodManager(models.Manager):
     ) -> QuerySet:
         """Return between the dates."""
         return self.get_list().filter(
+            overlaps(start.datetime, end.datetime),
             start_datetime__lt=end.datetime,
             end_datetime__gt=start.datetime,
             professional=professional,
@@ -124,6 +272,7 @@ class ProfessionalClosedPeriodManager(models.Manager):
     ) -> QuerySet:
         """Return the overlapping entries."""
         query = self.get_list().filter(
+            overlaps(period.start_datetime, period.end_datetime),
             start_datetime__lt=period.end_datetime,
             end_datetime__gt=period.start_datetime,
             professional=period.professional,
@@ -247,6 +396,7 @@ class ServiceClosedPeriodManager(models.Manager):
     ) -> QuerySet:
         """Return between the dates."""
         return self.get_list().filter(
+            overlaps(start.datetime, end.datetime),
             start_datetime__lt=end.datetime,
             end_datetime__gt=start.datetime,
             service=service,
@@ -259,6 +409,7 @@ class ServiceClosedPeriodManager(models.Manager):
     ) -> QuerySet:
         """Return the overlapping entries."""
         query = self.get_list().filter(
+            overlaps(period.start_datetime, period.end_datetime),
             start_datetime__lt=period.end_datetime,
             end_datetime__gt=period.start_datetime,
             service=period.service,
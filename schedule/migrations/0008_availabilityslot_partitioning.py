@@ -0,0 +1,120 @@
+"""Partition the availability slots table by month on PostgreSQL.
+
+The partitioning is opt-in by the AVAILABILITY_PARTITIONING setting. The
+whole table is copied in one transaction holding the ACCESS EXCLUSIVE lock,
+so the slots can be neither read nor written until the migration is done.
+Enable it within a maintenance window. To partition an existing database
+later, enable the setting and run:
+
+    manage.py migrate schedule 0007
+    manage.py migrate schedule
+
+The reverse migration restores the regular table if it is partitioned.
+"""
+
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db import migrations
+
+TABLE = "schedule_availabilityslot"
+OLD_TABLE = f"{TABLE}_old"
+MONTHS_AHEAD = 14
+COLUMNS = ("start_datetime", "end_datetime", "professional_id", "service_id")
+FOREIGN_KEYS = (
+    ("professional_id", "professionals_professional"),
+    ("service_id", "services_service"),
+)
+
+
+def _get_month(date: datetime, shift: int = 0) -> datetime:
+    """Return the first day of the month shifted by the months."""
+    index = date.year * 12 + date.month - 1 + shift
+    return datetime(index // 12, index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _replace_table(schema_editor, partitioned: bool) -> None:
+    """Recreate the table and copy the rows from the old one."""
+    execute = schema_editor.execute
+    execute(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}")
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')",
+                       [OLD_TABLE])
+        sequence = cursor.fetchone()[0]
+        cursor.execute(f"SELECT min(start_datetime) FROM {OLD_TABLE}")
+        first = cursor.fetchone()[0]
+
+    partition_by = " PARTITION BY RANGE (start_datetime)" \
+        if partitioned else ""
+    execute(f"CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS)"
+            f"{partition_by}")
+    execute(f"ALTER SEQUENCE {sequence} OWNED BY {TABLE}.id")
+
+    if partitioned:
+        execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        now = datetime.now(timezone.utc)
+        month = _get_month(min(first, now) if first else now)
+        last = _get_month(now, MONTHS_AHEAD)
+        while month <= last:
+            following = _get_month(month, 1)
+            execute(
+                f"CREATE TABLE {TABLE}_p{month:%Y%m} PARTITION OF {TABLE} "
+                "FOR VALUES FROM (%s) TO (%s)",
+                [month, following],
+            )
+            month = following
+
+    execute(f"INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}")
+    execute(f"DROP TABLE {OLD_TABLE}")
+
+    primary_key = "id, start_datetime" if partitioned else "id"
+    execute(f"ALTER TABLE {TABLE} ADD PRIMARY KEY ({primary_key})")
+    for column in COLUMNS:
+        execute(f"CREATE INDEX {TABLE}_{column}_idx ON {TABLE} ({column})")
+    for column, target in FOREIGN_KEYS:
+        execute(f"ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_{column}_fk "
+                f"FOREIGN KEY ({column}) REFERENCES {target} (id) "
+                "DEFERRABLE INITIALLY DEFERRED")
+
+
+def _is_partitioned(schema_editor) -> bool:
+    """Check if the table is partitioned."""
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def partition(apps, schema_editor):
+    """Convert the table to the partitioned one if it is enabled."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor == "postgresql" and \
+            settings.AVAILABILITY_PARTITIONING and \
+            not _is_partitioned(schema_editor):
+        _replace_table(schema_editor, partitioned=True)
+
+
+def unpartition(apps, schema_editor):
+    """Convert the table back to the regular one."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor == "postgresql" and \
+            _is_partitioned(schema_editor):
+        _replace_table(schema_editor, partitioned=False)
+
+
+class Migration(migrations.Migration):
+
+    atomic = True
+
+    dependencies = [
+        ('schedule', '0007_auto_20201115_1709'),
+        ('professionals', '0020_remove_professional_is_last_name_hidden'),
+        ('services', '0009_auto_20200714_2014'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition, unpartition),
+    ]
@@ -0,0 +1,41 @@
+"""Add the GiST indexes of the periods ranges on PostgreSQL."""
+
+from django.db import migrations
+
+RANGE = "tstzrange(start_datetime, end_datetime, '[]')"
+INDEXES = (
+    ("schedule_availabilityslot", "professional_id, service_id"),
+    ("schedule_professionalclosedperiod", "professional_id"),
+    ("schedule_serviceclosedperiod", "service_id"),
+)
+
+
+def create_indexes(apps, schema_editor):
+    """Create the indexes."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    for table, columns in INDEXES:
+        schema_editor.execute(f"CREATE INDEX {table}_period_gist ON {table} "
+                              f"USING gist ({columns}, {RANGE})")
+
+
+def drop_indexes(apps, schema_editor):
+    """Drop the indexes."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for table, _ in INDEXES:
+        schema_editor.execute(f"DROP INDEX {table}_period_gist")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0008_availabilityslot_partitioning'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_indexes, drop_indexes),
+    ]
@@ -0,0 +1,35 @@
+"""Add the index of the availability slots lengths on PostgreSQL."""
+
+from django.db import migrations
+
+TABLE = "schedule_availabilityslot"
+INDEX = f"{TABLE}_length_idx"
+
+
+def create_index(apps, schema_editor):
+    """Create the index."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        f"CREATE INDEX {INDEX} ON {TABLE} "
+        "(professional_id, service_id, (end_datetime - start_datetime))")
+
+
+def drop_index(apps, schema_editor):
+    """Drop the index."""
+    # pylint: disable=unused-argument
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(f"DROP INDEX {INDEX}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('schedule', '0009_period_range_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
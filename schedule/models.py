@@ -1,6 +1,7 @@
 """The schedule models module."""
 
-from typing import Iterable
+from datetime import datetime
+from typing import Iterable, Optional, Tuple
 
 from django.conf import settings
 from django.db import models
@@ -81,6 +82,18 @@ class AbstractPeriod(models.Model):
         db_index=True,
     )
 
+    initial_period: Optional[Tuple[datetime, datetime]] = None
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """Create the object from the database and keep its period."""
+        instance = super().from_db(db, field_names, values)
+        start = instance.__dict__.get("start_datetime")
+        end = instance.__dict__.get("end_datetime")
+        if start and end:
+            instance.initial_period = (start, end)
+        return instance
+
     def __str__(self) -> str:
         """Return the string representation."""
         return f"{self.start_datetime}-{self.end_datetime}"
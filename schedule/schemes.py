@@ -1,7 +1,9 @@
 """The schedule schemes module."""
 from drf_yasg import openapi
 
-from schedule.calendar.request import HTTPToCalendarRequestConverter
+from schedule.calendar.request import (CalendarRequest,
+                                       HTTPToCalendarBatchRequestConverter,
+                                       HTTPToCalendarRequestConverter)
 
 from .serializers import ProfessionalCalendarSerializer
 
@@ -35,6 +37,53 @@ class ProfessionalCalendarSchema():
                 description="YYYY-MM-DDTHH:mm:ss (2020-08-23T16:19:43)",
                 type=openapi.TYPE_STRING,
             ),
+            openapi.Parameter(
+                HTTPToCalendarRequestConverter.MODE_PARAM,
+                openapi.IN_QUERY,
+                description=("slots (default), starts (the bookable start "
+                             "times of the service) or summary (the "
+                             "availability by the local days)"),
+                type=openapi.TYPE_STRING,
+                enum=list(CalendarRequest.MODES),
+            ),
+            openapi.Parameter(
+                HTTPToCalendarRequestConverter.STREAM_PARAM,
+                openapi.IN_QUERY,
+                description="stream the slots (1 or true)",
+                type=openapi.TYPE_STRING,
+            ),
+        ],
+        "responses": {
+            200: ProfessionalCalendarSerializer(many=True)
+        },
+    }
+
+    batch_schema = {
+        "manual_parameters": [
+            openapi.Parameter(
+                HTTPToCalendarBatchRequestConverter.PROFESSIONALS_PARAM,
+                openapi.IN_QUERY,
+                description="comma separated professionals pks",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                HTTPToCalendarBatchRequestConverter.SERVICES_PARAM,
+                openapi.IN_QUERY,
+                description="comma separated services pks",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                HTTPToCalendarBatchRequestConverter.START_DATETIME_PARAM,
+                openapi.IN_QUERY,
+                description="YYYY-MM-DDTHH:mm:ss (2020-08-23T16:19:43)",
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                HTTPToCalendarBatchRequestConverter.END_DATETIME_PARAM,
+                openapi.IN_QUERY,
+                description="YYYY-MM-DDTHH:mm:ss (2020-08-23T16:19:43)",
+                type=openapi.TYPE_STRING,
+            ),
         ],
         "responses": {
             200: ProfessionalCalendarSerializer(many=True)
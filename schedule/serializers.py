@@ -27,6 +27,31 @@ class ProfessionalCalendarSerializer(serializers.Serializer):
     )
 
 
+class ProfessionalCalendarStartTimeSerializer(serializers.Serializer):
+    """The professional calendar start time serializer."""
+
+    # pylint: disable=abstract-method
+
+    start_datetime = serializers.DateTimeField()
+    end_datetime = serializers.DateTimeField()
+    service = serializers.PrimaryKeyRelatedField(
+        many=False,
+        read_only=True,
+    )
+
+
+class ProfessionalCalendarDaySerializer(serializers.Serializer):
+    """The professional calendar day summary serializer."""
+
+    # pylint: disable=abstract-method
+
+    day = serializers.DateField()
+    available_minutes = serializers.IntegerField()
+    first_available_at = serializers.DateTimeField()
+    last_available_at = serializers.DateTimeField()
+    bookable_starts = serializers.IntegerField(allow_null=True)
+
+
 class ServiceClosedPeriodSerializer(ModelCleanFieldsSerializer):
     """The service closed period serializer."""
 
@@ -1,12 +1,11 @@
 """The signals module."""
 
-from typing import Union
-
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from schedule.availability import (generate_for_professional,
-                                   generate_for_service)
+from schedule.availability import get_period_window
+from schedule.availability.deferred import (defer_for_professional,
+                                            defer_for_service)
 from services.models import Service
 
 from .models import (ProfessionalClosedPeriod, ProfessionalSchedule,
@@ -23,6 +22,16 @@ from .models import (ProfessionalClosedPeriod, ProfessionalSchedule,
     sender=ProfessionalSchedule,
     dispatch_uid="professional_schedule_post_delete",
 )
+def professional_schedule_receiver(
+    sender,
+    instance: ProfessionalSchedule,
+    **kwargs,
+):
+    """Generate the professional schedule."""
+    # pylint: disable=unused-argument
+    defer_for_professional(instance.professional)
+
+
 @receiver(
     post_save,
     sender=ProfessionalClosedPeriod,
@@ -33,14 +42,14 @@ from .models import (ProfessionalClosedPeriod, ProfessionalSchedule,
     sender=ProfessionalClosedPeriod,
     dispatch_uid="professional_closed_period_post_delete",
 )
-def professional_schedule_receiver(
+def professional_closed_period_receiver(
     sender,
-    instance: Union[ProfessionalSchedule, ProfessionalClosedPeriod],
+    instance: ProfessionalClosedPeriod,
     **kwargs,
 ):
-    """Generate the professional schedule."""
+    """Generate the professional schedule within the closed period."""
     # pylint: disable=unused-argument
-    generate_for_professional(professional=instance.professional)
+    defer_for_professional(instance.professional, get_period_window(instance))
 
 
 @receiver(
@@ -53,6 +62,16 @@ def professional_schedule_receiver(
     sender=ServiceSchedule,
     dispatch_uid="service_schedule_post_delete",
 )
+def service_schedule_receiver(
+    sender,
+    instance: ServiceSchedule,
+    **kwargs,
+):
+    """Run the update availability tasks."""
+    # pylint: disable=unused-argument
+    defer_for_service(instance.service)
+
+
 @receiver(
     post_save,
     sender=ServiceClosedPeriod,
@@ -63,14 +82,14 @@ def professional_schedule_receiver(
     sender=ServiceClosedPeriod,
     dispatch_uid="service_closed_period_post_delete",
 )
-def service_schedule_receiver(
+def service_closed_period_receiver(
     sender,
-    instance: Union[ServiceSchedule, ServiceClosedPeriod],
+    instance: ServiceClosedPeriod,
     **kwargs,
 ):
-    """Run the update availability tasks."""
+    """Run the update availability tasks within the closed period."""
     # pylint: disable=unused-argument
-    generate_for_service(service=instance.service)
+    defer_for_service(instance.service, get_period_window(instance))
 
 
 @receiver(
@@ -86,4 +105,4 @@ def service_receiver(
     """Run the update availability tasks."""
     # pylint: disable=unused-argument
     if not instance.is_base_schedule:
-        generate_for_service(service=instance)
+        defer_for_service(instance)
@@ -6,6 +6,7 @@ from django.contrib.admin.sites import AdminSite
 from django.db.models import QuerySet
 from django.test.client import Client
 from django.urls import reverse
+from pytest_mock import MockFixture
 
 from schedule.admin import AvailabilitySlotAdmin
 from schedule.models import AvailabilitySlot
@@ -42,3 +43,27 @@ def test_availability_slot_admin_list_filter(
     assert response.status_code == 200
     assert response.wsgi_request.GET.get(
         "professional__pk__exact") == professionals.first().pk
+
+
+def test_schedule_admin_generation_scope(
+    professional_schedules: QuerySet,
+    admin_client: Client,
+    mocker: MockFixture,
+):
+    """Should regenerate the slots once for the bulk deletion."""
+    generator = mocker.patch(
+        "schedule.availability.deferred.generate_for_professional")
+    professional = professional_schedules.first().professional
+    response = admin_client.post(
+        reverse("admin:schedule_professionalschedule_changelist"),
+        {
+            "action": "delete_selected",
+            "_selected_action": list(
+                professional.schedule.values_list("pk", flat=True)),
+            "post": "yes",
+        },
+    )
+
+    assert response.status_code == 302
+    assert not professional.schedule.exists()
+    generator.assert_called_once()
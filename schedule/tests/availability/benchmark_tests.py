@@ -0,0 +1,62 @@
+"""The availability benchmark test module."""
+import pytest
+from django.db import transaction
+from pytest_mock import MockFixture
+
+from orders.models import Order
+from professionals.models import Professional
+from schedule.availability.benchmark import (AvailabilityBenchmark, Workload,
+                                             WorkloadSeeder)
+from schedule.models import (AvailabilitySlot, ProfessionalClosedPeriod,
+                             ProfessionalSchedule)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_workload_seeder_seed():
+    """Should seed the synthetic workload."""
+    workload = Workload(
+        professionals=2,
+        schedules_per_day=3,
+        days_per_week=4,
+        orders=5,
+        closed_periods=2,
+    )
+    with transaction.atomic():
+        professionals = WorkloadSeeder(workload).seed()
+        assert len(professionals) == 2
+        schedules = ProfessionalSchedule.objects.filter(
+            professional__in=professionals)
+        assert schedules.count() == 24
+        for schedule in schedules:
+            assert schedule.start_time < schedule.end_time
+        assert ProfessionalClosedPeriod.objects.filter(
+            professional__in=professionals).count() == 4
+        assert Order.objects.filter(
+            service__professional__in=professionals).count() == 10
+        transaction.set_rollback(True)
+
+
+def test_availability_benchmark_run(mocker: MockFixture):
+    """Should time the stages and roll back the workload."""
+    bump_version = mocker.patch("schedule.availability.db.bump_version")
+    total_professionals = Professional.objects.count()
+    total_slots = AvailabilitySlot.objects.count()
+    report = AvailabilityBenchmark(
+        Workload(professionals=2, orders=3, closed_periods=1)).run()
+
+    stages = report["stages"]
+    for stage in ("request", "generation", "restriction.closed_periods",
+                  "restriction.orders", "saving", "total"):
+        assert stages[stage]["count"] == 2
+        assert stages[stage]["min"] <= stages[stage]["median"]
+    assert report["workload"]["professionals"] == 2
+    assert report["generator"]
+    counters = report["counters"]
+    assert counters["slots_generated"] > 0
+    assert counters["slots_inserted"] == counters["slots_restricted"]
+    assert counters["schedules"] == 20
+    assert counters["orders"] <= 6
+    assert Professional.objects.count() == total_professionals
+    assert AvailabilitySlot.objects.count() == total_slots
+    bump_version.assert_not_called()
@@ -0,0 +1,101 @@
+"""The availability context test module."""
+import arrow
+import pytest
+from django.conf import settings
+from django.db.models.query import QuerySet
+
+from orders.models import Order
+from schedule.availability.context import (GenerationContext,
+                                           get_generation_context)
+from schedule.availability.request import Request
+from schedule.models import (ProfessionalClosedPeriod, ProfessionalSchedule,
+                             ServiceClosedPeriod, ServiceSchedule)
+
+pytestmark = pytest.mark.django_db
+
+
+def test_generation_context_load(
+    professional_schedules: QuerySet,
+    service_schedules: QuerySet,
+    professional_closed_periods: QuerySet,
+    service_closed_periods: QuerySet,
+    orders: QuerySet,
+):
+    """Should load and group the generation data."""
+    # pylint: disable=unused-argument
+    order = orders.first()
+    professional = order.service.professional
+    service = order.service
+    start = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    context = get_generation_context([professional.pk])
+
+    assert context.start_datetime == start
+    assert context.end_datetime == start.shift(years=1)
+    assert context.get_schedules(professional) == \
+        ProfessionalSchedule.objects.get_by_days(professional)
+    assert context.get_schedules(professional, service) == \
+        ServiceSchedule.objects.get_by_days(service)
+    assert context.get_closed_periods(professional) == list(
+        ProfessionalClosedPeriod.objects.get_between_dates(
+            context.start_datetime, context.end_datetime, professional))
+    assert context.get_closed_periods(professional, service) == list(
+        ServiceClosedPeriod.objects.get_between_dates(
+            context.start_datetime, context.end_datetime, service))
+    assert set(context.get_orders(professional)) == set(
+        Order.objects.get_between_dates(
+            context.start_datetime,
+            context.end_datetime,
+            professional,
+        ))
+    assert context.get_orders(professional, service) == [order]
+
+
+def test_generation_context_is_covering(professionals: QuerySet):
+    """Should check if the context contains the request data."""
+    professional = professionals.first()
+    start = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    context = GenerationContext([professional.pk], start, start.shift(days=5))
+    request = Request()
+    request.professional = professional
+    request.start_datetime = start
+    request.end_datetime = start.shift(days=5)
+    request.context = context
+
+    assert context.is_covering(request)
+    assert request.get_context() == context
+
+    request.end_datetime = start.shift(days=6)
+    assert not context.is_covering(request)
+    assert request.get_context() is None
+
+    request.end_datetime = start.shift(days=5)
+    request.professional = professionals.last()
+    assert not context.is_covering(request)
+
+
+def test_get_generation_context_append_days(professionals: QuerySet):
+    """Should return the context for the appended days."""
+    start = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    ).shift(years=1)
+    context = get_generation_context(
+        [professionals.first().pk],
+        append_days=True,
+    )
+
+    assert context.start_datetime == start
+    assert context.end_datetime == start.shift(
+        days=settings.AVAILABILITY_DAYS_TO_APPEND)
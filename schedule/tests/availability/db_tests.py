@@ -2,10 +2,16 @@
 import arrow
 import pytest
 from django.db.models.query import QuerySet
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockFixture
 
-from schedule.availability.db import DeleteSaver
+from schedule.availability.db import (DeleteSaver, DiffSaver, SaverReport,
+                                      WindowSaver)
 from schedule.availability.exceptions import AvailabilityValueError
-from schedule.availability.request import Request, RequestYearProcessor
+from schedule.availability.request import (Request, RequestWindowProcessor,
+                                           RequestYearProcessor)
+from schedule.availability.slots import Slot
+from schedule.availability.versions import get_version
 from schedule.models import AvailabilitySlot
 
 pytestmark = pytest.mark.django_db
@@ -42,25 +48,127 @@ def test_delete_saver_save(professionals: QuerySet):
     start = arrow.utcnow()
     end = start.shift(hours=3)
     professional = professionals.first()
-    slot = AvailabilitySlot()
-    slot.professional = professional
-    slot.start_datetime = start.datetime
-    slot.end_datetime = end.datetime
-    slot.save()
-
-    pk = slot.pk
-    slot.pk = None
+    old_slot = AvailabilitySlot.objects.create(
+        professional=professional,
+        start_datetime=start.datetime,
+        end_datetime=end.datetime,
+    )
+    slot = Slot.from_model(old_slot)
 
     request = Request()
     request.professional = professionals.first()
     request = RequestYearProcessor().get(request)
 
+    version = get_version(professional.pk)
     saver = DeleteSaver()
     saver.set_request(request).set_slots([slot])
     saver.save()
 
     slots = AvailabilitySlot.objects.all()
     assert slots.count() == 1
-    assert slot.pk != pk
+    assert slots.first().pk != old_slot.pk
+    assert saver.report == SaverReport(inserted=1, deleted=1)
+    assert get_version(professional.pk) != version
 
     assert saver.set_slots([]).save() is None  # type: ignore
+
+
+def test_window_saver_save(
+    professionals: QuerySet,
+    availability_slots: QuerySet,
+):
+    """Should replace the slots within the window only."""
+    professional = professionals.first()
+    slots = availability_slots.filter(
+        professional=professional,
+        service__isnull=True,
+    )
+    total = slots.count()
+    start = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    ).shift(days=10)
+
+    request = Request()
+    request.professional = professional
+    request.start_datetime = start.shift(hours=10)
+    request.end_datetime = start.shift(hours=11)
+    request = RequestWindowProcessor().get(request)
+
+    inside = Slot(
+        professional.pk,
+        None,
+        start.replace(hour=10).datetime,
+        start.replace(hour=12).datetime,
+    )
+    outside = Slot(
+        professional.pk,
+        None,
+        start.shift(days=1, hours=10).datetime,
+        start.shift(days=1, hours=12).datetime,
+    )
+
+    saver = WindowSaver()
+    with pytest.raises(AvailabilityValueError) as error:
+        saver.set_request(Request()).set_slots([])._check_request()
+    assert "window is not set" in str(error)
+
+    saver.set_request(request).set_slots([inside, outside]).save()
+
+    assert slots.count() == total
+    assert slots.filter(start_datetime=inside.start_datetime).exists()
+    assert not slots.filter(start_datetime=outside.start_datetime).exists()
+    assert not slots.filter(
+        start_datetime=start.replace(hour=9).datetime).exists()
+
+
+def test_diff_saver_save(
+    professionals: QuerySet,
+    availability_slots: QuerySet,
+    mocker: MockFixture,
+    settings: SettingsWrapper,
+):
+    """Should save the changed slots only."""
+    professional = professionals.first()
+    slots = availability_slots.filter(
+        professional=professional,
+        service__isnull=True,
+    )
+    total = slots.count()
+    request = Request()
+    request.professional = professional
+    request = RequestYearProcessor().get(request)
+
+    new_slots = [
+        Slot.from_model(s) for s in slots.order_by("start_datetime")
+    ]
+    changed = new_slots[0]
+    changed_pk = slots.get(start_datetime=changed.start_datetime).pk
+    unchanged_pk = slots.get(start_datetime=new_slots[1].start_datetime).pk
+    changed.end_datetime = arrow.get(changed.end_datetime).shift(
+        minutes=30).datetime
+
+    saver = DiffSaver()
+    saver.set_request(request).set_slots(new_slots).save()
+
+    assert slots.count() == total
+    assert saver.report == SaverReport(
+        inserted=1,
+        deleted=1,
+        unchanged=total - 1,
+    )
+    assert not slots.filter(pk=changed_pk).exists()
+    assert slots.filter(pk=unchanged_pk).exists()
+    assert slots.filter(end_datetime=changed.end_datetime).exists()
+
+    saver.set_slots([]).save()
+    assert slots.count() == 0
+    assert saver.report == SaverReport(deleted=total)
+
+    copy = mocker.patch.object(DiffSaver, "_copy")
+    settings.AVAILABILITY_DIFF_SAVER_COPY_THRESHOLD = 1
+    saver.set_slots([changed]).save()
+    copy.assert_called_once_with([changed])
+    assert saver.report == SaverReport(inserted=1)
@@ -0,0 +1,233 @@
+"""The availability deferred test module."""
+from unittest.mock import patch
+
+import arrow
+import pytest
+from django.db.models.query import QuerySet
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockFixture
+from redis.exceptions import RedisError
+
+from d8b.redis import redis
+from schedule.availability.deferred import (DIRTY_KEY, SCHEDULED_KEY,
+                                            GenerationScope,
+                                            defer_for_order,
+                                            defer_for_professional,
+                                            defer_for_service,
+                                            generate_deferred, pop_markers)
+from schedule.models import AvailabilitySlot
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def deferred(settings: SettingsWrapper, mocker: MockFixture):
+    """Enable the deferred generation."""
+    settings.AVAILABILITY_DEFERRED_GENERATION = True
+    redis.delete(DIRTY_KEY, SCHEDULED_KEY)
+    mocker.patch(
+        "schedule.availability.deferred.transaction.on_commit",
+        side_effect=lambda func: func(),
+    )
+    yield mocker.patch("schedule.availability.deferred.app.signature")
+    redis.delete(DIRTY_KEY, SCHEDULED_KEY)
+
+
+def test_defer_synchronously(
+    professionals: QuerySet,
+    settings: SettingsWrapper,
+    mocker: MockFixture,
+):
+    """Should generate the slots at once."""
+    settings.AVAILABILITY_DEFERRED_GENERATION = False
+    generator = mocker.patch(
+        "schedule.availability.deferred.generate_for_professional")
+    professional = professionals.first()
+    defer_for_professional(professional)
+    generator.assert_called_once_with(
+        professional=professional,
+        is_window=False,
+        start=None,
+        end=None,
+    )
+
+
+def test_defer_coalesce_markers(
+    professionals: QuerySet,
+    services: QuerySet,
+    deferred,
+):
+    """Should coalesce the markers of the same entity."""
+    professional = professionals.first()
+    service = services.first()
+    start = arrow.get(arrow.utcnow().timestamp)
+    defer_for_professional(professional, (start, start.shift(hours=1)))
+    defer_for_professional(
+        professional,
+        (start.shift(days=1), start.shift(days=1, hours=1)),
+    )
+    defer_for_service(service, (start, start.shift(hours=1)))
+    defer_for_service(service)
+
+    assert deferred.call_count == 1
+    assert pop_markers() == {
+        ("professional", professional.pk):
+            (start, start.shift(days=1, hours=1)),
+        ("service", service.pk): (None, None),
+    }
+    assert pop_markers() == {}
+
+
+def test_defer_for_order(orders: QuerySet, deferred):
+    """Should record the order markers."""
+    # pylint: disable=unused-argument
+    order = orders.exclude(service__is_base_schedule=True).first()
+    defer_for_order(order)
+    markers = pop_markers()
+
+    assert set(markers.keys()) == {
+        ("professional", order.service.professional.pk),
+        ("service", order.service.pk),
+    }
+
+
+def test_generate_deferred(
+    professionals: QuerySet,
+    deferred,
+    mocker: MockFixture,
+):
+    """Should generate the slots for the markers."""
+    # pylint: disable=unused-argument
+    generator = mocker.patch(
+        "schedule.availability.deferred.generate_for_professional",
+        side_effect=[ValueError("error"), None],
+    )
+    start = arrow.get(arrow.utcnow().timestamp)
+    for professional in professionals[:2]:
+        defer_for_professional(professional, (start, start.shift(hours=1)))
+
+    assert generate_deferred() == 2
+    assert generator.call_count == 2
+    generator.assert_called_with(
+        professional=professionals[1],
+        is_window=True,
+        start=start,
+        end=start.shift(hours=1),
+    )
+    assert generate_deferred() == 0
+
+
+def test_generate_deferred_combined(
+    services: QuerySet,
+    deferred,
+    mocker: MockFixture,
+):
+    """Should generate the professional with its services together."""
+    # pylint: disable=unused-argument
+    combined = mocker.patch("schedule.availability.deferred."
+                            "generate_for_professional_with_services")
+    generator = mocker.patch(
+        "schedule.availability.deferred.generate_for_service")
+    service = services.filter(is_base_schedule=False).first()
+    other = services.filter(is_base_schedule=False).exclude(
+        professional=service.professional).first()
+    start = arrow.get(arrow.utcnow().timestamp)
+    defer_for_professional(service.professional, (start, start.shift(hours=1)))
+    defer_for_service(service, (start.shift(hours=2), start.shift(hours=3)))
+    defer_for_service(other)
+
+    assert generate_deferred() == 3
+    combined.assert_called_once_with(
+        professional=service.professional,
+        services=[service],
+        is_window=True,
+        start=start,
+        end=start.shift(hours=3),
+    )
+    generator.assert_called_once_with(
+        service=other,
+        is_window=False,
+        start=None,
+        end=None,
+    )
+
+
+def test_generation_scope(
+    professionals: QuerySet,
+    settings: SettingsWrapper,
+    mocker: MockFixture,
+):
+    """Should generate the slots once per entity on the scope exit."""
+    settings.AVAILABILITY_DEFERRED_GENERATION = False
+    generator = mocker.patch(
+        "schedule.availability.deferred.generate_for_professional")
+    first, second = professionals[:2]
+    start = arrow.get(arrow.utcnow().timestamp)
+    with GenerationScope():
+        with GenerationScope():
+            defer_for_professional(first, (start, start.shift(hours=1)))
+            defer_for_professional(second)
+        defer_for_professional(
+            first,
+            (start.shift(days=1), start.shift(days=1, hours=1)),
+        )
+        defer_for_professional(second, (start, start.shift(hours=1)))
+        assert generator.call_count == 0
+
+    assert generator.call_count == 2
+    generator.assert_any_call(
+        professional=first,
+        is_window=True,
+        start=start,
+        end=start.shift(days=1, hours=1),
+    )
+    generator.assert_any_call(
+        professional=second,
+        is_window=False,
+        start=None,
+        end=None,
+    )
+
+
+def test_generation_scope_decorator(
+    professionals: QuerySet,
+    settings: SettingsWrapper,
+    mocker: MockFixture,
+):
+    """Should generate the slots after an error in the decorated function."""
+    settings.AVAILABILITY_DEFERRED_GENERATION = False
+    generator = mocker.patch(
+        "schedule.availability.deferred.generate_for_professional")
+
+    @GenerationScope()
+    def change():
+        for _ in range(3):
+            defer_for_professional(professionals.first())
+        raise ValueError("error")
+
+    with pytest.raises(ValueError):
+        change()
+    generator.assert_called_once()
+    assert GenerationScope.get_current() is None
+
+
+def test_defer_redis_error(
+    professional_schedules: QuerySet,
+    deferred,
+    mocker: MockFixture,
+):
+    """Should generate the slots synchronously without Redis."""
+    professional = professional_schedules.first().professional
+    AvailabilitySlot.objects.filter(professional=professional).delete()
+    error = mocker.patch("schedule.availability.db.logging.getLogger")
+
+    with patch.object(redis, "execute_command",
+                      side_effect=RedisError("error")):
+        defer_for_professional(professional)
+
+    assert AvailabilitySlot.objects.filter(
+        professional=professional).exists()
+    deferred.assert_not_called()
+    assert "Availability version error: %s; professional %s" in [
+        c[0][0] for c in error.return_value.error.call_args_list
+    ]
@@ -1,5 +1,6 @@
 """The availability generator test module."""
 import logging
+import random
 from datetime import time
 
 import arrow
@@ -7,13 +8,17 @@ import pytest
 from _pytest.logging import LogCaptureFixture
 from django.db.models.query import QuerySet
 from django.utils import timezone
+from pytest_mock import MockFixture
 
 from schedule.availability.exceptions import AvailabilityValueError
-from schedule.availability.generator import (DefaultGenerator,
-                                             get_availability_generator)
+from schedule.availability.generator import (
+    DefaultGenerator, VectorizedGenerator, get_availability_generator,
+    get_virtual_availability_generator)
 from schedule.availability.request import (Request, RequestAppendProcessor,
+                                           RequestDatesProcessor,
                                            RequestYearProcessor)
 from schedule.availability.restrictions import AbstractRestriction
+from schedule.availability.slots import Slot
 from schedule.models import (AvailabilitySlot, ProfessionalSchedule,
                              ServiceSchedule)
 
@@ -158,7 +163,8 @@ def test_default_generator_get_professional(professional_schedules: QuerySet):
 
     slots = generator.get()
     assert len(slots) == 6 * 2
-    assert slots[0].professional == professional
+    assert slots[0].professional_id == professional.pk
+    assert slots[0].service_id is None
     assert slots[0].start_datetime.utcoffset().total_seconds() == 0
 
     expected = start.replace(hour=9)
@@ -200,8 +206,8 @@ def test_default_generator_get_service(service_schedules: QuerySet):
     slots = generator.get()
 
     assert len(slots) == 6 * 2
-    assert slots[0].professional == service.professional
-    assert slots[0].service == service
+    assert slots[0].professional_id == service.professional_id
+    assert slots[0].service_id == service.pk
     assert slots[0].start_datetime.utcoffset().total_seconds() == 0
 
 
@@ -323,6 +329,7 @@ def test_availability_get_generator(
 
     assert isinstance(generator.logger, logging.Logger)
     assert isinstance(generator.request_processor, RequestYearProcessor)
+    assert isinstance(generator.generator, DefaultGenerator)
 
     request.append_days = True
     generator = get_availability_generator(request)
@@ -338,6 +345,62 @@ def test_availability_get_generator(
     assert AvailabilitySlot.objects.all().count() > 0
 
 
+def test_availability_generator_report(
+    professional_schedules: QuerySet,
+    mocker: MockFixture,
+    caplog: LogCaptureFixture,
+):
+    """Should time the stages, count the entries and send the report."""
+    request = Request()
+    request.professional = professional_schedules.first().professional
+    generator = get_availability_generator(request)
+    send = mocker.patch.object(generator.metrics, "send")
+    AvailabilitySlot.objects.filter(
+        professional=request.professional).delete()
+
+    caplog.clear()
+    report = generator.generate()
+
+    assert set(report.timings) == {
+        "request",
+        "generation",
+        "restriction.closed_periods",
+        "restriction.orders",
+        "saving",
+        "total",
+    }
+    assert report.counters["schedules"] == 10
+    assert report.counters["slots_generated"] > 0
+    assert report.counters["slots_inserted"] == \
+        report.counters["slots_restricted"]
+    assert report.counters["slots_deleted"] == 0
+    assert "closed_periods" in report.counters
+    assert "orders" in report.counters
+    send.assert_called_once_with(
+        "availability",
+        report.timings,
+        report.counters,
+    )
+    assert caplog.records[0].availability["counters"] == report.counters
+
+
+def test_availability_get_virtual_generator(
+        professional_schedules: QuerySet):
+    """Should return the slots without saving them."""
+    request = Request()
+    request.professional = professional_schedules.first().professional
+    request.start_datetime = arrow.utcnow().shift(days=1)
+    request.end_datetime = arrow.utcnow().shift(days=8)
+    generator = get_virtual_availability_generator(request)
+    AvailabilitySlot.objects.all().delete()
+
+    assert isinstance(generator.request_processor, RequestDatesProcessor)
+    slots = generator.get_slots()
+    assert slots
+    assert all(isinstance(s, Slot) for s in slots)
+    assert AvailabilitySlot.objects.all().count() == 0
+
+
 def test_availability_generator_exception(
     professionals: QuerySet,
     caplog: LogCaptureFixture,
@@ -385,3 +448,50 @@ def test_availability_generator_apply_restrictions():
     slots = generator._apply_restrictions([1, 2, 3])  # type: ignore
 
     assert slots == [5, 6, 7]
+
+
+@pytest.mark.parametrize("zone", [
+    "UTC",
+    "America/New_York",
+    "Europe/London",
+    "Australia/Lord_Howe",
+])
+def test_vectorized_generator_get(professionals: QuerySet, zone: str):
+    """Should generate the same slots as the default generator."""
+    professional = professionals.first()
+    rand = random.Random(zone)
+    timezone.activate(zone)
+    for day in range(7):
+        minutes = 0
+        for _ in range(rand.randint(0, 3)):
+            start = minutes + rand.choice([0, 60, 90, 120, rand.randint(
+                0, 300)])
+            end = start + rand.choice([15, 30, 60, rand.randint(15, 400)])
+            if end >= 24 * 60:
+                break
+            schedule = ProfessionalSchedule()
+            schedule.professional = professional
+            schedule.day_of_week = day
+            schedule.start_time = time(start // 60, start % 60)
+            schedule.end_time = time(end // 60, end % 60)
+            schedule.save()
+            minutes = end
+    timezone.activate("UTC")
+
+    start = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    request = Request()
+    request.professional = professional
+    request.start_datetime = start
+    request.end_datetime = start.shift(years=1)
+
+    expected = DefaultGenerator().set_request(request).get()
+    slots = VectorizedGenerator().set_request(request).get()
+
+    assert [(s.start_datetime, s.end_datetime) for s in slots] == \
+        [(s.start_datetime, s.end_datetime) for s in expected]
+    assert all(s.professional_id == professional.pk for s in slots)
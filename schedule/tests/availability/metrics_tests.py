@@ -0,0 +1,19 @@
+"""The availability metrics test module."""
+from schedule.availability.metrics import GenerationReport
+
+
+def test_generation_report_merge():
+    """Should add the timings and the counters."""
+    report = GenerationReport()
+    report.add_timing("generation", 0.5)
+    report.add_counter("slots_generated", 2)
+    other = GenerationReport(
+        timings={"generation": 0.25, "saving": 1.0},
+        counters={"slots_generated": 3, "orders": 1},
+    )
+    report.merge(other)
+
+    assert report.timings == {"generation": 0.75, "saving": 1.0}
+    assert report.counters == {"slots_generated": 5, "orders": 1}
+    assert "generation: 750.0 ms" in str(report)
+    assert "orders: 1" in str(report)
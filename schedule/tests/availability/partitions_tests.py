@@ -0,0 +1,113 @@
+"""The availability partitions test module."""
+import arrow
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.db.models.query import QuerySet
+from pytest_mock import MockFixture
+
+from schedule.availability.partitions import (TABLE, create_partition,
+                                              create_upcoming_partitions,
+                                              drop_expired_partitions,
+                                              get_partition_name,
+                                              get_partitions, is_partitioned,
+                                              maintain_partitions)
+from schedule.models import AvailabilitySlot
+
+pytestmark = pytest.mark.django_db
+
+
+def _create_slot(professional, start: arrow.Arrow, end: arrow.Arrow):
+    """Create the slot without the validation."""
+    return AvailabilitySlot.objects.bulk_create([
+        AvailabilitySlot(
+            professional=professional,
+            start_datetime=start.datetime,
+            end_datetime=end.datetime,
+        )
+    ])[0]
+
+
+def _count(table: str) -> int:
+    """Return the number of the table rows."""
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT count(*) FROM {table}")
+        return cursor.fetchone()[0]
+
+
+def test_get_partitions():
+    """Should return the upcoming monthly partitions."""
+    assert is_partitioned()
+    create_upcoming_partitions()
+    month = arrow.utcnow().floor("month")
+    partitions = get_partitions()
+    for i in range(settings.AVAILABILITY_PARTITIONS_AHEAD + 1):
+        current = month.shift(months=i)
+        assert partitions[get_partition_name(current)] == current
+
+
+def test_create_upcoming_partitions():
+    """Should create the missing partitions."""
+    create_upcoming_partitions()
+    month = arrow.utcnow().floor("month").shift(months=2)
+    name = get_partition_name(month)
+    with connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+        cursor.execute(f"DROP TABLE {name}")
+
+    assert create_upcoming_partitions() == [name]
+    assert create_upcoming_partitions() == []
+
+
+def test_create_partition(professionals: QuerySet):
+    """Should move the rows from the default partition."""
+    month = arrow.utcnow().floor("month").shift(
+        months=settings.AVAILABILITY_PARTITIONS_AHEAD + 3)
+    default = _count(f"{TABLE}_default")
+    slot = _create_slot(
+        professionals.first(),
+        month.shift(days=3),
+        month.shift(days=3, hours=2),
+    )
+    assert _count(f"{TABLE}_default") == default + 1
+
+    name = create_partition(month)
+    assert _count(f"{TABLE}_default") == default
+    assert _count(name) == 1
+    assert AvailabilitySlot.objects.filter(pk=slot.pk).exists()
+
+
+def test_drop_expired_partitions(professionals: QuerySet):
+    """Should drop the partitions with the expired slots only."""
+    professional = professionals.first()
+    month = arrow.utcnow().floor("month").shift(months=-3)
+    expired = create_partition(month)
+    active = create_partition(month.shift(months=1))
+    _create_slot(professional, month, month.shift(hours=2))
+    _create_slot(
+        professional,
+        month.shift(months=1),
+        arrow.utcnow().shift(days=1),
+    )
+
+    dropped = drop_expired_partitions()
+    assert expired in dropped
+    assert active not in dropped
+    assert expired not in get_partitions()
+    assert active in get_partitions()
+    assert AvailabilitySlot.objects.filter(
+        professional=professional,
+        start_datetime__lt=month.shift(months=2).datetime,
+    ).count() == 1
+
+
+def test_maintain_partitions(mocker: MockFixture):
+    """Should skip the regular table."""
+    mocker.patch(
+        "schedule.availability.partitions.is_partitioned",
+        return_value=False,
+    )
+    creator = mocker.patch(
+        "schedule.availability.partitions.create_upcoming_partitions")
+    assert maintain_partitions() == {"created": [], "dropped": []}
+    assert not creator.called
@@ -5,9 +5,12 @@ import pytest
 from django.conf import settings
 from django.db.models.query import QuerySet
 
-from schedule.availability.exceptions import AvailabilityValueError
+from schedule.availability.exceptions import (AvailabilityEmptyWindowError,
+                                              AvailabilityValueError)
 from schedule.availability.request import (Request, RequestAppendProcessor,
+                                           RequestDatesProcessor,
                                            RequestValidator,
+                                           RequestWindowProcessor,
                                            RequestYearProcessor)
 
 pytestmark = pytest.mark.django_db
@@ -152,3 +155,68 @@ def test_availability_request_append_processor(
     ).shift(years=1)
     assert new_request.end_datetime == new_request.start_datetime.shift(
         days=settings.AVAILABILITY_DAYS_TO_APPEND)
+
+
+def test_availability_request_window_processor(
+    professionals: QuerySet,
+    availability_slots: QuerySet,
+):
+    """Should set the window and the padded dates."""
+    professional = professionals.first()
+    today = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    request = Request()
+    request.professional = professional
+    request.start_datetime = today.shift(days=5, hours=10)
+    request.end_datetime = today.shift(days=5, hours=11)
+    new_request = RequestWindowProcessor().get(request)
+    slot = availability_slots.filter(
+        professional=professional,
+        service__isnull=True,
+        start_datetime__gte=today.shift(days=5).datetime,
+    ).order_by("start_datetime").first()
+
+    assert new_request.window_start_datetime == arrow.get(slot.start_datetime)
+    assert new_request.window_end_datetime == arrow.get(slot.end_datetime)
+    margin = settings.AVAILABILITY_WINDOW_MARGIN_DAYS
+    assert new_request.start_datetime == today.shift(days=5 - margin)
+    assert new_request.end_datetime == today.shift(days=5 + margin)
+
+
+def test_availability_request_window_processor_empty(
+        professionals: QuerySet):
+    """Should raise the empty window error."""
+    request = Request()
+    request.professional = professionals.first()
+    request.start_datetime = arrow.utcnow().shift(days=-3)
+    request.end_datetime = arrow.utcnow().shift(days=-2)
+    with pytest.raises(AvailabilityEmptyWindowError):
+        RequestWindowProcessor().get(request)
+
+
+def test_availability_request_dates_processor(professionals: QuerySet):
+    """Should clamp and pad the request dates."""
+    today = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+    request = Request()
+    request.professional = professionals.first()
+    request.start_datetime = today.shift(days=-3)
+    request.end_datetime = today.shift(days=5, hours=11)
+    new_request = RequestDatesProcessor().get(request)
+    margin = settings.AVAILABILITY_WINDOW_MARGIN_DAYS
+
+    assert new_request.start_datetime == today
+    assert new_request.end_datetime == today.shift(days=5 + margin)
+
+    request.start_datetime = today.shift(years=2)
+    request.end_datetime = today.shift(years=2, days=1)
+    with pytest.raises(AvailabilityEmptyWindowError):
+        RequestDatesProcessor().get(request)
@@ -1,4 +1,5 @@
 """The availability generator test module."""
+import random
 from dataclasses import dataclass
 from datetime import datetime
 
@@ -10,9 +11,10 @@ from schedule.availability.exceptions import AvailabilityValueError
 from schedule.availability.request import Request
 from schedule.availability.restrictions import (ClosedPeriodsRestriction,
                                                 OrderRestriction,
-                                                SlotsModifier)
-from schedule.models import (AvailabilitySlot, ProfessionalClosedPeriod,
-                             ServiceClosedPeriod)
+                                                SlotsModifier,
+                                                SweepLineSlotsModifier)
+from schedule.availability.slots import Slot
+from schedule.models import ProfessionalClosedPeriod, ServiceClosedPeriod
 
 pytestmark = pytest.mark.django_db
 
@@ -51,15 +53,19 @@ def test_order_restriction_apply(orders: QuerySet):
     request.end_datetime = start.shift(days=20)
     request.professional = professional
 
-    slot1 = AvailabilitySlot()
-    slot1.professional = professional
-    slot1.start_datetime = start.shift(hours=3).datetime
-    slot1.end_datetime = start.shift(hours=3, minutes=30).datetime
+    slot1 = Slot(
+        professional.pk,
+        None,
+        start.shift(hours=3).datetime,
+        start.shift(hours=3, minutes=30).datetime,
+    )
 
-    slot2 = AvailabilitySlot()
-    slot2.professional = professional
-    slot2.start_datetime = start.shift(days=2).datetime
-    slot2.end_datetime = start.shift(days=3).datetime
+    slot2 = Slot(
+        professional.pk,
+        None,
+        start.shift(days=2).datetime,
+        start.shift(days=3).datetime,
+    )
 
     with pytest.raises(AvailabilityValueError) as error:
         restriction.apply()
@@ -88,19 +94,23 @@ def test_closed_periods_restriction_apply(
         microsecond=0,
     )
     request = Request()
-
+    request.professional = professional
     request.start_datetime = start
     request.end_datetime = start.shift(days=20)
 
-    slot1 = AvailabilitySlot()
-    slot1.professional = professional
-    slot1.start_datetime = start.datetime
-    slot1.end_datetime = start.shift(days=1).datetime
+    slot1 = Slot(
+        professional.pk,
+        None,
+        start.datetime,
+        start.shift(days=1).datetime,
+    )
 
-    slot2 = AvailabilitySlot()
-    slot2.professional = professional
-    slot2.start_datetime = start.shift(days=6).datetime
-    slot2.end_datetime = start.shift(days=7).datetime
+    slot2 = Slot(
+        professional.pk,
+        None,
+        start.shift(days=6).datetime,
+        start.shift(days=7).datetime,
+    )
 
     with pytest.raises(AvailabilityValueError) as error:
         restriction.apply()
@@ -126,15 +136,15 @@ def test_closed_periods_restriction_get_closed_periods_for_slot(
     service = service_closed_periods.first().service
     service.is_base_schedule = False
 
-    slot = AvailabilitySlot()
-    slot.professional = professional
     request = Request()
+    request.professional = professional
     start = arrow.utcnow().replace(
         hour=0,
         minute=0,
         second=0,
         microsecond=0,
     )
+    slot = Slot(professional.pk, None, start.datetime, start.datetime)
     request.start_datetime = start
     request.end_datetime = start.shift(days=20)
     restriction = ClosedPeriodsRestriction()
@@ -149,7 +159,8 @@ def test_closed_periods_restriction_get_closed_periods_for_slot(
     assert result == restriction.professionals_periods
     assert restriction.service_periods is None
 
-    slot.service = service
+    slot.service_id = service.pk
+    request.service = service
     assert len(result) == 2
     result = restriction._get_closed_periods_for_slot(slot)
     assert isinstance(result[0], ServiceClosedPeriod)
@@ -281,3 +292,53 @@ def test_slots_modifier_get_processed_slots():
             start.shift(days=21).datetime,
         ),
     ]
+
+
+def test_sweep_line_slots_modifier_get_slots_without_periods():
+    """Should produce the same slots as the default slots modifier."""
+
+    @dataclass
+    class Period():
+        """The period class."""
+
+        start_datetime: datetime
+        end_datetime: datetime
+
+    start = arrow.utcnow().replace(
+        hour=0,
+        minute=0,
+        second=0,
+        microsecond=0,
+    )
+
+    def get_period(hours: int, length: int) -> Period:
+        """Return the period."""
+        return Period(
+            start.shift(hours=hours).datetime,
+            start.shift(hours=hours + length).datetime,
+        )
+
+    modifier = SweepLineSlotsModifier()
+    default_modifier = SlotsModifier()
+    rand = random.Random(42)
+
+    assert modifier.get_slots_without_periods([], []) == []
+    slots = [get_period(1, 2)]
+    assert modifier.get_slots_without_periods(slots, []) == slots
+
+    for _ in range(500):
+        periods = [
+            get_period(rand.randint(-2, 30), rand.randint(0, 5))
+            for _ in range(rand.randint(0, 6))
+        ]
+        specs = [(rand.randint(-3, 30), rand.randint(0, 8))
+                 for _ in range(rand.randint(0, 5))]
+        expected = default_modifier.get_slots_without_periods(
+            [get_period(*spec) for spec in specs],
+            periods,
+        )
+        result = modifier.get_slots_without_periods(
+            [get_period(*spec) for spec in specs],
+            periods,
+        )
+        assert result == expected
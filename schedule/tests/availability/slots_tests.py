@@ -0,0 +1,45 @@
+"""The availability slots test module."""
+from copy import copy
+
+import arrow
+import pytest
+from django.db.models.query import QuerySet
+
+from schedule.availability.slots import Slot
+from schedule.models import AvailabilitySlot
+
+
+def test_slot_copy():
+    """Should copy and compare the slots by the values."""
+    start = arrow.utcnow()
+    slot = Slot(1, None, start.datetime, start.shift(hours=1).datetime)
+    duplicate = copy(slot)
+
+    assert duplicate == slot
+    assert duplicate is not slot
+    duplicate.end_datetime = start.shift(hours=2).datetime
+    assert duplicate != slot
+    assert slot != (1, None, slot.start_datetime, slot.end_datetime)
+    assert not hasattr(slot, "__dict__")
+    assert "Slot(1, None" in repr(slot)
+
+
+@pytest.mark.django_db
+def test_slot_to_model(services: QuerySet):
+    """Should convert the slot to the model instance and back."""
+    service = services.first()
+    start = arrow.utcnow()
+    slot = Slot(
+        service.professional_id,
+        service.pk,
+        start.datetime,
+        start.shift(hours=1).datetime,
+    )
+    model = slot.to_model()
+
+    assert isinstance(model, AvailabilitySlot)
+    assert model.pk is None
+    assert model.professional == service.professional
+    assert model.service == service
+    assert model.start_datetime == slot.start_datetime
+    assert Slot.from_model(model) == slot
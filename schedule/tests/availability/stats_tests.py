@@ -0,0 +1,96 @@
+"""The availability stats test module."""
+import arrow
+import pytest
+from django.db.models.query import QuerySet
+from pytest_django.fixtures import SettingsWrapper
+from pytest_mock import MockFixture
+
+from professionals.models import Professional
+from schedule.availability import stats
+from schedule.availability.stats import (get_availability_stats,
+                                         refresh_availability_stats,
+                                         update_availability_stats)
+from schedule.models import AvailabilitySlot
+from services.models import Service
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_availability_stats(
+    availability_slots: QuerySet,
+    settings: SettingsWrapper,
+):
+    """Should return the stats by the professionals and the services."""
+    settings.AVAILABILITY_STATS_DAYS = 2
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    professional = service.professional
+    result = get_availability_stats([professional.pk])
+    start = arrow.utcnow().floor("day")
+
+    next_available_at, minutes = result[(professional.pk, None)]
+    assert next_available_at >= start.replace(hour=9).datetime
+    assert minutes > 8 * 60
+    next_available_at, minutes = result[(professional.pk, service.pk)]
+    assert next_available_at >= start.replace(hour=11).datetime
+    assert minutes >= 4 * 60
+
+
+def test_get_availability_stats_in_progress(
+    professionals: QuerySet,
+    mocker: MockFixture,
+):
+    """Should return the current time for the slot in progress."""
+    professional = professionals.first()
+    now = arrow.utcnow().floor("minute")
+    mocker.patch.object(stats.arrow, "utcnow", return_value=now)
+    AvailabilitySlot.objects.filter(professional=professional).delete()
+    AvailabilitySlot.objects.create(
+        professional=professional,
+        start_datetime=now.shift(hours=-1).datetime,
+        end_datetime=now.shift(hours=1).datetime,
+    )
+
+    next_available_at, minutes = get_availability_stats(
+        [professional.pk])[(professional.pk, None)]
+    assert next_available_at == now.datetime
+    assert minutes == 60
+
+
+def test_update_availability_stats(
+    availability_slots: QuerySet,
+    settings: SettingsWrapper,
+    mocker: MockFixture,
+):
+    """Should update the stats of the professionals and the services."""
+    settings.AVAILABILITY_STATS_DAYS = 7
+    mocker.patch.object(stats.arrow, "utcnow", return_value=arrow.utcnow())
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    professional = service.professional
+    Professional.objects.update(next_available_at=None, available_minutes=0)
+    Service.objects.update(next_available_at=None, available_minutes=0)
+    result = get_availability_stats([professional.pk])
+
+    assert update_availability_stats([professional.pk]) == 1 + \
+        professional.services.count()
+    assert not update_availability_stats([professional.pk])
+    assert not update_availability_stats([])
+
+    professional.refresh_from_db()
+    service.refresh_from_db()
+    base_service = professional.services.filter(
+        is_base_schedule=True).first()
+    assert (professional.next_available_at,
+            professional.available_minutes) == result[(professional.pk, None)]
+    assert (service.next_available_at,
+            service.available_minutes) == result[(professional.pk, service.pk)]
+    assert base_service.next_available_at == professional.next_available_at
+
+    other = Professional.objects.exclude(pk=professional.pk).first()
+    assert other.next_available_at is None
+
+    assert refresh_availability_stats() == 0
+    Professional.objects.filter(pk=professional.pk).update(
+        available_minutes=0)
+    assert refresh_availability_stats() == 1
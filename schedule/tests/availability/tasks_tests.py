@@ -3,8 +3,13 @@ import pytest
 from django.db.models.query import QuerySet
 from pytest_mock import MockFixture
 
+from schedule.availability.context import GenerationContext
+from schedule.availability.metrics import GenerationReport
 from schedule.availability.tasks import (
+    generate_availability_slots_chunk_task,
+    generate_availability_slots_summary_task,
     generate_future_availability_slots_task,
+    maintain_availability_slots_partitions_task,
     remove_expired_availability_slots_task)
 
 pytestmark = pytest.mark.django_db
@@ -19,6 +24,14 @@ def test_remove_expired_availability_slots_task(mocker: MockFixture):
     assert mock.called
 
 
+def test_maintain_availability_slots_partitions_task(mocker: MockFixture):
+    """Should run the maintain_partitions."""
+    mock = mocker.patch("schedule.availability.tasks.maintain_partitions")
+    maintain_availability_slots_partitions_task.apply_async()
+
+    assert mock.called
+
+
 def test_generate_future_availability_slots_task(
     professionals: QuerySet,
     services: QuerySet,
@@ -26,20 +39,85 @@ def test_generate_future_availability_slots_task(
 ):
     """Should generate future availability slots."""
     professionals_generator = mocker.patch(
-        "schedule.availability.tasks.generate_for_professional")
+        "schedule.availability.utils.generate_for_professional")
     services_generator = mocker.patch(
-        "schedule.availability.tasks.generate_for_service")
+        "schedule.availability.utils.generate_for_service")
     generate_future_availability_slots_task.apply_async()
 
     assert professionals_generator.call_count == professionals.count()
     assert services_generator.call_count == services.filter(
         is_base_schedule=False).count()
 
-    professionals_generator.assert_called_with(
-        professional=professionals.last(),
-        append_days=True,
+    kwargs = professionals_generator.call_args[1]
+    assert kwargs["professional"] == professionals.last()
+    assert kwargs["append_days"] is True
+    assert isinstance(kwargs["context"], GenerationContext)
+
+    kwargs = services_generator.call_args[1]
+    assert kwargs["service"] == services.filter(is_base_schedule=False).last()
+    assert kwargs["append_days"] is True
+    assert isinstance(kwargs["context"], GenerationContext)
+
+
+def test_generate_availability_slots_chunk_task(
+    professionals: QuerySet,
+    mocker: MockFixture,
+):
+    """Should generate the chunk and count the errors."""
+    mocker.patch(
+        "schedule.availability.utils.generate_for_professional",
+        side_effect=[None, ValueError("error")],
     )
-    services_generator.assert_called_with(
-        service=services.filter(is_base_schedule=False).last(),
-        append_days=True,
+    ids = list(professionals.values_list("pk", flat=True))[:2]
+    result = generate_availability_slots_chunk_task.apply_async(
+        args=(ids, [])).get()
+
+    assert result == {"professionals": 1, "services": 0, "errors": 1}
+
+
+def test_generate_availability_slots_chunk_task_report(
+    professionals: QuerySet,
+    mocker: MockFixture,
+):
+    """Should add the generation reports to the chunk summary."""
+    mocker.patch(
+        "schedule.availability.utils.generate_for_professional",
+        side_effect=[
+            GenerationReport({"total": 0.5}, {"slots_inserted": 2}),
+            GenerationReport({"total": 0.25}, {"slots_inserted": 3}),
+        ],
     )
+    ids = list(professionals.values_list("pk", flat=True))[:2]
+    result = generate_availability_slots_chunk_task.apply_async(
+        args=(ids, [])).get()
+
+    assert result == {
+        "professionals": 2,
+        "services": 0,
+        "errors": 0,
+        "slots_inserted": 5,
+        "total_seconds": 0.75,
+    }
+
+
+def test_generate_availability_slots_summary_task():
+    """Should sum up the chunks results."""
+    result = generate_availability_slots_summary_task.apply_async(args=([
+        {
+            "professionals": 2,
+            "services": 0,
+            "errors": 1
+        },
+        {
+            "professionals": 0,
+            "services": 3,
+            "errors": 0
+        },
+    ], )).get()
+
+    assert result == {
+        "chunks": 2,
+        "professionals": 2,
+        "services": 3,
+        "errors": 1,
+    }
@@ -4,11 +4,17 @@ import pytest
 from django.db.models.query import QuerySet
 from pytest_mock import MockFixture
 
+from d8b.lock import get_key_value
+from d8b.redis import redis
 from orders.models import Order
-from schedule.availability.utils import (delete_expired_availability_slots,
-                                         generate_for_order,
-                                         generate_for_professional,
-                                         generate_for_service)
+from schedule.availability.context import get_generation_context
+from schedule.availability.metrics import GenerationReport
+from schedule.availability.utils import (
+    delete_expired_availability_slots, generate_for_order,
+    generate_for_professional, generate_for_professional_with_services,
+    generate_for_service, get_period_window)
+from schedule.models import AvailabilitySlot
+from services.models import Service
 
 pytestmark = pytest.mark.django_db
 
@@ -22,14 +28,136 @@ def test_generate_for_order(
     service.is_base_schedule = False
     order = Order()
     order.service = service
-    professional_generator = mocker.patch(
-        "schedule.availability.utils.generate_for_professional")
-    service_generator = mocker.patch(
-        "schedule.availability.utils.generate_for_service")
+    generator = mocker.patch(
+        "schedule.availability.utils.generate_for_professional_with_services"
+    )
+    order.start_datetime = arrow.utcnow().shift(days=1).datetime
+    order.end_datetime = arrow.utcnow().shift(days=1, hours=1).datetime
     generate_for_order(order)
-    professional_generator.assert_called_once_with(
-        professional=order.service.professional)
-    service_generator.assert_called_once_with(service=order.service)
+    generator.assert_called_once_with(
+        professional=order.service.professional,
+        services=[order.service],
+        is_window=True,
+        start=arrow.get(order.start_datetime),
+        end=arrow.get(order.end_datetime),
+    )
+
+
+def test_generate_for_professional_with_services(
+    professional_schedules: QuerySet,
+    service_schedules: QuerySet,
+    mocker: MockFixture,
+):
+    """Should generate the professional and the services with one context."""
+    professional = professional_schedules.first().professional
+    services = Service.objects.get_for_avaliability_generation().filter(
+        professional=professional)
+    get_context = mocker.patch(
+        "schedule.availability.utils.get_generation_context",
+        wraps=get_generation_context,
+    )
+    AvailabilitySlot.objects.filter(professional=professional).delete()
+
+    update_stats = mocker.patch(
+        "schedule.availability.utils.update_availability_stats")
+
+    report = generate_for_professional_with_services(
+        professional=professional)
+
+    get_context.assert_called_once()
+    update_stats.assert_called_once_with([professional.pk])
+    slots = AvailabilitySlot.objects.filter(professional=professional)
+    assert slots.filter(service__isnull=True).exists()
+    for service in services:
+        assert slots.filter(service=service).exists()
+    assert report.counters["slots_inserted"] == slots.count()
+    assert report.counters["schedules"] == 10 * (services.count() + 1)
+
+
+def test_generate_for_professional_with_services_window(
+    professional_schedules: QuerySet,
+    service_schedules: QuerySet,
+    mocker: MockFixture,
+    settings,
+):
+    """Should load the context for the padded window."""
+    settings.AVAILABILITY_WINDOW_MARGIN_DAYS = 1
+    professional = professional_schedules.first().professional
+    service = Service.objects.get_for_avaliability_generation().filter(
+        professional=professional, is_base_schedule=False).first()
+    get_context = mocker.patch(
+        "schedule.availability.utils.get_generation_context",
+        wraps=get_generation_context,
+    )
+    generate = mocker.patch(
+        "schedule.availability.utils.generate_for_service",
+        return_value=None,
+    )
+    start = arrow.utcnow().shift(days=2)
+    end = start.shift(hours=2)
+
+    generate_for_professional_with_services(
+        professional=professional,
+        services=[service],
+        is_window=True,
+        start=start,
+        end=end,
+    )
+
+    get_context.assert_called_once_with(
+        [professional.pk],
+        append_days=False,
+        start=start.shift(days=-1),
+        end=end.shift(days=1),
+    )
+    generate.assert_called_once()
+    assert generate.call_args[1]["service"] == service
+
+
+@pytest.mark.django_db(transaction=True)
+def test_generate_for_professional_coalesced_with_services(
+    professionals: QuerySet,
+    mocker: MockFixture,
+):
+    """Should rerun the combined generation for the coalesced contender."""
+    professional = professionals.first()
+    redis.delete(
+        f"generate_for_professional_keys_{{'professional': "
+        f"'{get_key_value(professional)}'}}_rerun")
+    contended = []
+
+    def generate(**kwargs) -> GenerationReport:
+        """Run the contending combined generation once."""
+        if not contended:
+            contended.append(
+                generate_for_professional_with_services(
+                    professional=professional))
+        return GenerationReport()
+
+    mocker.patch("schedule.availability.utils._generate",
+                 side_effect=generate)
+    combined = mocker.patch(
+        "schedule.availability.utils._generate_with_services",
+        return_value=GenerationReport(),
+    )
+
+    generate_for_professional(professional=professional)
+
+    assert contended == [None]
+    combined.assert_called_once_with(professional=professional)
+
+
+def test_get_period_window(orders: QuerySet):
+    """Should return the window including the initial period."""
+    order = Order.objects.get(pk=orders.first().pk)
+    initial_start = order.start_datetime
+    initial_end = order.end_datetime
+    order.start_datetime = arrow.get(initial_end).shift(days=2).datetime
+    order.end_datetime = arrow.get(initial_end).shift(days=3).datetime
+
+    start, end = get_period_window(order)
+    assert start == arrow.get(initial_start)
+    assert end == arrow.get(order.end_datetime)
 
 
 def test_generate_for_professional(
@@ -46,6 +174,8 @@ def test_generate_for_professional(
         "schedule.availability.utils.get_availability_generator",
         new=get_generator,
     )
+    update_stats = mocker.patch(
+        "schedule.availability.utils.update_availability_stats")
     generate_for_professional(
         professional=professional,
         append_days=True,
@@ -54,6 +184,7 @@ def test_generate_for_professional(
     )
     get_generator.assert_called_once()
     generator.generate.assert_called_once()
+    update_stats.assert_called_once_with([professional.pk])
 
     request = get_generator.call_args_list[0][0][0]
 
@@ -77,14 +208,18 @@ def test_generate_for_service(
         "schedule.availability.utils.get_availability_generator",
         new=get_generator,
     )
+    update_stats = mocker.patch(
+        "schedule.availability.utils.update_availability_stats")
     generate_for_service(
         service=service,
         append_days=True,
         start=start,
         end=end,
+        update_stats=False,
     )
     get_generator.assert_called_once()
     generator.generate.assert_called_once()
+    update_stats.assert_not_called()
 
     request = get_generator.call_args_list[0][0][0]
 
@@ -0,0 +1,19 @@
+"""The availability versions test module."""
+from schedule.availability.versions import (bump_version, get_version,
+                                            get_versions)
+
+
+def test_get_version():
+    """Should return the same version until it is bumped."""
+    version = get_version(-1)
+    assert get_version(-1) == version
+    assert get_version(-2) != version
+
+    bump_version(-1)
+    assert get_version(-1) != version
+
+
+def test_get_versions():
+    """Should return the versions of the professionals."""
+    assert get_versions([-1, -3]) == [get_version(-1), get_version(-3)]
+    assert get_versions([]) == []
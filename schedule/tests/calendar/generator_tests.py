@@ -1,10 +1,16 @@
 """The calendar request test module."""
 import arrow
 import pytest
+from django.core.cache import cache
 from django.db.models.query import QuerySet
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockFixture
+from redis.exceptions import RedisError
 
+from schedule.availability.versions import bump_version
+from schedule.calendar.exceptions import CalendarValueError
 from schedule.calendar.generator import (CalendarGenerator,
+                                         VirtualCalendarGenerator,
                                          get_calendar_generator)
 from schedule.calendar.request import CalendarRequest
 
@@ -39,3 +45,183 @@ def test_get_calendar_generator_get(
         start=request.start_datetime,
         end=request.end_datetime,
     )
+
+
+def test_calendar_generator_cache(
+    availability_slots: QuerySet,
+    mocker: MockFixture,
+):
+    """Should cache the slots until the availability version is bumped."""
+    request = CalendarRequest()
+    request.professional = availability_slots.first().professional
+    request.start_datetime = arrow.utcnow().floor("day")
+    request.end_datetime = request.start_datetime.shift(days=3)
+    generator = CalendarGenerator()
+    spy = mocker.patch.object(
+        generator,
+        "_generate",
+        wraps=generator._generate,
+    )
+    metrics = mocker.patch("schedule.calendar.generator.get_metrics")
+    result = generator.get(request)
+
+    assert result
+    assert [(s.start_datetime, s.end_datetime)
+            for s in generator.get(request)] == \
+        [(s.start_datetime, s.end_datetime) for s in result]
+    assert spy.call_count == 1
+    metrics.return_value.increment.assert_called_with("calendar.cache.hit")
+
+    bump_version(request.professional.pk)
+    generator.get(request)
+    assert spy.call_count == 2
+    metrics.return_value.increment.assert_called_with("calendar.cache.miss")
+
+
+def test_calendar_generator_cache_disabled(
+    availability_slots: QuerySet,
+    settings: SettingsWrapper,
+    mocker: MockFixture,
+):
+    """Should not cache the slots if the timeout is not set."""
+    settings.CALENDAR_CACHE_TIMEOUT = 0
+    request = CalendarRequest()
+    request.professional = availability_slots.first().professional
+    request.start_datetime = arrow.utcnow().floor("day")
+    request.end_datetime = request.start_datetime.shift(days=1)
+    generator = CalendarGenerator()
+    spy = mocker.patch.object(
+        generator,
+        "_generate",
+        wraps=generator._generate,
+    )
+    generator.get(request)
+    generator.get(request)
+    assert spy.call_count == 2
+
+
+def test_calendar_generator_cache_redis_error(
+    availability_slots: QuerySet,
+    mocker: MockFixture,
+):
+    """Should generate the slots without the cache if Redis fails."""
+    request = CalendarRequest()
+    request.professional = availability_slots.first().professional
+    request.start_datetime = arrow.utcnow().floor("day")
+    request.end_datetime = request.start_datetime.shift(days=1)
+    generator = CalendarGenerator()
+    mocker.patch(
+        "schedule.calendar.generator.get_versions",
+        side_effect=RedisError("error"),
+    )
+    get_many = mocker.patch.object(cache, "get_many")
+
+    assert [(s.start_datetime, s.end_datetime)
+            for s in generator.get(request)] == \
+        [(s.start_datetime, s.end_datetime)
+         for s in generator.get_many([request])]
+    assert generator.get_summary(request) is not None
+    get_many.assert_not_called()
+
+
+def test_calendar_generator_get_many(
+    availability_slots: QuerySet,
+    mocker: MockFixture,
+):
+    """Should return the slots of the requests by a single query."""
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    requests = []
+    for professional, entity_service in (
+        (service.professional, None),
+        (service.professional, service),
+    ):
+        request = CalendarRequest()
+        request.professional = professional
+        request.service = entity_service
+        request.start_datetime = arrow.utcnow().floor("day")
+        request.end_datetime = request.start_datetime.shift(days=2)
+        requests.append(request)
+    generator = CalendarGenerator()
+    expected = [(s.professional, s.service, s.start_datetime)
+                for r in requests for s in generator.get(r)]
+    bump_version(service.professional_id)
+    spy = mocker.patch.object(
+        generator,
+        "_generate_many",
+        wraps=generator._generate_many,
+    )
+    result = generator.get_many(requests)
+
+    assert expected
+    assert [(s.professional, s.service, s.start_datetime)
+            for s in result] == expected
+    spy.assert_called_once()
+    assert len(generator.get_many(requests)) == len(result)
+    spy.assert_called_once()
+
+
+def test_get_calendar_generator_class(settings: SettingsWrapper):
+    """Should return the generator set in the settings."""
+    settings.CALENDAR_GENERATOR_CLASS = \
+        "schedule.calendar.generator.VirtualCalendarGenerator"
+    assert isinstance(get_calendar_generator(), VirtualCalendarGenerator)
+
+
+def test_virtual_calendar_generator_get(
+    professional_schedules: QuerySet,
+    mocker: MockFixture,
+):
+    """Should return the same slots as the saved ones."""
+    cache.clear()
+    request = CalendarRequest()
+    request.professional = professional_schedules.first().professional
+    request.start_datetime = arrow.utcnow().shift(days=3)
+    request.end_datetime = arrow.utcnow().shift(days=10)
+    expected = [(s.start_datetime, s.end_datetime)
+                for s in CalendarGenerator().get(request)]
+    generator = VirtualCalendarGenerator()
+    spy = mocker.patch.object(
+        generator,
+        "_generate",
+        wraps=generator._generate,
+    )
+    result = generator.get(request)
+
+    assert expected
+    assert sorted(expected) == [(s.start_datetime, s.end_datetime)
+                                for s in result]
+    assert all(s.professional == request.professional for s in result)
+    assert len(generator.get(request)) == len(result)
+    assert spy.call_count == 1
+
+
+def test_virtual_calendar_generator_base_service(
+    professional_schedules: QuerySet,
+    services: QuerySet,
+):
+    """Should return the professional slots for the base schedule service."""
+    cache.clear()
+    service = services.filter(
+        is_base_schedule=True,
+        professional=professional_schedules.first().professional,
+    ).first()
+    request = CalendarRequest()
+    request.professional = service.professional
+    request.service = service
+    request.start_datetime = arrow.utcnow().floor("day").shift(days=3)
+    request.end_datetime = request.start_datetime.shift(days=7)
+    generator = VirtualCalendarGenerator()
+    result = generator.get(request)
+
+    assert result
+    assert all(s.service == service for s in result)
+    expected = [
+        r["start_datetime"]
+        for r in CalendarGenerator().get_start_times(request)
+    ]
+    assert expected
+    assert [r["start_datetime"]
+            for r in generator.get_start_times(request)] == expected
+    with pytest.raises(CalendarValueError):
+        generator.get_summary(request)
@@ -3,10 +3,13 @@ import pytest
 from django.db.models.query import QuerySet
 from django.http import HttpRequest
 from django.utils import timezone
+from pytest_django.fixtures import SettingsWrapper
 from pytest_mock import MockFixture
 from rest_framework.request import Request
 
-from schedule.calendar.request import HTTPToCalendarRequestConverter
+from schedule.calendar.exceptions import CalendarValidationError
+from schedule.calendar.request import (HTTPToCalendarBatchRequestConverter,
+                                       HTTPToCalendarRequestConverter)
 
 pytestmark = pytest.mark.django_db
 
@@ -58,3 +61,47 @@ def test_http_to_calendar_request_converter(
         datetime_format)
     assert end_datetime == result.end_datetime.to(tz_name).format(
         datetime_format)
+
+    request.GET["mode"] = "starts"
+    result = HTTPToCalendarRequestConverter(Request(request)).get()
+
+    assert result.mode == result.MODE_STARTS
+    assert result.service == service
+    assert not result.is_streamed
+
+    request.GET["stream"] = "1"
+    result = HTTPToCalendarRequestConverter(Request(request)).get()
+
+    assert result.is_streamed
+
+
+def test_http_to_calendar_batch_request_converter(
+    services: QuerySet,
+    settings: SettingsWrapper,
+):
+    """Should convert a HTTP request to the calendar requests."""
+    service = services.filter(is_base_schedule=False).first()
+    professional = service.professional
+    request = HttpRequest()
+    request.GET["professionals"] = f"{professional.pk},{professional.pk}"
+    request.GET["services"] = str(service.pk)
+    request.GET["start_datetime"] = "2020-08-23T16:19:43"
+    request.GET["end_datetime"] = "2020-08-25T16:19:43"
+    result = HTTPToCalendarBatchRequestConverter(Request(request)).get_batch()
+
+    assert len(result) == 2
+    assert result[0].professional == professional
+    assert result[0].service is None
+    assert result[1].professional == professional
+    assert result[1].service == service
+    assert result[0].start_datetime == result[1].start_datetime
+
+    settings.CALENDAR_BATCH_MAX_SIZE = 1
+    with pytest.raises(CalendarValidationError):
+        HTTPToCalendarBatchRequestConverter(Request(request)).get_batch()
+
+    settings.CALENDAR_BATCH_MAX_SIZE = 50
+    for value in ("invalid", "0"):
+        request.GET["services"] = value
+        with pytest.raises(CalendarValidationError):
+            HTTPToCalendarBatchRequestConverter(Request(request)).get_batch()
@@ -0,0 +1,106 @@
+"""The calendar start times test module."""
+from datetime import timedelta
+
+import arrow
+import pytest
+from django.db.models.query import QuerySet
+from pytest_mock import MockFixture
+from redis.exceptions import RedisError
+
+from schedule.availability.versions import bump_version
+from schedule.calendar.starts import StartTimesIndex, get_start_times
+from schedule.models import AvailabilitySlot
+
+pytestmark = pytest.mark.django_db
+
+
+def test_get_start_times():
+    """Should return the start times mapped to the slots ends."""
+    start = arrow.utcnow().floor("day").datetime
+    bounds = [
+        (start, start + timedelta(hours=2)),
+        (start + timedelta(hours=3), start + timedelta(hours=3, minutes=50)),
+    ]
+    result = get_start_times(bounds, duration=60, interval=30)
+    timestamp = int(start.timestamp())
+
+    assert result == {
+        timestamp: timestamp + 7200,
+        timestamp + 1800: timestamp + 7200,
+        timestamp + 3600: timestamp + 7200,
+    }
+    assert len(get_start_times(bounds, duration=30, interval=0)) == 5
+
+
+def test_start_times_index(
+    availability_slots: QuerySet,
+    settings,
+):
+    """Should return the bookable start times of the service."""
+    settings.CALENDAR_START_TIMES_DAYS = 7
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    service.booking_interval = 30
+    index = StartTimesIndex(service)
+    start = arrow.utcnow().floor("day")
+
+    result = index.get(start, start.shift(days=1))
+    # the service slots are from 11:00 till 15:00
+    assert len(result) == 7
+    assert result[0] == start.replace(hour=11).datetime
+    assert result[-1] == start.replace(hour=14).datetime
+
+    result = index.get(start.shift(days=20), start.shift(days=21))
+    assert len(result) == 7
+
+    assert index.is_bookable(
+        start.replace(hour=11, minute=30),
+        start.replace(hour=13, minute=30),
+    )
+    assert not index.is_bookable(
+        start.replace(hour=11, minute=15),
+        start.replace(hour=12, minute=15),
+    )
+    assert not index.is_bookable(
+        start.replace(hour=14),
+        start.replace(hour=16),
+    )
+
+
+def test_start_times_index_version(
+    availability_slots: QuerySet,
+    settings,
+):
+    """Should recompute the index after the version is bumped."""
+    settings.CALENDAR_START_TIMES_DAYS = 7
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    index = StartTimesIndex(service)
+    start = arrow.utcnow().floor("day").replace(hour=11)
+    end = start.shift(hours=1)
+    assert index.is_bookable(start, end)
+
+    AvailabilitySlot.objects.filter(service=service).delete()
+    assert index.is_bookable(start, end)
+
+    bump_version(service.professional_id)
+    assert not index.is_bookable(start, end)
+
+
+def test_start_times_index_redis_error(
+    availability_slots: QuerySet,
+    mocker: MockFixture,
+):
+    """Should compute the index from the slots if Redis is unavailable."""
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    mocker.patch(
+        "schedule.calendar.starts.get_version",
+        side_effect=RedisError("error"),
+    )
+    start = arrow.utcnow().floor("day").replace(hour=11)
+    index = StartTimesIndex(service)
+
+    assert index.is_bookable(start, start.shift(hours=1))
+    AvailabilitySlot.objects.filter(service=service).delete()
+    assert not index.is_bookable(start, start.shift(hours=1))
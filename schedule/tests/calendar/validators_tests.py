@@ -79,3 +79,15 @@ def test_calendar_validate_request(
 
     request.service = request.professional.services.first()  # type: ignore
     validators.validate_calendar_request(request)
+
+    request.mode = "invalid"
+    with pytest.raises(CalendarValidationError) as error:
+        validators.validate_calendar_request(request)
+    assert "mode" in str(error)
+
+    request.mode = request.MODE_STARTS
+    validators.validate_calendar_request(request)
+    request.service = None
+    with pytest.raises(CalendarValidationError) as error:
+        validators.validate_calendar_request(request)
+    assert "service" in str(error)
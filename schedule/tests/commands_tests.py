@@ -1,9 +1,17 @@
 """The commands test module."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
+
 import pytest
 from django.core.management import call_command
+from django.core.management.base import CommandError
 from django.db.models.query import QuerySet
 from pytest_mock import MockFixture
 
+from schedule.availability.utils import generate_for_chunk
+from schedule.models import AvailabilitySlot
+
 pytestmark = pytest.mark.django_db
 
 
@@ -12,11 +20,15 @@ def test_command_generate_slots(
     services: QuerySet,
     mocker: MockFixture,
 ):
-    """Should filter a queryset by user."""
+    """Should generate the slots by the chunks sequentially."""
+    chunk_generator = mocker.patch(
+        "schedule.management.commands.generate_slots.generate_for_chunk",
+        wraps=generate_for_chunk,
+    )
     professionals_generator = mocker.patch(
-        "schedule.availability.generate_for_professional")
+        "schedule.availability.utils.generate_for_professional")
     services_generator = mocker.patch(
-        "schedule.availability.generate_for_service")
+        "schedule.availability.utils.generate_for_service")
     call_command("generate_slots")
     total_professionals = professionals.count()
     total_services = services.filter(is_base_schedule=False).count()
@@ -30,3 +42,74 @@ def test_command_generate_slots(
     )
     assert professionals_generator.call_count == total_professionals + 1
     assert services_generator.call_count == total_services + 1
+    assert chunk_generator.call_count
+    assert "context" in professionals_generator.call_args.kwargs
+
+
+def test_command_generate_slots_summary(professional_schedules: QuerySet):
+    """Should write the generation summary."""
+    out = StringIO()
+    call_command(
+        "generate_slots",
+        professionals=[professional_schedules.first().professional.pk],
+        services=[0],
+        stdout=out,
+    )
+    output = out.getvalue()
+    assert "generation:" in output
+    assert "schedules: 10" in output
+    assert "slots_inserted:" in output
+
+
+def test_command_generate_slots_workers(
+    professionals: QuerySet,
+    services: QuerySet,
+    mocker: MockFixture,
+):
+    """Should generate the slots by the chunks."""
+    mocker.patch(
+        "schedule.management.commands.generate_slots.ProcessPoolExecutor",
+        new=ThreadPoolExecutor,
+    )
+    professionals_generator = mocker.patch(
+        "schedule.availability.utils.generate_for_professional")
+    services_generator = mocker.patch(
+        "schedule.availability.utils.generate_for_service",
+        side_effect=ValueError("error"),
+    )
+    call_command("generate_slots", workers=2)
+    total_services = services.filter(is_base_schedule=False).count()
+    assert professionals_generator.call_count == professionals.count()
+    assert services_generator.call_count == total_services
+
+
+def test_command_benchmark_slots_queries(services: QuerySet):
+    """Should print the timings and roll back the synthetic slots."""
+    services.update(is_base_schedule=True)
+    total = AvailabilitySlot.objects.count()
+    out = StringIO()
+    call_command("benchmark_slots_queries", days=3, repeat=1, stdout=out)
+    output = out.getvalue()
+
+    assert "Synthetic slots:" in output
+    assert "get_between_dates (ranges):" in output
+    assert "get_overlapping_entries (dates):" in output
+    assert AvailabilitySlot.objects.count() == total
+
+
+def test_command_benchmark_availability(tmp_path):
+    """Should write the report and roll back the synthetic workload."""
+    total = AvailabilitySlot.objects.count()
+    out = StringIO()
+    call_command("benchmark_availability", professionals=1, stdout=out)
+    report = json.loads(out.getvalue())
+    assert report["stages"]["generation"]["count"] == 1
+    assert report["counters"]["slots_generated"] > 0
+
+    path = tmp_path / "report.json"
+    call_command("benchmark_availability", professionals=1, output=str(path))
+    assert json.loads(path.read_text())["stages"]["saving"]["count"] == 1
+    assert AvailabilitySlot.objects.count() == total
+
+    with pytest.raises(CommandError):
+        call_command("benchmark_availability", schedules_per_day=13)
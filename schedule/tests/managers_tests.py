@@ -5,6 +5,7 @@ import arrow
 import pytest
 from django.db.models import QuerySet
 
+from schedule.calendar.starts import get_start_times
 from schedule.managers import (AvailabilitySlotManager,
                                ProfessionalScheduleManager,
                                ServiceScheduleManager)
@@ -254,6 +255,45 @@ def test_availability_slot_manager_get_get_between_dates(
     assert result.count() == 61
 
 
+def test_availability_slot_manager_get_day_summary(
+        availability_slots: QuerySet):
+    """Should return the availability aggregates by the local days."""
+    service = availability_slots.filter(
+        service__is_base_schedule=False).first().service
+    manager: AvailabilitySlotManager = AvailabilitySlot.objects
+    start = arrow.utcnow().floor("day").shift(days=1)
+    end = start.shift(days=2)
+    starts = get_start_times(
+        manager.get_between_dates(start, end, service.professional,
+                                  service).values_list(
+                                      "start_datetime", "end_datetime"),
+        service.duration,
+        service.booking_interval,
+    )
+
+    result = manager.get_day_summary(start, end, "UTC",
+                                     service.professional, service)
+    # the service slots are from 11:00 till 15:00
+    assert [r["available_minutes"] for r in result] == [240, 240]
+    assert result[0]["day"] == start.date()
+    assert result[0]["first_available_at"] == start.replace(hour=11)
+    assert result[0]["last_available_at"] == start.replace(hour=15)
+    assert sum(r["bookable_starts"] for r in result) == len(starts)
+
+    # the slots are split by the local midnight at 14:00 UTC
+    result = manager.get_day_summary(start, end, "Australia/Brisbane",
+                                     service.professional, service)
+    assert [r["available_minutes"] for r in result] == [180, 240, 60]
+    assert result[1]["day"] == start.shift(days=1).date()
+    assert result[1]["first_available_at"] == start.replace(hour=14)
+    assert sum(r["bookable_starts"] for r in result) == len(starts)
+
+    result = manager.get_day_summary(start, end, "UTC",
+                                     service.professional)
+    assert [r["available_minutes"] for r in result] == [510, 510]
+    assert all(r["bookable_starts"] is None for r in result)
+
+
 def test_professional_closed_period_manager_get_get_between_dates(
         professional_closed_periods: QuerySet):
     """Should return slots between the dates."""
@@ -1,4 +1,5 @@
 """The views tests module."""
+import arrow
 import pytest
 from django.db.models.query import QuerySet
 from pytest_mock import MockFixture
@@ -11,13 +12,13 @@ def test_professional_schedule_post_save(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_professional")
+    generator = mocker.patch("schedule.signals.defer_for_professional")
     schedule = professional_schedules.first()
     schedule.is_enabled = False
     schedule.save()
 
     assert generator.call_count == 1
-    generator.assert_called_with(professional=schedule.professional)
+    generator.assert_called_with(schedule.professional)
 
 
 def test_professional_schedule_post_delete(
@@ -25,12 +26,12 @@ def test_professional_schedule_post_delete(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_professional")
+    generator = mocker.patch("schedule.signals.defer_for_professional")
     schedule = professional_schedules.first()
     schedule.delete()
 
     assert generator.call_count == 1
-    generator.assert_called_with(professional=schedule.professional)
+    generator.assert_called_with(schedule.professional)
 
 
 def test_service_schedule_post_save(
@@ -38,13 +39,13 @@ def test_service_schedule_post_save(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_service")
+    generator = mocker.patch("schedule.signals.defer_for_service")
     schedule = service_schedules.first()
     schedule.is_enabled = False
     schedule.save()
 
     assert generator.call_count == 1
-    generator.assert_called_with(service=schedule.service)
+    generator.assert_called_with(schedule.service)
 
 
 def test_service_schedule_post_delete(
@@ -52,12 +53,12 @@ def test_service_schedule_post_delete(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_service")
+    generator = mocker.patch("schedule.signals.defer_for_service")
     schedule = service_schedules.first()
     schedule.delete()
 
     assert generator.call_count == 1
-    generator.assert_called_with(service=schedule.service)
+    generator.assert_called_with(schedule.service)
 
 
 def test_service_closed_period_post_save(
@@ -65,13 +66,19 @@ def test_service_closed_period_post_save(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_service")
+    generator = mocker.patch("schedule.signals.defer_for_service")
     closed_period = service_closed_periods.first()
     closed_period.is_enabled = False
     closed_period.save()
 
     assert generator.call_count == 1
-    generator.assert_called_with(service=closed_period.service)
+    generator.assert_called_with(
+        closed_period.service,
+        (
+            arrow.get(closed_period.start_datetime),
+            arrow.get(closed_period.end_datetime),
+        ),
+    )
 
 
 def test_service_closed_period_post_delete(
@@ -79,12 +86,18 @@ def test_service_closed_period_post_delete(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_service")
+    generator = mocker.patch("schedule.signals.defer_for_service")
     closed_period = service_closed_periods.first()
     closed_period.delete()
 
     assert generator.call_count == 1
-    generator.assert_called_with(service=closed_period.service)
+    generator.assert_called_with(
+        closed_period.service,
+        (
+            arrow.get(closed_period.start_datetime),
+            arrow.get(closed_period.end_datetime),
+        ),
+    )
 
 
 def test_professional_closed_period_post_save(
@@ -92,13 +105,19 @@ def test_professional_closed_period_post_save(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_professional")
+    generator = mocker.patch("schedule.signals.defer_for_professional")
     closed_period = professional_closed_periods.first()
     closed_period.is_enabled = False
     closed_period.save()
 
     assert generator.call_count == 1
-    generator.assert_called_with(professional=closed_period.professional)
+    generator.assert_called_with(
+        closed_period.professional,
+        (
+            arrow.get(closed_period.start_datetime),
+            arrow.get(closed_period.end_datetime),
+        ),
+    )
 
 
 def test_professional_closed_period_post_delete(
@@ -106,12 +125,18 @@ def test_professional_closed_period_post_delete(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_professional")
+    generator = mocker.patch("schedule.signals.defer_for_professional")
     closed_period = professional_closed_periods.first()
     closed_period.delete()
 
     assert generator.call_count == 1
-    generator.assert_called_with(professional=closed_period.professional)
+    generator.assert_called_with(
+        closed_period.professional,
+        (
+            arrow.get(closed_period.start_datetime),
+            arrow.get(closed_period.end_datetime),
+        ),
+    )
 
 
 def test_service_post_delete(
@@ -119,7 +144,7 @@ def test_service_post_delete(
     mocker: MockFixture,
 ):
     """Should run the availability generator."""
-    generator = mocker.patch("schedule.signals.generate_for_service")
+    generator = mocker.patch("schedule.signals.defer_for_service")
     service = services.first()
     service.is_base_schedule = True
     service.save()
@@ -130,4 +155,4 @@ def test_service_post_delete(
     service.save()
 
     assert generator.call_count == 1
-    generator.assert_called_with(service=service)
+    generator.assert_called_with(service)
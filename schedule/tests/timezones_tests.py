@@ -0,0 +1,73 @@
+"""The timezones test module."""
+from datetime import datetime
+
+import arrow
+import pytest
+
+from schedule.timezones import DAY, TimezoneOffsets, get_timezone_offsets
+
+# pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "zone, day",
+    [
+        ("America/New_York", "2021-03-14"),
+        ("America/New_York", "2021-11-07"),
+        ("Europe/London", "2021-03-28"),
+        ("Australia/Lord_Howe", "2021-04-04"),
+        ("America/Havana", "2021-03-14"),
+        ("Asia/Beirut", "2021-03-28"),
+        ("UTC", "2021-03-28"),
+    ],
+)
+def test_timezone_offsets_dst(zone: str, day: str):
+    """Should convert the local times the same way as arrow."""
+    offsets = TimezoneOffsets(zone)
+    start = arrow.get(day).shift(days=-2)
+    for minutes in range(0, 5 * 24 * 60, 15):
+        local = start.shift(minutes=minutes)
+        expected = local.replace(tzinfo=zone).to("UTC")
+        assert offsets.get_utc_timestamp(
+            local.timestamp) == expected.timestamp
+        assert offsets.get_utc_datetime(local.naive) == expected
+
+
+def test_timezone_offsets_ambiguous_and_non_existent():
+    """Should resolve the ambiguous and non-existent times as before."""
+    offsets = get_timezone_offsets("America/New_York")
+
+    assert offsets.get_utc_datetime(datetime(
+        2021, 11, 7, 1, 30)) == arrow.get("2021-11-07T05:30:00+00:00")
+    assert offsets.get_utc_datetime(datetime(
+        2021, 3, 14, 2, 30)) == arrow.get("2021-03-14T06:30:00+00:00")
+    assert offsets.get_utc_datetime(datetime(
+        2021, 7, 1, 9, 0, 0, 15)) == arrow.get("2021-07-01T13:00:00.000015")
+
+
+def test_timezone_offsets_table():
+    """Should build the table on demand and extend it."""
+    offsets = TimezoneOffsets("Europe/London")
+    day = arrow.get("2021-06-01").timestamp // DAY
+
+    assert offsets.get_offset(day * DAY) == 3600
+    first, last, days, values = offsets._table  # type: ignore
+    assert first == day - offsets.PAST_DAYS
+    assert last == day + offsets.SPAN_DAYS
+    assert len(days) == len(values) < 20
+    assert None in values
+
+    offsets.get_offset((first - 10) * DAY)
+    assert offsets._table[0] == first - 10 - offsets.PAST_DAYS  # type: ignore
+    assert offsets._table[1] == last  # type: ignore
+
+    far = (first - offsets.SPAN_DAYS * 3) * DAY
+    assert offsets.get_offset(far) == offsets.get_exact_offset(far)
+    assert offsets._table[1] == last  # type: ignore
+
+
+def test_get_timezone_offsets():
+    """Should return the shared offsets table."""
+    offsets = get_timezone_offsets("Europe/Paris")
+    assert isinstance(offsets, TimezoneOffsets)
+    assert get_timezone_offsets("Europe/Paris") is offsets
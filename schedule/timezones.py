@@ -0,0 +1,114 @@
+"""The schedule timezones module."""
+import threading
+from bisect import bisect_right
+from datetime import datetime, timedelta, tzinfo
+from typing import Dict, List, Optional, Tuple, Union
+
+import arrow
+
+DAY: int = 60 * 60 * 24
+
+Table = Tuple[int, int, List[int], List[Optional[int]]]
+
+
+class TimezoneOffsets():
+    """The UTC offsets table of the timezone local days.
+
+    The local days are grouped into the ranges with the same UTC offset at
+    the local midnights. The days around the DST transitions have no offset
+    in the table and are converted by arrow, so the ambiguous and the
+    non-existent local times are resolved the same way as before.
+    """
+
+    SPAN_DAYS: int = 366 * 2
+    PAST_DAYS: int = 31
+
+    timezone: str
+    _table: Optional[Table] = None
+
+    def __init__(self, timezone: str):
+        """Construct the object."""
+        self.timezone = timezone
+        self._lock = threading.Lock()
+
+    def get_exact_offset(self, timestamp: int) -> int:
+        """Return the UTC offset of the local timestamp computed by arrow."""
+        local = arrow.Arrow.utcfromtimestamp(timestamp).replace(
+            tzinfo=self.timezone)
+        return int(local.utcoffset().total_seconds())
+
+    def _build(self, first_day: int, last_day: int) -> Table:
+        """Build the table for the local days."""
+        midnights = [
+            self.get_exact_offset((first_day + i) * DAY)
+            for i in range(-1, last_day - first_day + 2)
+        ]
+        days: List[int] = []
+        offsets: List[Optional[int]] = []
+        for i, day in enumerate(range(first_day, last_day + 1)):
+            previous, current, following = midnights[i:i + 3]
+            offset = current if previous == current == following else None
+            if not offsets or offsets[-1] != offset:
+                days.append(day)
+                offsets.append(offset)
+        return first_day, last_day, days, offsets
+
+    def _get_table(self, day: int) -> Optional[Table]:
+        """Return the table covering the day.
+
+        The table is extended on demand. The days too far from the table
+        are not covered.
+        """
+        table = self._table
+        if table and table[0] <= day <= table[1]:
+            return table
+        if table and (day < table[0] - self.SPAN_DAYS or
+                      day > table[1] + self.SPAN_DAYS):
+            return None
+        with self._lock:
+            table = self._table
+            if not table or not table[0] <= day <= table[1]:
+                first_day, last_day = day - self.PAST_DAYS, \
+                    day + self.SPAN_DAYS
+                if table:
+                    first_day = min(first_day, table[0])
+                    last_day = max(last_day, table[1])
+                table = self._table = self._build(first_day, last_day)
+        return table
+
+    def get_offset(self, timestamp: int) -> int:
+        """Return the UTC offset of the local timestamp in seconds."""
+        table = self._get_table(timestamp // DAY)
+        if not table:
+            return self.get_exact_offset(timestamp)
+        _, _, days, offsets = table
+        offset = offsets[bisect_right(days, timestamp // DAY) - 1]
+        if offset is None:
+            return self.get_exact_offset(timestamp)
+        return offset
+
+    def get_utc_timestamp(self, timestamp: int) -> int:
+        """Return the UTC timestamp of the local timestamp."""
+        return timestamp - self.get_offset(timestamp)
+
+    def get_utc_datetime(self, local: datetime) -> arrow.Arrow:
+        """Return the UTC datetime of the local datetime.
+
+        The timezone info of the local datetime is ignored.
+        """
+        local = local.replace(tzinfo=None)
+        offset = self.get_offset(
+            int((local - datetime(1970, 1, 1)).total_seconds()))
+        return arrow.Arrow.fromdatetime(local - timedelta(seconds=offset))
+
+
+_offsets: Dict[str, TimezoneOffsets] = {}
+
+
+def get_timezone_offsets(timezone: Union[str, tzinfo]) -> TimezoneOffsets:
+    """Return the process-wide offsets table of the timezone."""
+    name = str(timezone)
+    offsets = _offsets.get(name)
+    if not offsets:
+        offsets = _offsets.setdefault(name, TimezoneOffsets(name))
+    return offsets
@@ -10,10 +10,13 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.settings import api_settings
 
+from d8b.streaming import StreamingJSONResponse
 from d8b.viewsets import AllowAnyViewSetMixin
+from schedule.availability.deferred import GenerationScope
 from schedule.calendar.exceptions import CalendarError
 from schedule.calendar.generator import get_calendar_generator
-from schedule.calendar.request import HTTPToCalendarRequestConverter
+from schedule.calendar.request import (HTTPToCalendarBatchRequestConverter,
+                                       HTTPToCalendarRequestConverter)
 
 from .filtersets import (ProfessionalClosedPeriodFilterSet,
                          ProfessionalScheduleFilterSet,
@@ -22,7 +25,9 @@ from .filtersets import (ProfessionalClosedPeriodFilterSet,
 from .models import (ProfessionalClosedPeriod, ProfessionalSchedule,
                      ServiceClosedPeriod, ServiceSchedule)
 from .schemes import ProfessionalCalendarSchema
-from .serializers import (ProfessionalCalendarSerializer,
+from .serializers import (ProfessionalCalendarDaySerializer,
+                          ProfessionalCalendarSerializer,
+                          ProfessionalCalendarStartTimeSerializer,
                           ProfessionalClosedPeriodSerializer,
                           ProfessionalScheduleSerializer,
                           ServiceClosedPeriodSerializer,
@@ -33,16 +38,60 @@ class ProfessionalCalendarViewSet(AllowAnyViewSetMixin, viewsets.ViewSet):
     """The professional calendar viewset."""
 
     serializer_class = ProfessionalCalendarSerializer
+    start_times_serializer_class = ProfessionalCalendarStartTimeSerializer
+    summary_serializer_class = ProfessionalCalendarDaySerializer
 
     @swagger_auto_schema(**ProfessionalCalendarSchema.list_schema)
     def list(self, request: Request):
-        """Return the professional calendar."""
+        """Return the professional calendar.
+
+        The bookable start times of the service are returned in the starts
+        mode and the local days aggregates in the summary mode. The slots
+        are written by the chunks if the streaming is requested.
+        """
         try:
             converter = HTTPToCalendarRequestConverter(request)
             calendar_request = converter.get()
             generator = get_calendar_generator()
-            response = generator.get(calendar_request)
-            serializer = self.serializer_class(instance=response, many=True)
+            if calendar_request.mode == calendar_request.MODE_STARTS:
+                serializer = self.start_times_serializer_class(
+                    instance=generator.get_start_times(calendar_request),
+                    many=True,
+                )
+            elif calendar_request.mode == calendar_request.MODE_SUMMARY:
+                serializer = self.summary_serializer_class(
+                    instance=generator.get_summary(calendar_request),
+                    many=True,
+                )
+            elif calendar_request.is_streamed:
+                return StreamingJSONResponse(
+                    generator.iterate(calendar_request),
+                    self.serializer_class().to_representation,
+                )
+            else:
+                serializer = self.serializer_class(
+                    instance=generator.get(calendar_request),
+                    many=True,
+                )
+        except CalendarError as error:
+            raise ValidationError({"error": str(error)}) from error
+
+        return Response(serializer.data)
+
+    @swagger_auto_schema(**ProfessionalCalendarSchema.batch_schema)
+    @action(detail=False, methods=["get"])
+    def batch(self, request: Request):
+        """Return the calendars of the professionals and the services.
+
+        The slots of all the entities are returned for the same dates.
+        """
+        try:
+            converter = HTTPToCalendarBatchRequestConverter(request)
+            generator = get_calendar_generator()
+            serializer = self.serializer_class(
+                instance=generator.get_many(converter.get_batch()),
+                many=True,
+            )
         except CalendarError as error:
             raise ValidationError({"error": str(error)}) from error
 
@@ -69,12 +118,14 @@ class ScheduleSetMixin():
                     api_settings.NON_FIELD_ERRORS_KEY:
                         [_("Invalid data. Expected a list.")]
                 }, )
-        self.serializer_class.Meta.model.objects.delete_for_user(
-            user=request.user, **self._get_params_for_set_delete())
-        for entry in request.data:
-            serializer = self.get_serializer(data=entry)
-            serializer.is_valid(raise_exception=True)
-            self.perform_create(serializer)
+        # regenerate the slots once per entity after all the changes
+        with GenerationScope():
+            self.serializer_class.Meta.model.objects.delete_for_user(
+                user=request.user, **self._get_params_for_set_delete())
+            for entry in request.data:
+                serializer = self.get_serializer(data=entry)
+                serializer.is_valid(raise_exception=True)
+                self.perform_create(serializer)
 
         serializer = self.get_serializer(data=request.data, many=True)
         return Response(
@@ -9,7 +9,8 @@ from d8b.settings import get_settings
 from professionals.models import Professional
 from services.models import Service
 
-from .getters import AbstractSearchGetter, ServiceSearchGetter
+from .getters import (AbstractSearchGetter, ServiceSearchGetter,
+                      get_ordering)
 from .request import SearchRequest
 from .response import SearchResponse
 
@@ -40,10 +41,20 @@ class SearchEngine(AbstractSearchEngine):
             )[:get_settings("D8B_SEARCH_MAX_ENTRIES")])
 
     def _get_professionals(self, services_ids: QuerySet) -> QuerySet:
-        """Get the professionals."""
-        ids = Service.objects.filter(pk__in=services_ids).values_list(
-            "professional__pk", flat=True)[self.offset:self.limit]
-        return Professional.objects.get_extended_list().filter(pk__in=ids)
+        """Get the professionals.
+
+        The ordered professionals are sorted by their own availability stats.
+        """
+        ordering = get_ordering(self.request)
+        services = Service.objects.filter(pk__in=services_ids)
+        if ordering:
+            services = services.order_by(*ordering)
+        ids = services.values_list("professional__pk",
+                                   flat=True)[self.offset:self.limit]
+        query = Professional.objects.get_extended_list().filter(pk__in=ids)
+        if ordering:
+            query = query.order_by(*ordering)
+        return query
 
     @staticmethod
     def _get_professional_services(
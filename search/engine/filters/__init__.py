@@ -2,6 +2,7 @@
 
 from .abstract import Handler
 from .age import AgeHandler
+from .availability import AvailabilityHandler
 from .categories import CategoriesHandler
 from .city import CityHandler
 from .country import CountryHandler
@@ -37,6 +38,7 @@ __all__ = [
     "PostalCodeHandler",
     # "CoordinateHandler",
     "DatesHandler",
+    "AvailabilityHandler",
     "TagsHandler",
     "RatingHandler",
     "OnlyWithReviewsHandler",
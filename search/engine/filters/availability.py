@@ -0,0 +1,28 @@
+"""The search availability filter module."""
+
+from django.db.models import QuerySet
+
+from search.engine.request import SearchRequest
+
+from .abstract import AbstractHandler
+
+
+class AvailabilityHandler(AbstractHandler):
+    """The availability handler.
+
+    The denormalized availability stats of the services are used.
+    """
+
+    def _check_request(self, request: SearchRequest) -> bool:
+        """Check whether the handler is applicable to the request."""
+        return bool(request.available_before or request.min_available_minutes)
+
+    def _apply(self, request: SearchRequest, query: QuerySet) -> QuerySet:
+        """Apply the handler to the request."""
+        if request.available_before:
+            query = query.filter(
+                next_available_at__lte=request.available_before.datetime)
+        if request.min_available_minutes:
+            query = query.filter(
+                available_minutes__gte=request.min_available_minutes)
+        return query
@@ -1,54 +1,106 @@
 """The search dates filter module."""
+from datetime import timedelta
 
-from django.db.models import Q, QuerySet
+from django.db.models import (DateTimeField, DurationField, Exists,
+                              ExpressionWrapper, F, Func, OuterRef, Q,
+                              QuerySet, Value)
+from django.db.models.functions import Coalesce, NullIf
 
+from d8b.ranges import overlaps
+from schedule.models import AvailabilitySlot
 from search.engine.request import SearchRequest
 
 from .abstract import AbstractHandler
 
+MINUTE = Value(timedelta(minutes=1), output_field=DurationField())
+
+
+class AlignedStart(Func):
+    """The first slot start at or after the date.
+
+    The starts are aligned to the slot start by the step.
+    """
+
+    arity = 3
+    output_field = DateTimeField()
+
+    def as_sql(self, compiler, connection, **extra_context):
+        """Return the SQL and the params."""
+        # pylint: disable=arguments-differ,unused-argument
+        (start, start_params), (date, date_params), (step, step_params) = [
+            compiler.compile(e) for e in self.get_source_expressions()
+        ]
+        sql = (f"({start} + CEIL(GREATEST(EXTRACT(EPOCH FROM {date} - "
+               f"{start}), 0) / EXTRACT(EPOCH FROM {step})) * {step})")
+        return sql, [
+            *start_params, *date_params, *start_params, *step_params,
+            *step_params
+        ]
+
 
 class DatesHandler(AbstractHandler):
-    """The dates handler."""
+    """The dates handler.
 
-    # pylint: disable=inconsistent-return-statements
+    The services are matched if the service can be booked in the slots
+    starting between the dates. The slots lengths are compared with the
+    services durations by the indexed expression and the first starts after
+    the start date are aligned by the booking intervals.
+    """
 
     def _check_request(self, request: SearchRequest) -> bool:
         """Check whether the handler is applicable to the request."""
         return bool(request.start_datetime or request.end_datetime)
 
-    def _apply(self, request: SearchRequest, query: QuerySet) -> QuerySet:
-        """Apply the handler to the request."""
-        start = request.start_datetime
-        end = request.end_datetime
-        if start and end:
-            return query.filter(
-                Q(
-                    is_base_schedule=True,
-                    professional__slots__service__isnull=True,
-                    professional__slots__start_datetime__lte=end.datetime,
-                    professional__slots__end_datetime__gte=start.datetime,
-                ) | Q(
-                    is_base_schedule=False,
-                    slots__start_datetime__lte=end.datetime,
-                    slots__end_datetime__gte=start.datetime,
-                ))
+    @staticmethod
+    def _get_slots(request: SearchRequest) -> QuerySet:
+        """Return the slots fitting the services between the request dates.
+
+        The services are referenced by the outer query.
+        """
+        start = request.start_datetime.datetime \
+            if request.start_datetime else None
+        end = request.end_datetime.datetime if request.end_datetime else None
+        duration = ExpressionWrapper(
+            OuterRef("duration") * MINUTE,
+            output_field=DurationField(),
+        )
+        slots = AvailabilitySlot.objects.filter(overlaps(start, end)).annotate(
+            length=ExpressionWrapper(
+                F("end_datetime") - F("start_datetime"),
+                output_field=DurationField(),
+            )).filter(length__gte=duration)
         if start:
-            return query.filter(
-                Q(
-                    is_base_schedule=True,
-                    professional__slots__service__isnull=True,
-                    professional__slots__end_datetime__gte=start.datetime,
-                ) | Q(
-                    is_base_schedule=False,
-                    slots__end_datetime__gte=start.datetime,
-                ))
+            step = ExpressionWrapper(
+                Coalesce(
+                    NullIf(OuterRef("booking_interval"), 0),
+                    OuterRef("duration"),
+                ) * MINUTE,
+                output_field=DurationField(),
+            )
+            slots = slots.annotate(first_start=AlignedStart(
+                F("start_datetime"),
+                Value(start, output_field=DateTimeField()),
+                step,
+            )).filter(end_datetime__gte=ExpressionWrapper(
+                F("first_start") + duration,
+                output_field=DateTimeField(),
+            ))
         if end:
-            return query.filter(
-                Q(
-                    is_base_schedule=True,
-                    professional__slots__service__isnull=True,
-                    professional__slots__start_datetime__lte=end.datetime,
-                ) | Q(
-                    is_base_schedule=False,
-                    slots__start_datetime__lte=end.datetime,
-                ))
+            slots = slots.filter(start_datetime__lte=end)
+            if start:
+                slots = slots.filter(first_start__lte=end)
+        return slots
+
+    def _apply(self, request: SearchRequest, query: QuerySet) -> QuerySet:
+        """Apply the handler to the request."""
+        slots = self._get_slots(request)
+        return query.annotate(
+            has_professional_slots=Exists(
+                slots.filter(
+                    professional=OuterRef("professional"),
+                    service__isnull=True,
+                )),
+            has_service_slots=Exists(slots.filter(service=OuterRef("pk"))),
+        ).filter(
+            Q(is_base_schedule=True, has_professional_slots=True) |
+            Q(is_base_schedule=False, has_service_slots=True))
@@ -1,7 +1,9 @@
 """The search getters module."""
 from abc import ABC, abstractmethod
+from typing import List
 
-from django.db.models import QuerySet
+from django.db.models import F, QuerySet
+from django.db.models.expressions import OrderBy
 
 from d8b.settings import get_settings
 from search.engine import filters
@@ -11,6 +13,19 @@ from services.models import Service
 from .request import SearchRequest
 
 
+def get_ordering(request: SearchRequest) -> List[OrderBy]:
+    """Return the ordering of the request.
+
+    The denormalized availability stats are used, so the ordering is served
+    by the indexes of the fields.
+    """
+    if request.ordering == request.ORDERING_NEXT_AVAILABLE_AT:
+        return [F("next_available_at").asc(nulls_last=True)]
+    if request.ordering == request.ORDERING_AVAILABLE_MINUTES:
+        return [F("available_minutes").desc()]
+    return []
+
+
 class AbstractSearchGetter(ABC):
     """The abstract search getter class."""
 
@@ -35,6 +50,7 @@ class ServiceSearchGetter(AbstractSearchGetter):
             set_next(filters.DistrictHandler()). \
             set_next(filters.PostalCodeHandler()). \
             set_next(filters.DatesHandler()). \
+            set_next(filters.AvailabilityHandler()). \
             set_next(filters.TagsHandler()). \
             set_next(filters.RatingHandler()). \
             set_next(filters.OnlyWithReviewsHandler()). \
@@ -73,4 +89,7 @@ class ServiceSearchGetter(AbstractSearchGetter):
         self.request = request
         query = self._get_base_query()
         query = self._get_filters().handle(request, query)
+        ordering = get_ordering(request)
+        if ordering:
+            query = query.order_by(*ordering)
         return query
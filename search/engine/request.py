@@ -1,7 +1,7 @@
 """The search request module."""
 from abc import ABC, abstractmethod
 from decimal import InvalidOperation
-from typing import Callable, List, Literal, Optional, Type
+from typing import Callable, List, Literal, Optional, Tuple, Type
 
 import arrow
 from cities.models import (City, Country, District, PostalCode, Region,
@@ -80,9 +80,19 @@ class SearchServiceRequest():
 class SearchRequest():
     """The search request class."""
 
+    ORDERING_NEXT_AVAILABLE_AT: str = "next_available_at"
+    ORDERING_AVAILABLE_MINUTES: str = "-available_minutes"
+    ORDERINGS: Tuple[str, ...] = (
+        ORDERING_NEXT_AVAILABLE_AT,
+        ORDERING_AVAILABLE_MINUTES,
+    )
+
     query: Optional[str] = None
     start_datetime: Optional[arrow.Arrow] = None
     end_datetime: Optional[arrow.Arrow] = None
+    available_before: Optional[arrow.Arrow] = None
+    min_available_minutes: Optional[int] = None
+    ordering: Optional[str] = None
     tags: List[str]
     page: int = 1
 
@@ -397,6 +407,9 @@ class HTTPToSearchRequestConverter(AbstractHTTPConverter):
     END_DATETIME_PARAM: str = "end_datetime"
     TAGS_PARAM: str = "tags"
     PAGE_PARAM: str = "page"
+    AVAILABLE_BEFORE_PARAM: str = "available_before"
+    MIN_AVAILABLE_MINUTES_PARAM: str = "min_available_minutes"
+    ORDERING_PARAM: str = "ordering"
 
     converters: List[Type] = [
         HTTPToSearchProfessionalRequestConverter,
@@ -418,6 +431,12 @@ class HTTPToSearchRequestConverter(AbstractHTTPConverter):
         if page and page < settings.D8B_SEARCH_MAX_PAGE:
             self.search_request.page = page
 
+    def _set_ordering(self):
+        """Set an ordering to the request."""
+        ordering = self._get_query_param(self.ORDERING_PARAM)
+        if ordering in SearchRequest.ORDERINGS:
+            self.search_request.ordering = ordering
+
     def _set_datetime(self, name: str):
         """Set a datetime to the calendart request."""
         date_str = str(self._get_query_param(name))
@@ -434,8 +453,12 @@ class HTTPToSearchRequestConverter(AbstractHTTPConverter):
         self._set_query()
         self._set_datetime(self.START_DATETIME_PARAM)
         self._set_datetime(self.END_DATETIME_PARAM)
+        self._set_datetime(self.AVAILABLE_BEFORE_PARAM)
+        self.search_request.min_available_minutes = self._get_int_param(
+            self.MIN_AVAILABLE_MINUTES_PARAM)
         self._set_tags()
         self._set_page()
+        self._set_ordering()
 
         for converter_class in self.converters:
             converter = converter_class(
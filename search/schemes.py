@@ -6,7 +6,8 @@ from professionals.models import Professional
 from search.engine.request import (HTTPToSearchLocationRequestConverter,
                                    HTTPToSearchProfessionalRequestConverter,
                                    HTTPToSearchRequestConverter,
-                                   HTTPToSearchServiceRequestConverter)
+                                   HTTPToSearchServiceRequestConverter,
+                                   SearchRequest)
 from users.models import User
 
 from .serializers import SearchSerializer
@@ -42,6 +43,25 @@ class SearchSchema():
                 description="multiple values may be separated by commas",
                 type=openapi.TYPE_STRING,
             ),
+            openapi.Parameter(
+                HTTPToSearchRequestConverter.AVAILABLE_BEFORE_PARAM,
+                openapi.IN_QUERY,
+                description=("the nearest availability is before the date "
+                             "YYYY-MM-DDTHH:mm:ss (2020-08-23T16:19:43)"),
+                type=openapi.TYPE_STRING,
+            ),
+            openapi.Parameter(
+                HTTPToSearchRequestConverter.MIN_AVAILABLE_MINUTES_PARAM,
+                openapi.IN_QUERY,
+                description="the minimal available minutes in the next days",
+                type=openapi.TYPE_INTEGER,
+            ),
+            openapi.Parameter(
+                HTTPToSearchRequestConverter.ORDERING_PARAM,
+                openapi.IN_QUERY,
+                type=openapi.TYPE_STRING,
+                enum=list(SearchRequest.ORDERINGS),
+            ),
 
             # SearchProfessionalRequest
             openapi.Parameter(
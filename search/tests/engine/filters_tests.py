@@ -55,6 +55,51 @@ def test_dates_filter_professional(
     request.end_datetime = today.shift(weekday=4, hours=14)
     assert handler.handle(request, services).count() > 1
 
+    # the slots end at 14:00
+    request.start_datetime = today.shift(weekday=4, hours=13, minutes=30)
+    request.end_datetime = today.shift(weekday=4, hours=14)
+    assert handler.handle(request, services).count() == 0
+
+    # the starts are aligned to the slots starts by the booking interval
+    request.start_datetime = today.shift(weekday=4, hours=12, minutes=50)
+    request.end_datetime = today.shift(weekday=4, hours=12, minutes=55)
+    assert handler.handle(request, services).count() == 0
+
+    request.end_datetime = today.shift(weekday=4, hours=13)
+    assert handler.handle(request, services).count() > 1
+
+    request.start_datetime = today.shift(weekday=4, hours=10)
+    request.end_datetime = today.shift(weekday=4, hours=14)
+    services.update(duration=300)
+    assert handler.handle(request, services).count() == 0
+
+
+def test_availability_filter(services: QuerySet):
+    """Should filter the query."""
+    request = SearchRequest()
+    handler = filters.AvailabilityHandler()
+    now = arrow.utcnow()
+    first = services.first()
+    services.update(next_available_at=None, available_minutes=0)
+    services.filter(pk=first.pk).update(
+        next_available_at=now.shift(hours=1).datetime,
+        available_minutes=120,
+    )
+    assert not handler._check_request(request)
+
+    request.available_before = now.shift(hours=2)
+    assert list(handler.handle(request, services)) == [first]
+
+    request.available_before = now
+    assert handler.handle(request, services).count() == 0
+
+    request.available_before = None
+    request.min_available_minutes = 60
+    assert list(handler.handle(request, services)) == [first]
+
+    request.min_available_minutes = 180
+    assert handler.handle(request, services).count() == 0
+
 
 def test_dates_filter_service(
     services: QuerySet,
@@ -93,6 +138,24 @@ def test_dates_filter_service(
     request.end_datetime = today.shift(weekday=4, hours=14)
     assert handler.handle(request, services).count() > 1
 
+    # the slots end at 14:00
+    request.start_datetime = today.shift(weekday=4, hours=13, minutes=30)
+    request.end_datetime = today.shift(weekday=4, hours=14)
+    assert handler.handle(request, services).count() == 0
+
+    # the starts are aligned to the slots starts by the booking interval
+    request.start_datetime = today.shift(weekday=4, hours=12, minutes=50)
+    request.end_datetime = today.shift(weekday=4, hours=12, minutes=55)
+    assert handler.handle(request, services).count() == 0
+
+    request.end_datetime = today.shift(weekday=4, hours=13)
+    assert handler.handle(request, services).count() > 1
+
+    request.start_datetime = today.shift(weekday=4, hours=10)
+    request.end_datetime = today.shift(weekday=4, hours=14)
+    services.update(duration=300)
+    assert handler.handle(request, services).count() == 0
+
 
 def test_price_filter(services: QuerySet):
     """Should filter the query."""
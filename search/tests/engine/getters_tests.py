@@ -1,4 +1,5 @@
 """The search engine getters tests module."""
+import arrow
 import pytest
 from django.db.models.query import QuerySet
 from pytest_mock import MockFixture
@@ -19,7 +20,7 @@ def test_getter_get_filters():
         current_filter = current_filter._next_handler
         count += 1
 
-    assert count == 24
+    assert count == 25
 
 
 def test_getter_get_base_query(services: QuerySet):
@@ -49,3 +50,26 @@ def test_getter_get_query(
     country = mocker.patch("search.engine.filters.PriceHandler.handle")
     assert getter.get_query(request)
     country.assert_called_once()
+
+
+def test_getter_get_query_ordering(services: QuerySet):
+    """Must order the query by the availability stats."""
+    first, second = services.filter(is_enabled=True)[:2]
+    services.filter(pk=first.pk).update(
+        next_available_at=arrow.utcnow().shift(days=1).datetime,
+        available_minutes=60,
+    )
+    services.filter(pk=second.pk).update(
+        next_available_at=arrow.utcnow().shift(hours=1).datetime,
+        available_minutes=30,
+    )
+    request = SearchRequest()
+    getter = ServiceSearchGetter()
+
+    request.ordering = request.ORDERING_NEXT_AVAILABLE_AT
+    result = list(getter.get_query(request))
+    assert result[:2] == [second, first]
+
+    request.ordering = request.ORDERING_AVAILABLE_MINUTES
+    result = list(getter.get_query(request))
+    assert result[:2] == [first, second]
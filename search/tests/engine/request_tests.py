@@ -16,7 +16,8 @@ from rest_framework.request import Request
 from search.engine.request import (HTTPToSearchLocationRequestConverter,
                                    HTTPToSearchProfessionalRequestConverter,
                                    HTTPToSearchRequestConverter,
-                                   HTTPToSearchServiceRequestConverter)
+                                   HTTPToSearchServiceRequestConverter,
+                                   SearchRequest)
 
 pytestmark = pytest.mark.django_db
 
@@ -320,6 +321,24 @@ def test_http_search_request_converter_set_page():
     assert converter.search_request.page == 1
 
 
+def test_http_search_request_converter_set_ordering():
+    """Should set the ordering."""
+    request = HttpRequest()
+    request.GET[HTTPToSearchRequestConverter.ORDERING_PARAM] = "invalid"
+    converter = HTTPToSearchRequestConverter(Request(request))
+    converter._set_ordering()
+
+    assert converter.search_request.ordering is None
+
+    request.GET[HTTPToSearchRequestConverter.ORDERING_PARAM] = \
+        "next_available_at"
+    converter = HTTPToSearchRequestConverter(Request(request))
+    converter._set_ordering()
+
+    assert converter.search_request.ordering == \
+        SearchRequest.ORDERING_NEXT_AVAILABLE_AT
+
+
 def test_http_search_request_converter_set_datetime():
     """Should set the datetime."""
     timezone.deactivate()
@@ -31,6 +31,25 @@ class ServiceFilterSet(filters.FilterSet):
         fields = ("professional", "is_enabled", "is_base_schedule")
 
 
+class ServiceListFilterSet(filters.FilterSet):
+    """The filter class for the service list viewset class."""
+
+    available_before = filters.IsoDateTimeFilter(
+        field_name="next_available_at",
+        lookup_expr="lte",
+    )
+    min_available_minutes = filters.NumberFilter(
+        field_name="available_minutes",
+        lookup_expr="gte",
+    )
+
+    class Meta:
+        """The metainformation."""
+
+        model = Service
+        fields = ("professional", "is_enabled")
+
+
 class ServicePhotoFilterSet(filters.FilterSet):
     """The filter class for the service photo viewset class."""
 
@@ -0,0 +1,23 @@
+"""Add the availability stats fields to the services."""
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('services', '0013_auto_20201223_0926'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='available_minutes',
+            field=models.PositiveIntegerField(db_index=True, default=0, editable=False, help_text='the available minutes in the upcoming days', verbose_name='available minutes'),
+        ),
+        migrations.AddField(
+            model_name='service',
+            name='next_available_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='the start of the nearest availability', null=True, verbose_name='next available at'),
+        ),
+    ]
@@ -87,6 +87,21 @@ class Service(CommonInfo):
         verbose_name=_("is enabled?"),
         db_index=True,
     )
+    next_available_at = models.DateTimeField(
+        _("next available at"),
+        null=True,
+        blank=True,
+        editable=False,
+        db_index=True,
+        help_text=_("the start of the nearest availability"),
+    )
+    available_minutes = models.PositiveIntegerField(
+        _("available minutes"),
+        default=0,
+        editable=False,
+        db_index=True,
+        help_text=_("the available minutes in the upcoming days"),
+    )
 
     def __str__(self) -> str:
         """Return the string representation."""
@@ -133,8 +133,10 @@ class ServiceListSerializer(serializers.ModelSerializer):
         fields = ("id", "professional", "name", "description", "duration",
                   "booking_interval", "service_type", "is_base_schedule",
                   "is_auto_order_confirmation", "is_enabled", "price", "tags",
-                  "locations", "created", "modified")
-        read_only_fields = ("created", "modified")
+                  "locations", "next_available_at", "available_minutes",
+                  "created", "modified")
+        read_only_fields = ("next_available_at", "available_minutes",
+                            "created", "modified")
 
 
 class ServiceLocationSerializer(ModelCleanFieldsSerializer):
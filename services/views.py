@@ -7,8 +7,8 @@ from rest_framework_extensions.cache.mixins import CacheResponseMixin
 from d8b.viewsets import AllowAnyViewSetMixin
 
 from .filtersets import (PriceFilterSet, ServiceFilterSet,
-                         ServiceLocationFilterSet, ServicePhotoFilterSet,
-                         ServiceTagFilterSet)
+                         ServiceListFilterSet, ServiceLocationFilterSet,
+                         ServicePhotoFilterSet, ServiceTagFilterSet)
 from .models import Price, Service, ServiceLocation, ServicePhoto, ServiceTag
 from .serializers import (PriceSerializer, RateSerializer,
                           ServiceListSerializer, ServiceLocationSerializer,
@@ -37,7 +37,7 @@ class ServiceListViewSet(
     serializer_class = ServiceListSerializer
     queryset = Service.objects.get_extended_list()
     search_fields = ("=id", "name", "description")
-    filterset_fields = ("professional", "is_enabled")
+    filterset_class = ServiceListFilterSet
 
 
 class PriceViewSet(viewsets.ModelViewSet):
@@ -65,6 +65,7 @@ setup(
         "psycopg2==2.8.6",
         "python-memcached==1.59",
         "Pillow==7.2.0",
+        "numpy==1.19.4",
         "pytz==2020.1",
         "translate==3.5.0",
     ],
@@ -18,9 +18,9 @@ from schedule.models import (AvailabilitySlot, ProfessionalClosedPeriod,
 @pytest.fixture
 def disable_slots_signals(mocker: MockerFixture):
     """Disable the slots signals."""
-    mocker.patch("orders.signals.generate_for_order")
-    mocker.patch("schedule.signals.generate_for_service")
-    mocker.patch("schedule.signals.generate_for_professional")
+    mocker.patch("orders.signals.defer_for_order")
+    mocker.patch("schedule.signals.defer_for_service")
+    mocker.patch("schedule.signals.defer_for_professional")
 
 
 @pytest.fixture